@@ -2,7 +2,12 @@
 pytest configuration and global fixtures for Selenium E2E tests.
 
 This file provides shared fixtures that are available to all tests:
-- driver: Selenium WebDriver with extension loaded
+- driver: Selenium WebDriver with extension loaded (pooled per session)
+- driver_pool: Session-scoped pool that recycles Chrome between tests
+- mock_server: Local HTTPS server behind the mocked hosts
+- mock_platform: Local mock of the AI platforms (chatgpt.com, ...)
+- auth_mode: 'seeded' (default) or 'oauth' sign-in for the mandatory flow
+- profiles: Synthetic alias profiles loaded into the service worker
 - extension_path: Path to the built extension
 - test_profile_data: Standard test profile data
 - test_credentials: Test user credentials
@@ -22,9 +27,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 load_dotenv(Path(__file__).parent.parent.parent / '.env.test.local')
 
 # Import helpers
+from helpers.durations import DurationHistory
 from helpers.selenium_driver import ChromeDriverManager
+from helpers.worker_context import WorkerContext
 # from helpers.extension_helper import ExtensionHelper
 
+# Duration history of this process (see pytest_configure)
+duration_history = None
+
 
 @pytest.fixture(scope='session')
 def extension_path():
@@ -113,70 +123,528 @@ def test_messages():
     }
 
 
+@pytest.fixture(scope='session')
+def extension_id(extension_path):
+    """
+    ID of the loaded extension (needed to open extension pages).
+
+    Computed from the manifest key or the dist/ path the same way Chrome
+    derives it, so it is correct on every machine and xdist worker.
+
+    Returns:
+        str: Extension ID
+    """
+    from helpers.extension_id import ExtensionId
+
+    return ExtensionId.for_path(extension_path)
+
+
+def pytest_addoption(parser):
+    """
+    Register command-line options for the E2E suite.
+    """
+    parser.addoption(
+        '--live-platforms',
+        action='store_true',
+        default=False,
+        help='Run against the real AI platforms instead of the local mock server'
+    )
+    parser.addoption(
+        '--auth-mode',
+        choices=['seeded', 'oauth'],
+        default='seeded',
+        help='How the mandatory flow signs in: seeded Firebase session '
+             '(default, no network) or interactive Google OAuth'
+    )
+    parser.addoption(
+        '--display-mode',
+        choices=['headed', 'headless', 'xvfb'],
+        default='headed',
+        help='Where Chrome renders: the desktop (default), --headless=new, '
+             'or a per-worker Xvfb display (Linux runners)'
+    )
+    parser.addoption(
+        '--profile-webdriver',
+        action='store_true',
+        default=False,
+        help='Count and time every WebDriver command and report the top '
+             'commands and calling page-object methods at session end'
+    )
+    parser.addoption(
+        '--profile-webdriver-top',
+        type=int,
+        default=15,
+        help='Rows per table in the WebDriver profile report (default: 15)'
+    )
+    parser.addoption(
+        '--run-performance',
+        action='store_true',
+        default=False,
+        help='Run the in-browser performance benchmarks (tests/11_performance)'
+    )
+    parser.addoption(
+        '--artifact-level',
+        choices=['none', 'failure', 'step'],
+        default='failure',
+        help='Screenshots to keep: none, failure screenshots only (default), '
+             'or also the per-step screenshots tests take'
+    )
+    parser.addoption(
+        '--artifact-budget-mb',
+        type=float,
+        default=200,
+        help='Total size of step screenshots per run in MB, split across '
+             'workers (default: 200; failure screenshots are always kept)'
+    )
+    parser.addoption(
+        '--durations-file',
+        default=None,
+        help='Per-test duration history used to order tests '
+             '(default: reports/durations.json; persist it between CI runs)'
+    )
+    parser.addoption(
+        '--no-duration-order',
+        action='store_true',
+        default=False,
+        help='Keep collection order (smoke tests first) instead of ordering '
+             'by duration history'
+    )
+    parser.addoption(
+        '--no-console-log',
+        action='store_true',
+        default=False,
+        help='Don\'t collect page and content-script console output '
+             '(attached to the report when a test fails)'
+    )
+    parser.addoption(
+        '--console-log-worker',
+        action='store_true',
+        default=False,
+        help='Also collect the extension service worker\'s console (keeps the '
+             'worker from being suspended for the whole run)'
+    )
+    parser.addoption(
+        '--cpu-profile',
+        action='store_true',
+        default=False,
+        help='Sample the extension service worker\'s CPU during performance '
+             'tests and save .cpuprofile files (reports/cpuprofiles)'
+    )
+    parser.addoption(
+        '--run-soak',
+        action='store_true',
+        default=False,
+        help='Run the long-session memory soak tests (tests/12_soak)'
+    )
+    parser.addoption(
+        '--soak-duration',
+        type=float,
+        default=600,
+        help='Seconds each soak test sends prompts for (default: 600)'
+    )
+    parser.addoption(
+        '--soak-interval',
+        type=float,
+        default=15,
+        help='Seconds between heap samples during a soak (default: 15)'
+    )
+    parser.addoption(
+        '--soak-budget-kb',
+        type=float,
+        default=256,
+        help='Retained heap growth allowed per 1000 prompts, per target, '
+             'in KB (default: 256)'
+    )
+    parser.addoption(
+        '--no-profile-snapshot',
+        action='store_true',
+        default=False,
+        help='Launch Chrome with an empty profile instead of a clone of the '
+             'signed-in golden profile'
+    )
+
+
+@pytest.fixture(scope='session')
+def auth_mode(request):
+    """
+    Sign-in mode for the mandatory flow.
+
+    Returns:
+        str: 'seeded' or 'oauth' (from --auth-mode)
+    """
+    return request.config.getoption('auth_mode')
+
+
+@pytest.fixture(scope='session')
+def virtual_display(request):
+    """
+    Per-worker Xvfb display (only with --display-mode=xvfb).
+
+    Started before the first Chrome launch so the browser and PyAutoGUI
+    both render into this worker's own screen.
+
+    Yields:
+        VirtualDisplay, or None in headed/headless mode
+    """
+    if request.config.getoption('display_mode') != 'xvfb':
+        yield None
+        return
+
+    from helpers.virtual_display import VirtualDisplay
+
+    display = VirtualDisplay().start()
+
+    yield display
+
+    display.stop()
+
+
+@pytest.fixture(scope='session')
+def mock_server(request, auth_mode):
+    """
+    Local HTTPS server behind the mocked hosts (one per pytest worker).
+
+    Serves the AI platforms (unless --live-platforms) and, in seeded auth
+    mode, the Firebase Auth endpoints that validate the seeded user.
+
+    Yields:
+        MockPlatformServer, or None when nothing is mocked
+    """
+    from helpers.mock_platform import MockPlatformServer
+    from helpers.auth_seeder import AuthSeeder
+
+    hosts = []
+    if not request.config.getoption('live_platforms'):
+        hosts += MockPlatformServer.DEFAULT_HOSTS
+    if auth_mode == 'seeded':
+        hosts += AuthSeeder.HOSTS
+
+    if not hosts:
+        yield None
+        return
+
+    server = MockPlatformServer(hosts=hosts)
+    if auth_mode == 'seeded':
+        AuthSeeder.install(server)
+    server.start()
+
+    yield server
+
+    server.stop()
+
+
+@pytest.fixture(scope='session')
+def mock_platform(request, mock_server):
+    """
+    Local mock of the AI platforms.
+
+    Chrome maps chatgpt.com to the mock server, so tests navigating to
+    https://chatgpt.com get the mock chat UI and every request body is
+    recorded. Disabled with --live-platforms.
+
+    Returns:
+        MockPlatformServer, or None when running against live platforms
+    """
+    if request.config.getoption('live_platforms'):
+        return None
+    return mock_server
+
+
+@pytest.fixture
+def heap_soak(request, driver, extension_id, mock_platform):
+    """
+    Memory soak on the mock chat page.
+
+    Configured by --soak-duration and --soak-interval. Call
+    heap_soak.run(prompts) to send prompts for the whole duration while
+    sampling the page and service-worker heaps; the CDP sessions are
+    detached afterwards.
+
+    Yields:
+        HeapSoak (skips the test with --live-platforms)
+    """
+    from helpers.heap_soak import HeapSoak
+
+    if mock_platform is None:
+        pytest.skip("Soak tests need the mock platform (not --live-platforms)")
+
+    soak = HeapSoak(
+        driver, extension_id,
+        duration=request.config.getoption('soak_duration'),
+        interval=request.config.getoption('soak_interval'),
+        server=mock_platform,
+    )
+    yield soak
+    soak.close()
+
+
+@pytest.fixture
+def profiles(driver, extension_id):
+    """
+    Synthetic alias profiles loaded into the service worker.
+
+    Shared by the performance benchmarks and the soak tests.
+
+    Returns:
+        list: The loaded profiles (SyntheticCorpus(seed=1), 10 profiles)
+    """
+    from helpers.benchmark import InBrowserBenchmark
+    from helpers.synthetic import SyntheticCorpus
+
+    profiles = SyntheticCorpus(seed=1).profiles(10)
+    InBrowserBenchmark(driver, extension_id).load_profiles(profiles)
+    return profiles
+
+
+@pytest.fixture(scope='session')
+def profile_snapshot(request, extension_path, extension_id, auth_mode, mock_server, virtual_display):
+    """
+    Golden signed-in Chrome profile, built once per dist/ build.
+
+    The first worker to need it launches Chrome, completes sign-in and
+    decryption, and saves the user-data-dir; every launch afterwards
+    starts from a clone. Only used with seeded auth and a known extension
+    ID; disabled with --no-profile-snapshot.
+
+    Returns:
+        ProfileSnapshot, or None when Chrome starts from an empty profile
+    """
+    if request.config.getoption('no_profile_snapshot') or auth_mode != 'seeded' or not extension_id:
+        return None
+
+    from helpers.auth_seeder import AuthSeeder
+    from helpers.profile_snapshot import ProfileSnapshot
+    from helpers.test_harness import TestHarness
+
+    extra_arguments = mock_server.chrome_arguments() if mock_server else []
+
+    def build(user_data_dir):
+        driver = ChromeDriverManager.get_driver(
+            extension_path, user_data_dir=str(user_data_dir), extra_arguments=extra_arguments
+        )
+        try:
+            harness = TestHarness(driver, auth_mode='seeded')
+            harness.open_popup_page(extension_id)
+            harness.sign_in()
+            harness.wait_for_firebase_decryption()
+            if not harness.verify_protected_status():
+                raise RuntimeError("Golden profile is not signed in")
+        finally:
+            driver.quit()
+
+    snapshot = ProfileSnapshot(extension_path, identity=f'seeded:{AuthSeeder.TEST_USER_UID}')
+    snapshot.ensure(build)
+    return snapshot
+
+
+@pytest.fixture(scope='session')
+def driver_pool(extension_path, extension_id, mock_server, profile_snapshot, virtual_display):
+    """
+    Session-scoped WebDriver pool (one Chrome per pytest worker).
+
+    Chrome is launched once and recycled between tests; extension state
+    is reset after every test instead of relaunching the browser. With a
+    profile snapshot every launch starts signed in and the Firebase
+    session is kept across resets.
+
+    Args:
+        extension_path: Path to extension (from session fixture)
+        extension_id: Extension ID (from session fixture)
+        mock_server: Mock server for platform/auth hosts (may be None)
+        profile_snapshot: Golden signed-in profile (may be None)
+        virtual_display: Xvfb display Chrome renders into (may be None)
+
+    Yields:
+        DriverPool: Pool shared by all tests in the session
+    """
+    from helpers.driver_pool import DriverPool
+
+    extra_arguments = mock_server.chrome_arguments() if mock_server else []
+
+    def launch():
+        user_data_dir = profile_snapshot.clone() if profile_snapshot else None
+        return ChromeDriverManager.get_driver(
+            extension_path, user_data_dir=user_data_dir, extra_arguments=extra_arguments
+        )
+
+    pool = DriverPool(
+        extension_path,
+        extension_id,
+        driver_factory=launch,
+        keep_auth=profile_snapshot is not None
+    )
+
+    yield pool
+
+    pool.close()
+
+
 @pytest.fixture(scope='function')
-def driver(extension_path):
+def driver(request, driver_pool):
     """
     Selenium WebDriver with extension loaded.
 
     This fixture:
-    1. Creates a Chrome driver
-    2. Loads the extension
-    3. Yields the driver to the test
-    4. Quits the driver after the test
+    1. Takes the pooled Chrome driver (launching it on first use)
+    2. Yields the driver to the test
+    3. Resets extension state (chrome.storage, windows, popup) after the test
+
+    Tests marked with @pytest.mark.fresh_browser get a newly launched
+    Chrome that is quit afterwards.
 
     Args:
-        extension_path: Path to extension (from session fixture)
+        request: pytest request (for markers)
+        driver_pool: Session driver pool
 
     Yields:
         WebDriver: Configured Chrome driver
     """
-    # Import here to avoid circular imports
-    from helpers.selenium_driver import ChromeDriverManager
+    fresh = request.node.get_closest_marker('fresh_browser') is not None
 
-    driver = ChromeDriverManager.get_driver(extension_path)
+    if fresh:
+        driver_pool.discard()
+
+    driver = driver_pool.acquire()
 
     yield driver
 
     # Cleanup
-    try:
-        driver.quit()
-    except Exception as e:
-        print(f"Warning: Error quitting driver: {e}")
+    if fresh:
+        driver_pool.discard()
+    else:
+        driver_pool.release(driver)
+
+
+@pytest.fixture(autouse=True)
+def step_timings(request):
+    """
+    Record TestHarness/BasePage step timings for every test.
+
+    Records are appended to reports/timings/<worker>.jsonl; a per-test
+    summary table is attached to the Allure report.
+    """
+    from helpers.timing import StepTimer
+
+    StepTimer.begin(request.node.nodeid)
+
+    yield
+
+    records = StepTimer.end()
+    if records:
+        allure.attach(
+            StepTimer.summarize(records),
+            name='step_timings',
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture(autouse=True)
+def artifacts(request):
+    """
+    Collect the test's screenshots and attach them when it ends.
+
+    Screenshots are written by ArtifactWriter's background thread; this
+    waits for them and attaches them to the Allure report.
+    """
+    from helpers.artifact_writer import ArtifactWriter
+
+    ArtifactWriter.begin(request.node.name)
+
+    yield
+
+    ArtifactWriter.flush()
+
+
+@pytest.fixture(autouse=True)
+def console_log(request):
+    """
+    Collect browser console output for the test (in memory only).
+
+    The driver's ConsoleLog ring buffer is cleared before the test; the
+    report hook attaches it if the test fails. Performance and soak tests
+    run without collection so it doesn't skew their numbers.
+    """
+    if request.config.getoption('no_console_log') or 'driver' not in request.fixturenames:
+        yield
+        return
+
+    from helpers.console_log import ConsoleLog
+
+    driver = request.getfixturevalue('driver')
+    if 'performance' in request.keywords or 'soak' in request.keywords:
+        ConsoleLog.stop(driver)
+    else:
+        log = ConsoleLog.for_driver(driver, worker=request.config.getoption('console_log_worker'))
+        if log is not None:
+            log.clear()
+
+    yield
+
+
+@pytest.fixture(autouse=True)
+def cpu_profile(request):
+    """
+    Profile the service worker during performance tests (--cpu-profile).
+
+    The V8 sampling profiler runs in the extension service worker for the
+    whole test; the .cpuprofile and a top-functions-by-self-time table are
+    saved to reports/cpuprofiles/ and attached to the Allure report.
+    """
+    if (not request.config.getoption('cpu_profile')
+            or 'performance' not in request.keywords
+            or 'driver' not in request.fixturenames):
+        yield
+        return
+
+    from helpers.cpu_profiler import ServiceWorkerProfiler
+    from helpers.extension_state import ExtensionState
+
+    driver = request.getfixturevalue('driver')
+    extension_id = request.getfixturevalue('extension_id')
+
+    # An extension page wakes the service worker if Chrome stopped it
+    driver.get(ExtensionState(driver, extension_id).popup_url)
+    profiler = ServiceWorkerProfiler(driver, extension_id)
+    profiler.start()
+
+    yield
+
+    profile = profiler.stop()
+    path = ServiceWorkerProfiler.save(request.node.nodeid, profile)
+    allure.attach.file(str(path), name='service_worker.cpuprofile', extension='cpuprofile')
+    allure.attach(
+        ServiceWorkerProfiler.format_top(ServiceWorkerProfiler.top_functions(profile)),
+        name='service_worker_top_functions',
+        attachment_type=allure.attachment_type.TEXT
+    )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook to attach screenshots to Allure reports on test failure.
+    Hook to capture a screenshot and the browser console when a test fails.
 
-    This automatically captures a screenshot when a test fails
-    and attaches it to the Allure report.
+    The screenshot is taken once and handed to ArtifactWriter, which saves
+    it and attaches it to the Allure report at the end of the test
+    (--artifact-level none turns this off). The console ring buffer is
+    attached as text.
     """
     outcome = yield
     report = outcome.get_result()
 
     if report.when == 'call' and report.failed:
-        # Get the driver from the test
+        # One capture: written to reports/screenshots/ off-thread and
+        # attached when the test's artifacts are flushed
         if 'driver' in item.funcargs:
+            from helpers.artifact_writer import ArtifactWriter
+            from helpers.console_log import ConsoleLog
             driver = item.funcargs['driver']
-            try:
-                # Take screenshot
-                screenshot = driver.get_screenshot_as_png()
-
-                # Attach to Allure
-                allure.attach(
-                    screenshot,
-                    name=f'failure_{item.name}',
-                    attachment_type=allure.attachment_type.PNG
-                )
+            ArtifactWriter.capture(driver, 'failure', kind='failure')
 
-                # Also save to file
-                screenshot_path = Path(__file__).parent / 'reports' / 'screenshots' / f'{item.name}_failure.png'
-                screenshot_path.parent.mkdir(parents=True, exist_ok=True)
-                driver.save_screenshot(str(screenshot_path))
-
-            except Exception as e:
-                print(f"Warning: Could not capture screenshot: {e}")
+            # Console output leading up to the failure
+            log = ConsoleLog.running(driver)
+            if log is not None:
+                log.attach()
 
 
 def pytest_configure(config):
@@ -191,12 +659,64 @@ def pytest_configure(config):
         "substitution": "PII substitution tests (CORE)",
         "critical": "Critical path tests (P0 - must pass)",
         "important": "Important tests (P1)",
-        "nice_to_have": "Nice to have tests (P2)"
+        "nice_to_have": "Nice to have tests (P2)",
+        "fresh_browser": "Test needs a newly launched Chrome (not the pooled one)",
+        "oauth": "Interactive Google OAuth tests (run with --auth-mode=oauth)",
+        "performance": "In-browser performance benchmarks (run with --run-performance)",
+        "soak": "Long-session memory soak tests (run with --run-soak)",
+        "helpers": "Browser-free tests of the suite's own helpers"
     }
 
     for marker, description in markers.items():
         config.addinivalue_line("markers", f"{marker}: {description}")
 
+    # TestHarness picks the sign-in mode up from the environment
+    os.environ['E2E_AUTH_MODE'] = config.getoption('auth_mode')
+
+    # ChromeDriverManager picks the display mode up from the environment
+    os.environ['E2E_DISPLAY_MODE'] = config.getoption('display_mode')
+
+    # Duration history: orders the collection (every process) and is
+    # updated from the reports the controller receives
+    global duration_history
+    duration_history = DurationHistory(config.getoption('durations_file'))
+
+    # ArtifactWriter picks the artifact level and budget up from the environment
+    os.environ['E2E_ARTIFACT_LEVEL'] = config.getoption('artifact_level')
+    os.environ['E2E_ARTIFACT_BUDGET_MB'] = str(config.getoption('artifact_budget_mb'))
+
+    # Fresh benchmark results for a performance run
+    if config.getoption('run_performance') and not hasattr(config, 'workerinput'):
+        from helpers.benchmark import InBrowserBenchmark
+        from helpers.fetch_benchmark import FetchOverheadBenchmark
+        from helpers.stream_benchmark import StreamLatencyBenchmark
+        from helpers.websocket_benchmark import WebSocketBenchmark
+        from helpers.xhr_benchmark import GeminiXHRBenchmark
+        InBrowserBenchmark.clear_saved()
+        FetchOverheadBenchmark.clear_saved()
+        StreamLatencyBenchmark.clear_saved()
+        WebSocketBenchmark.clear_saved()
+        GeminiXHRBenchmark.clear_saved()
+
+    # Fresh service-worker CPU profiles
+    if config.getoption('cpu_profile') and not hasattr(config, 'workerinput'):
+        from helpers.cpu_profiler import ServiceWorkerProfiler
+        ServiceWorkerProfiler.clear_saved()
+
+    # ChromeDriverManager wraps new drivers with the command profiler
+    if config.getoption('profile_webdriver'):
+        os.environ['E2E_PROFILE_WEBDRIVER'] = '1'
+        if not hasattr(config, 'workerinput'):
+            from helpers.command_profiler import CommandProfiler
+            CommandProfiler.clear_saved()
+
+    # Parallel mode: each xdist worker writes its own log file
+    # (allure-results are uuid-named and pytest-html is written by the
+    # controller only, so those merge without per-worker handling)
+    log_file = config.getoption('log_file') or config.getini('log_file')
+    if log_file:
+        config.option.log_file = WorkerContext.log_file(log_file)
+
 
 def pytest_collection_modifyitems(config, items):
     """
@@ -207,7 +727,154 @@ def pytest_collection_modifyitems(config, items):
     - Add markers dynamically
     - Reorder tests
     """
-    # Example: Run smoke tests first
-    smoke_tests = [item for item in items if 'smoke' in item.keywords]
-    other_tests = [item for item in items if 'smoke' not in item.keywords]
-    items[:] = smoke_tests + other_tests
+    # Interactive OAuth tests are opt-in
+    if config.getoption('auth_mode') != 'oauth':
+        skip_oauth = pytest.mark.skip(reason="Interactive OAuth test (run with --auth-mode=oauth)")
+        for item in items:
+            if 'oauth' in item.keywords:
+                item.add_marker(skip_oauth)
+
+    # Performance benchmarks are opt-in (slow, results only meaningful on quiet machines)
+    if not config.getoption('run_performance'):
+        skip_performance = pytest.mark.skip(reason="Performance benchmark (run with --run-performance)")
+        for item in items:
+            if 'performance' in item.keywords:
+                item.add_marker(skip_performance)
+
+    # Soak tests are opt-in (they run for --soak-duration each)
+    if not config.getoption('run_soak'):
+        skip_soak = pytest.mark.skip(reason="Memory soak test (run with --run-soak)")
+        for item in items:
+            if 'soak' in item.keywords:
+                item.add_marker(skip_soak)
+
+    if config.getoption('no_duration_order'):
+        # Collection order, smoke tests first
+        smoke_tests = [item for item in items if 'smoke' in item.keywords]
+        other_tests = [item for item in items if 'smoke' not in item.keywords]
+        items[:] = smoke_tests + other_tests
+        return
+
+    # Smoke, then critical, then everything else; longest expected first
+    items[:] = duration_history.order(items)
+    if not hasattr(config, 'workerinput'):
+        unknown = sum(1 for item in items if item.nodeid not in duration_history.durations)
+        print(f"\n[Schedule] {len(items)} tests by duration history: "
+              f"~{duration_history.predicted_total(items) / 60:.1f} min in total, {unknown} without "
+              f"history (estimated {duration_history.unknown_estimate():.0f} s each)")
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    Hand the duration-ordered collection to workers longest first
+    (--dist load; other modes and --no-duration-order keep xdist's own).
+    """
+    if config.getoption('no_duration_order') or config.getvalue('dist') != 'load':
+        return None
+    from helpers.duration_scheduler import DurationScheduling
+    return DurationScheduling(config, log)
+
+
+def pytest_runtest_logreport(report):
+    """
+    Collect test durations for the history (controller only; under xdist
+    the workers' reports arrive here too).
+    """
+    if duration_history is not None and WorkerContext.is_controller():
+        duration_history.record(report)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Close console collectors, finish writing screenshots, save this
+    process's WebDriver command profile (one file per worker) and update
+    the duration history (controller only).
+    """
+    from helpers.artifact_writer import ArtifactWriter
+    from helpers.console_log import ConsoleLog
+
+    ConsoleLog.close_all()
+
+    if duration_history is not None and WorkerContext.is_controller():
+        updated = duration_history.save()
+        if updated:
+            print(f"\n[Schedule] Duration history updated for {updated} test(s): {duration_history.path}")
+
+    stats = ArtifactWriter.shutdown()
+    if any(stats.values()):
+        print(f"\n[Artifacts] {stats['written']} screenshot(s), {stats['bytes'] / 1024 / 1024:.1f} MB; "
+              f"{stats['duplicates']} duplicate(s) and {stats['dropped']} over budget skipped")
+
+    if session.config.getoption('profile_webdriver'):
+        from helpers.command_profiler import CommandProfiler
+        CommandProfiler.save()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Print the merged WebDriver command profile (--profile-webdriver),
+    benchmark results (--run-performance) and service-worker CPU hot spots
+    (--cpu-profile).
+    """
+    if hasattr(config, 'workerinput'):
+        return
+
+    if config.getoption('profile_webdriver'):
+        from helpers.command_profiler import CommandProfiler
+
+        data = CommandProfiler.load_all()
+        if data['commands']:
+            terminalreporter.section('WebDriver command profile')
+            for line in CommandProfiler.report(data, top=config.getoption('profile_webdriver_top')):
+                terminalreporter.write_line(line)
+
+    if config.getoption('run_performance'):
+        from helpers.benchmark import InBrowserBenchmark
+
+        records = InBrowserBenchmark.load_all()
+        if records:
+            terminalreporter.section('In-browser benchmarks')
+            for line in InBrowserBenchmark.report(records):
+                terminalreporter.write_line(line)
+
+        from helpers.fetch_benchmark import FetchOverheadBenchmark
+
+        records = FetchOverheadBenchmark.load_all()
+        if records:
+            terminalreporter.section('Fetch interception overhead')
+            for line in FetchOverheadBenchmark.report(records):
+                terminalreporter.write_line(line)
+
+        from helpers.stream_benchmark import StreamLatencyBenchmark
+
+        records = StreamLatencyBenchmark.load_all()
+        if records:
+            terminalreporter.section('Streaming latency (native -> wrapped)')
+            for line in StreamLatencyBenchmark.report(records):
+                terminalreporter.write_line(line)
+
+        from helpers.websocket_benchmark import WebSocketBenchmark
+
+        records = WebSocketBenchmark.load_all()
+        if records:
+            terminalreporter.section('Copilot WebSocket interception')
+            for line in WebSocketBenchmark.report(records):
+                terminalreporter.write_line(line)
+
+        from helpers.xhr_benchmark import GeminiXHRBenchmark
+
+        records = GeminiXHRBenchmark.load_all()
+        if records:
+            terminalreporter.section('Gemini XHR interception')
+            for line in GeminiXHRBenchmark.report(records):
+                terminalreporter.write_line(line)
+
+    if config.getoption('cpu_profile'):
+        from helpers.cpu_profiler import ServiceWorkerProfiler
+
+        rows = ServiceWorkerProfiler.load_all()
+        if rows:
+            terminalreporter.section('Service worker CPU (self time, all profiled tests)')
+            for line in ServiceWorkerProfiler.format_top(rows[:ServiceWorkerProfiler.TOP]).splitlines():
+                terminalreporter.write_line(line)
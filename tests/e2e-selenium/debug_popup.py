@@ -2,15 +2,10 @@
 Quick debug script to open popup and take screenshot.
 """
 import time
-import os
 from pathlib import Path
-from dotenv import load_dotenv
+from helpers.extension_id import ExtensionId
 from helpers.selenium_driver import ChromeDriverManager
 
-# Load .env
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
-
 # Get extension path
 extension_path = str(Path(__file__).parent.parent.parent / 'dist')
 
@@ -18,8 +13,8 @@ print("Creating driver...")
 driver = ChromeDriverManager.get_driver(extension_path)
 
 try:
-    # Get extension ID
-    extension_id = os.getenv('EXTENSION_ID')
+    # Get extension ID (derived from the dist/ path)
+    extension_id = ExtensionId.for_path(extension_path)
     print(f"Extension ID: {extension_id}")
 
     # Open popup
@@ -2,12 +2,52 @@
 Helpers package for Selenium E2E tests.
 
 This package provides reusable utilities for:
-- Selenium WebDriver management
-- Extension icon clicking (PyAutoGUI)
+- Selenium WebDriver management and extension ID resolution
+- WebDriver pooling, extension state reset and profile snapshots
+- Event-driven readiness waits and the explicit-wait policy
+- Per-step timing records, WebDriver command profiling, screenshot artifacts
+  and browser console capture
+- Mock AI platforms, seeded Firebase sign-in and bulk profile seeding
+- Extension icon clicking (PyAutoGUI) and virtual displays
+- Synthetic corpora, benchmark statistics and in-browser benchmarks
+- CDP sessions (page and service worker), memory soaks and CPU profiles
+- Duration history for test scheduling
 - Common test operations
 """
 
 from .selenium_driver import ChromeDriverManager
+from .extension_id import ExtensionId
 from .extension_helper import ExtensionHelper
+from .extension_state import ExtensionState
+from .driver_pool import DriverPool
+from .readiness import Readiness
+from .wait_policy import WaitPolicy
+from .timing import StepTimer
+from .command_profiler import CommandProfiler
+from .mock_platform import MockPlatformServer
+from .auth_seeder import AuthSeeder
+from .profile_seeder import ProfileSeeder
+from .profile_snapshot import ProfileSnapshot
+from .virtual_display import VirtualDisplay
+from .synthetic import SyntheticCorpus
+from .stats import Stats
+from .benchmark_store import BenchmarkStore
+from .benchmark import InBrowserBenchmark
+from .fetch_benchmark import FetchOverheadBenchmark
+from .stream_benchmark import StreamLatencyBenchmark
+from .websocket_benchmark import WebSocketBenchmark
+from .xhr_benchmark import GeminiXHRBenchmark
+from .cdp import CDPSession
+from .heap_soak import HeapSoak
+from .cpu_profiler import ServiceWorkerProfiler
+from .artifact_writer import ArtifactWriter
+from .console_log import ConsoleLog
+from .durations import DurationHistory
 
-__all__ = ['ChromeDriverManager', 'ExtensionHelper']
+__all__ = ['ChromeDriverManager', 'ExtensionId', 'ExtensionHelper', 'ExtensionState', 'DriverPool', 'Readiness',
+           'WaitPolicy', 'StepTimer', 'CommandProfiler',
+           'MockPlatformServer', 'AuthSeeder', 'ProfileSeeder', 'ProfileSnapshot', 'VirtualDisplay',
+           'SyntheticCorpus', 'Stats', 'BenchmarkStore', 'InBrowserBenchmark', 'FetchOverheadBenchmark',
+           'StreamLatencyBenchmark', 'WebSocketBenchmark', 'GeminiXHRBenchmark',
+           'CDPSession', 'HeapSoak', 'ServiceWorkerProfiler', 'ArtifactWriter',
+           'ConsoleLog', 'DurationHistory']
@@ -0,0 +1,242 @@
+"""
+Screenshot Artifacts for PromptBlocker E2E Tests.
+
+Screenshots used to be taken and attached synchronously on the test
+thread, sometimes twice for the same failure. ArtifactWriter takes each
+screenshot once (one WebDriver round-trip, base64) and hands it to a
+background thread, which:
+- decodes it and drops frames identical to an earlier one of the same test
+- compresses it (failure: optimized PNG, full size; step: JPEG, at most
+  STEP_MAX_WIDTH wide)
+- writes it to reports/screenshots[/<worker>]/
+- stops writing step frames once the run's byte budget is used up
+
+What gets captured follows the artifact level (pytest --artifact-level,
+E2E_ARTIFACT_LEVEL):
+
+    none      nothing
+    failure   the failure screenshot only (default)
+    step      failure screenshots plus every capture(kind='step')
+
+Allure keeps attachments per thread, so the finished files are attached
+from the test thread by flush(), which the conftest fixture calls when the
+test ends.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import allure
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .worker_context import WorkerContext
+
+
+class ArtifactWriter:
+    """
+    Captures screenshots on the test thread and writes them off-thread.
+
+    Example:
+        ```python
+        ArtifactWriter.begin('test_complete_auth_lifecycle')
+        ArtifactWriter.capture(driver, 'after_mandatory_flow')          # level 'step' only
+        ArtifactWriter.capture(driver, 'failure', kind='failure')
+        ArtifactWriter.flush()                                          # attach to Allure
+        ```
+    """
+
+    LEVELS = ['none', 'failure', 'step']
+    DEFAULT_LEVEL = 'failure'
+    DEFAULT_BUDGET_MB = 200
+
+    STEP_MAX_WIDTH = 1280
+    STEP_JPEG_QUALITY = 70
+
+    FLUSH_TIMEOUT = 30
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _test: str = 'session'
+    _pending: List[Future] = []
+    _seen: Dict[str, str] = {}
+    _failure_captured = False
+    _stats = {'written': 0, 'bytes': 0, 'duplicates': 0, 'dropped': 0}
+
+    # ========================================
+    # Configuration
+    # ========================================
+
+    @classmethod
+    def level(cls) -> str:
+        """Artifact level of this run ('none', 'failure' or 'step')."""
+        level = os.getenv('E2E_ARTIFACT_LEVEL', cls.DEFAULT_LEVEL)
+        return level if level in cls.LEVELS else cls.DEFAULT_LEVEL
+
+    @classmethod
+    def enabled(cls, kind: str) -> bool:
+        """
+        Whether artifacts of a kind are captured at the current level.
+
+        Args:
+            kind: 'failure' or 'step'
+
+        Returns:
+            bool: True if capture(kind=kind) does anything
+        """
+        return cls.LEVELS.index(cls.level()) >= cls.LEVELS.index(kind)
+
+    @classmethod
+    def budget(cls) -> int:
+        """
+        This worker's share of the run's byte budget.
+
+        Returns:
+            int: Bytes (E2E_ARTIFACT_BUDGET_MB split evenly across workers)
+        """
+        megabytes = float(os.getenv('E2E_ARTIFACT_BUDGET_MB', cls.DEFAULT_BUDGET_MB))
+        return int(megabytes * 1024 * 1024 / WorkerContext.count())
+
+    # ========================================
+    # Test Lifecycle
+    # ========================================
+
+    @classmethod
+    def begin(cls, test_name: str) -> None:
+        """Start collecting artifacts for a test."""
+        cls._test = re.sub(r'[^\w.-]+', '_', test_name).strip('_')
+        cls._pending = []
+        cls._seen = {}
+        cls._failure_captured = False
+
+    @classmethod
+    def capture(cls, driver: WebDriver, name: str, kind: str = 'step') -> bool:
+        """
+        Take a screenshot now and queue it for writing.
+
+        Args:
+            driver: Selenium WebDriver instance
+            name: Artifact name (e.g. 'after_profile_creation')
+            kind: 'step' or 'failure'
+
+        Returns:
+            bool: False if the level skips this kind, the test already has
+                its failure screenshot, or the screenshot failed
+        """
+        if not cls.enabled(kind):
+            return False
+        # A test that captured its own failure state (e.g. before cleanup)
+        # doesn't get a second one from the report hook
+        if kind == 'failure':
+            if cls._failure_captured:
+                return False
+            cls._failure_captured = True
+
+        try:
+            encoded = driver.get_screenshot_as_base64()
+        except Exception as e:
+            print(f"[Artifacts] Could not capture {name}: {e}")
+            return False
+
+        if cls._executor is None:
+            # One writer thread keeps the budget and duplicate checks in order
+            cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='artifact-writer')
+        cls._pending.append(cls._executor.submit(cls._write, encoded, name, kind, cls._test, cls._seen))
+        return True
+
+    @classmethod
+    def flush(cls, timeout: float = FLUSH_TIMEOUT) -> List[Dict[str, Any]]:
+        """
+        Wait for the test's artifacts and attach them to the Allure report.
+
+        Must run on the test thread (Allure's context is per thread).
+
+        Args:
+            timeout: Seconds to wait for each pending artifact
+
+        Returns:
+            list: Per artifact: name plus path/attachment type, or
+                'duplicate_of' / 'dropped'
+        """
+        pending, cls._pending = cls._pending, []
+        results = []
+        for future in pending:
+            try:
+                result = future.result(timeout=timeout)
+            except Exception as e:
+                print(f"[Artifacts] Writing an artifact failed: {e}")
+                continue
+            results.append(result)
+            if 'path' in result:
+                allure.attach.file(result['path'], name=result['name'],
+                                   attachment_type=result['attachment_type'])
+        return results
+
+    @classmethod
+    def shutdown(cls) -> Dict[str, int]:
+        """
+        Finish writing and stop the writer thread.
+
+        Returns:
+            dict: written, bytes, duplicates and dropped counts for this worker
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+        return dict(cls._stats)
+
+    # ========================================
+    # Writer Thread
+    # ========================================
+
+    @classmethod
+    def _write(cls, encoded: str, name: str, kind: str, test: str,
+               seen: Dict[str, str]) -> Dict[str, Any]:
+        """Decode, dedupe, compress and save one screenshot (writer thread)."""
+        data = base64.b64decode(encoded)
+
+        digest = hashlib.sha1(data).hexdigest()
+        if digest in seen:
+            cls._stats['duplicates'] += 1
+            return {'name': name, 'duplicate_of': seen[digest]}
+        seen[digest] = name
+
+        if kind == 'failure':
+            output, extension, attachment_type = cls._png(data), 'png', allure.attachment_type.PNG
+        else:
+            output, extension, attachment_type = cls._jpeg(data), 'jpg', allure.attachment_type.JPG
+
+        # Failure frames are what a failed run is debugged with: never dropped
+        if kind != 'failure' and cls._stats['bytes'] + len(output) > cls.budget():
+            cls._stats['dropped'] += 1
+            return {'name': name, 'dropped': True}
+
+        path = WorkerContext.screenshots_dir() / f'{test}_{name}.{extension}'
+        path.write_bytes(output)
+        cls._stats['written'] += 1
+        cls._stats['bytes'] += len(output)
+        return {'name': name, 'path': str(path), 'attachment_type': attachment_type}
+
+    @staticmethod
+    def _png(data: bytes) -> bytes:
+        """Re-encode a PNG with maximum compression (lossless)."""
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.open(io.BytesIO(data)).save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue() if buffer.tell() < len(data) else data
+
+    @classmethod
+    def _jpeg(cls, data: bytes) -> bytes:
+        """Downscale to STEP_MAX_WIDTH and encode as JPEG."""
+        from PIL import Image
+
+        image = Image.open(io.BytesIO(data)).convert('RGB')
+        if image.width > cls.STEP_MAX_WIDTH:
+            image = image.resize((cls.STEP_MAX_WIDTH, round(image.height * cls.STEP_MAX_WIDTH / image.width)))
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=cls.STEP_JPEG_QUALITY, optimize=True)
+        return buffer.getvalue()
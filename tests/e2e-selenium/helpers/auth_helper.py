@@ -23,14 +23,16 @@ Alternate Pattern (for persistence tests):
     - Restart → Sign in → Verify profile persists from local Chrome storage
 """
 
-import time
 import os
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchWindowException
+from selenium.common.exceptions import TimeoutException
 from typing import Optional
 
+from .readiness import Readiness
+from .wait_policy import WaitPolicy
+from .worker_context import WorkerContext
+
 
 class AuthHelper:
     """
@@ -48,7 +50,8 @@ class AuthHelper:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WaitPolicy.wait(driver)
+        self.ready = Readiness(driver)
 
     def sign_in_google_oauth(self, popup_window_handle: str) -> None:
         """
@@ -91,7 +94,6 @@ class AuthHelper:
             )
             sign_in_btn.click()
             print("[Auth] Clicked sign-in button")
-            time.sleep(1)
 
             # Step 3: Wait for auth modal
             self.wait.until(
@@ -103,35 +105,20 @@ class AuthHelper:
             google_btn = self.wait.until(
                 EC.element_to_be_clickable((By.ID, 'googleSignInBtn'))
             )
+            known_windows = self.driver.window_handles
             google_btn.click()
             print("[Auth] Clicked Google sign-in button")
-            time.sleep(2)  # Wait for OAuth popup to open
 
             # Step 5: Switch to Google OAuth popup window
             # The OAuth popup will be the newest window
-            original_windows = [popup_window_handle]
-            new_window = None
-
-            # Wait for new window to open
-            for i in range(10):  # Try for 10 seconds
-                all_windows = self.driver.window_handles
-                for window in all_windows:
-                    if window not in original_windows:
-                        new_window = window
-                        break
-                if new_window:
-                    break
-                time.sleep(1)
-
-            if not new_window:
-                raise TimeoutException("Google OAuth popup did not open")
+            new_window = self.ready.new_window(known_windows)
 
             self.driver.switch_to.window(new_window)
             print(f"[Auth] Switched to Google OAuth popup: {self.driver.current_url}")
 
             # Step 6: Enter email
             try:
-                email_input = WebDriverWait(self.driver, 10).until(
+                email_input = WaitPolicy.wait(self.driver).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="email"]'))
                 )
                 email_input.clear()
@@ -141,18 +128,21 @@ class AuthHelper:
                 # Click "Next" button
                 next_btn = self.driver.find_element(By.ID, 'identifierNext')
                 next_btn.click()
-                time.sleep(2)
                 print("[Auth] Clicked 'Next' after email")
 
             except Exception as e:
                 print(f"[Auth] Failed to enter email: {e}")
-                self.driver.save_screenshot('reports/screenshots/oauth-email-failed.png')
+                self.driver.save_screenshot(WorkerContext.screenshot_path('oauth-email-failed.png'))
                 raise
 
             # Step 7: Enter password
+            # (the email page already contains a hidden password input,
+            # so wait for a *visible* one to know the password page is up)
             try:
-                password_input = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]'))
+                password_input = WaitPolicy.wait(self.driver).until(
+                    EC.visibility_of_element_located(
+                        (By.CSS_SELECTOR, 'input[type="password"]:not([aria-hidden="true"])')
+                    )
                 )
                 password_input.clear()
                 password_input.send_keys(test_password)
@@ -165,30 +155,25 @@ class AuthHelper:
 
             except Exception as e:
                 print(f"[Auth] Failed to enter password: {e}")
-                self.driver.save_screenshot('reports/screenshots/oauth-password-failed.png')
+                self.driver.save_screenshot(WorkerContext.screenshot_path('oauth-password-failed.png'))
                 raise
 
             # Step 8: Wait for OAuth to complete (popup will close)
-            time.sleep(3)
+            self.ready.window_closed(new_window, timeout=30)
 
             # Step 9: Switch back to popup window
-            try:
-                self.driver.switch_to.window(popup_window_handle)
-                print("[Auth] Switched back to popup window")
-            except NoSuchWindowException:
-                # OAuth popup might still be open, wait and try again
-                time.sleep(2)
-                self.driver.switch_to.window(popup_window_handle)
+            self.driver.switch_to.window(popup_window_handle)
+            print("[Auth] Switched back to popup window")
 
             # Step 10: Verify sign-in success
             try:
-                user_profile = WebDriverWait(self.driver, 10).until(
+                user_profile = WaitPolicy.wait(self.driver).until(
                     EC.visibility_of_element_located((By.ID, 'headerUserProfileContainer'))
                 )
                 print("[Auth] User profile container visible - signed in!")
 
             except TimeoutException:
-                self.driver.save_screenshot('reports/screenshots/signin-verification-failed.png')
+                self.driver.save_screenshot(WorkerContext.screenshot_path('signin-verification-failed.png'))
                 raise TimeoutException(
                     "Sign-in verification failed: User profile container did not appear"
                 )
@@ -196,7 +181,8 @@ class AuthHelper:
             # Step 11: Wait for Firebase decryption (CRITICAL)
             # The app needs time to decrypt existing profiles from Firebase
             print("[Auth] Waiting for Firebase decryption...")
-            time.sleep(5)  # 5-second health check loop
+            profile_count = self.ready.decrypted_profiles(timeout=15)
+            print(f"[Auth] Decrypted {profile_count} profile(s)")
 
             print("[Auth] Test user signed in successfully!")
 
@@ -220,7 +206,7 @@ class AuthHelper:
         try:
             # Look for status indicator element
             # Adjust selector based on actual implementation
-            status = WebDriverWait(self.driver, timeout).until(
+            status = WaitPolicy.wait(self.driver, timeout).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="protected-status"]'))
             )
             print("[Auth] 'You are protected' status confirmed")
@@ -242,17 +228,14 @@ class AuthHelper:
             # Switch to popup window
             self.driver.switch_to.window(popup_window_handle)
 
-            # Click sign-out button
-            sign_out_btn = self.wait.until(
-                EC.element_to_be_clickable((By.ID, 'headerSignOutBtn'))
-            )
-            sign_out_btn.click()
+            # Sign Out lives in the user menu dropdown and asks for confirmation
+            self.wait.until(EC.element_to_be_clickable((By.ID, 'userMenuBtn'))).click()
+            self.wait.until(EC.element_to_be_clickable((By.ID, 'signOutBtn'))).click()
+            self.wait.until(EC.element_to_be_clickable((By.ID, 'signOutConfirm'))).click()
             print("[Auth] Clicked sign-out button")
 
-            # Wait for sign-out to complete
-            time.sleep(2)
-
-            # Verify sign-in button reappears
+            # Wait for sign-out to complete (sign-in button reappears)
+            self.ready.auth_state(signed_in=False)
             self.wait.until(
                 EC.visibility_of_element_located((By.ID, 'headerSignInBtn'))
             )
@@ -267,23 +250,15 @@ class AuthHelper:
         Check if user is currently signed in.
 
         Returns:
-            True if signed in, False otherwise
+            True if signed in, False otherwise (never waits)
         """
-        try:
-            self.driver.find_element(By.ID, 'headerUserProfileContainer')
-            return True
-        except:
-            return False
+        return self.driver.execute_script(Readiness.AUTH_STATE_SCRIPT) == 'signed_in'
 
     def is_signed_out(self) -> bool:
         """
         Check if user is currently signed out.
 
         Returns:
-            True if signed out, False otherwise
+            True if signed out, False otherwise (never waits)
         """
-        try:
-            self.driver.find_element(By.ID, 'headerSignInBtn')
-            return True
-        except:
-            return False
+        return self.driver.execute_script(Readiness.AUTH_STATE_SCRIPT) == 'signed_out'
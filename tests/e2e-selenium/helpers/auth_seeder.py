@@ -0,0 +1,373 @@
+"""
+Auth Seeder for PromptBlocker E2E Tests.
+
+Signing in through the real Google OAuth popup is the slowest and flakiest
+part of the mandatory flow. Seeded auth skips it by writing a signed-in
+Firebase user straight into the popup origin's auth persistence:
+
+    IndexedDB firebaseLocalStorageDb / firebaseLocalStorage
+        firebase:authUser:<apiKey>:[DEFAULT]  ->  test user (stable UID)
+
+On the next popup load Firebase restores that user and re-validates it
+against identitytoolkit/securetoken. Those hosts are mapped to
+MockPlatformServer, where install() registers stand-in endpoints that
+accept the seeded (unsigned) tokens. The popup then derives its
+StorageEncryptionManager key from TEST_USER_UID like for any real user.
+
+Firestore is mapped to the mock too, but not emulated: its Listen/Write
+channels answer UNAVAILABLE, so the popup's syncUserToFirestore() and tier
+load fail fast as if offline instead of reaching the real project with a
+fake token. A seeded user therefore keeps the default 'free' tier and has
+no tier listener; tests must not depend on the tier.
+"""
+
+import base64
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .extension_state import ExtensionState
+from .readiness import Readiness
+
+
+def _b64url(data: bytes) -> str:
+    """Base64url without padding (JWT encoding)."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64url_decode(text: str) -> bytes:
+    """Decode base64url with or without padding."""
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+class AuthSeeder:
+    """
+    Establishes a signed-in Firebase session without interactive OAuth.
+
+    Example:
+        ```python
+        # Session setup (conftest): map Firebase auth hosts to the mock
+        server = MockPlatformServer(hosts=MockPlatformServer.DEFAULT_HOSTS + AuthSeeder.HOSTS)
+        AuthSeeder.install(server)
+
+        # In a test
+        AuthSeeder(driver, extension_id).sign_in()
+        ```
+    """
+
+    # Stable identity -> stable encryption key derivation across runs
+    TEST_USER_UID = 'e2eTestUser0000000000000001'
+    TEST_USER_EMAIL = 'e2e-test-user@promptblocker.test'
+    TEST_USER_NAME = 'E2E Test User'
+
+    # Firebase Auth REST hosts, and Firestore (kept offline), served by the mock
+    HOSTS = ['identitytoolkit.googleapis.com', 'securetoken.googleapis.com',
+             'firestore.googleapis.com']
+
+    # Firestore WebChannel streams the popup opens (getDoc/setDoc/onSnapshot)
+    FIRESTORE_CHANNELS = ['/google.firestore.v1.Firestore/Listen/channel',
+                          '/google.firestore.v1.Firestore/Write/channel']
+
+    TOKEN_LIFETIME = 3600  # seconds
+
+    API_KEY_PATTERN = re.compile(rb'AIza[0-9A-Za-z_\-]{35}')
+
+    # Writes the persisted Firebase user the way firebase/auth stores it
+    SEED_SCRIPT = """
+        const [key, value] = arguments;
+        const done = arguments[arguments.length - 1];
+        const request = indexedDB.open('firebaseLocalStorageDb', 1);
+        request.onupgradeneeded = () => {
+            request.result.createObjectStore('firebaseLocalStorage', { keyPath: 'fbase_key' });
+        };
+        request.onerror = () => done({ ok: false, error: String(request.error) });
+        request.onsuccess = () => {
+            const db = request.result;
+            const tx = db.transaction('firebaseLocalStorage', 'readwrite');
+            tx.objectStore('firebaseLocalStorage').put({ fbase_key: key, value });
+            tx.oncomplete = () => { db.close(); done({ ok: true }); };
+            tx.onerror = () => { db.close(); done({ ok: false, error: String(tx.error) }); };
+        };
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        extension_id: str,
+        api_key: Optional[str] = None,
+        uid: str = TEST_USER_UID,
+        email: str = TEST_USER_EMAIL
+    ):
+        """
+        Initialize the auth seeder.
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+            api_key: Firebase API key baked into the build (default: find_api_key())
+            uid: Firebase UID of the seeded user
+            email: Email of the seeded user
+        """
+        if not extension_id:
+            raise ValueError("Seeded auth needs the extension ID")
+
+        self.driver = driver
+        self.state = ExtensionState(driver, extension_id)
+        self.api_key = api_key or self.find_api_key()
+        self.uid = uid
+        self.email = email
+
+    # ========================================
+    # Sign In / Out
+    # ========================================
+
+    def sign_in(self, timeout: float = 10) -> None:
+        """
+        Seed the test user and load the popup signed in.
+
+        Leaves the current window on the popup page with the signed-in
+        header shown.
+
+        Args:
+            timeout: Maximum time to wait for the popup to restore the user
+
+        Raises:
+            RuntimeError: If the user record can't be written
+            TimeoutException: If the popup doesn't come up signed in
+        """
+        start = time.perf_counter()
+
+        if self.driver.current_url != self.state.popup_url:
+            self.driver.get(self.state.popup_url)
+
+        result = self.driver.execute_async_script(
+            self.SEED_SCRIPT, self.persistence_key, self.user_record()
+        )
+        if not result or not result.get('ok'):
+            raise RuntimeError(f"Could not seed Firebase auth: {result}")
+
+        # Firebase reads persistence once at startup
+        self.driver.refresh()
+        Readiness(self.driver).auth_state(signed_in=True, timeout=timeout)
+
+        print(f"[Auth] Seeded sign-in as {self.email} in {time.perf_counter() - start:.2f}s")
+
+    def sign_out(self) -> None:
+        """Remove the seeded session (clears the extension origin's auth storage)."""
+        self.state.clear_auth()
+        print("[Auth] Cleared seeded session")
+
+    # ========================================
+    # Firebase User Record
+    # ========================================
+
+    @property
+    def persistence_key(self) -> str:
+        """Key firebase/auth persists the current user under."""
+        return f"firebase:authUser:{self.api_key}:[DEFAULT]"
+
+    def user_record(self) -> Dict[str, Any]:
+        """
+        Build the persisted user (firebase/auth UserImpl.toJSON shape).
+
+        Returns:
+            dict: User record with a fresh access token
+        """
+        now_ms = int(time.time() * 1000)
+        return {
+            'uid': self.uid,
+            'email': self.email,
+            'emailVerified': True,
+            'displayName': self.TEST_USER_NAME,
+            'isAnonymous': False,
+            'photoURL': None,
+            'phoneNumber': None,
+            'tenantId': None,
+            'providerData': [{
+                'providerId': 'google.com',
+                'uid': self.uid,
+                'displayName': self.TEST_USER_NAME,
+                'email': self.email,
+                'phoneNumber': None,
+                'photoURL': None,
+            }],
+            'stsTokenManager': {
+                'refreshToken': self.refresh_token(self.uid, self.email),
+                'accessToken': self.id_token(self.uid, self.email),
+                'expirationTime': now_ms + self.TOKEN_LIFETIME * 1000,
+            },
+            'createdAt': str(now_ms),
+            'lastLoginAt': str(now_ms),
+            'apiKey': self.api_key,
+            'appName': '[DEFAULT]',
+        }
+
+    @classmethod
+    def id_token(cls, uid: str, email: str) -> str:
+        """
+        Create an unsigned Firebase ID token for the mock backend.
+
+        Args:
+            uid: Firebase UID
+            email: User email
+
+        Returns:
+            str: JWT (alg 'none') with the claims firebase/auth parses
+        """
+        project_id = os.getenv('FIREBASE_PROJECT_ID', 'promptblocker-e2e')
+        now = int(time.time())
+        header = {'alg': 'none', 'typ': 'JWT'}
+        claims = {
+            'iss': f'https://securetoken.google.com/{project_id}',
+            'aud': project_id,
+            'auth_time': now,
+            'user_id': uid,
+            'sub': uid,
+            'iat': now,
+            'exp': now + cls.TOKEN_LIFETIME,
+            'email': email,
+            'email_verified': True,
+            'firebase': {
+                'identities': {'google.com': [uid], 'email': [email]},
+                'sign_in_provider': 'google.com',
+            },
+        }
+        return '.'.join([
+            _b64url(json.dumps(header).encode()),
+            _b64url(json.dumps(claims).encode()),
+            'e2e',
+        ])
+
+    @staticmethod
+    def refresh_token(uid: str, email: str) -> str:
+        """Opaque refresh token that lets the mock re-issue ID tokens."""
+        return 'e2e.' + _b64url(json.dumps({'uid': uid, 'email': email}).encode())
+
+    # ========================================
+    # API Key
+    # ========================================
+
+    @classmethod
+    def find_api_key(cls, extension_path: Optional[str] = None) -> str:
+        """
+        Get the Firebase API key the extension was built with.
+
+        Uses FIREBASE_API_KEY (root .env, same as webpack), falling back to
+        scanning the built bundle.
+
+        Args:
+            extension_path: Built extension directory (default: <repo>/dist)
+
+        Returns:
+            str: Firebase Web API key
+
+        Raises:
+            RuntimeError: If no key can be found
+        """
+        api_key = os.getenv('FIREBASE_API_KEY')
+        if api_key:
+            return api_key
+
+        dist = Path(extension_path) if extension_path else Path(__file__).parents[3] / 'dist'
+        for bundle in sorted(dist.glob('*.js')):
+            match = cls.API_KEY_PATTERN.search(bundle.read_bytes())
+            if match:
+                return match.group(0).decode('ascii')
+
+        raise RuntimeError(
+            "Firebase API key not found. Set FIREBASE_API_KEY in .env "
+            f"or build the extension into {dist}"
+        )
+
+    # ========================================
+    # Mock Firebase Auth Backend
+    # ========================================
+
+    @classmethod
+    def install(cls, server) -> None:
+        """
+        Register Firebase Auth stand-in endpoints on a MockPlatformServer,
+        and take Firestore offline.
+
+        The server must have been created with AuthSeeder.HOSTS.
+
+        Args:
+            server: MockPlatformServer (before or after start())
+        """
+        server.add_route('POST', '/v1/accounts:lookup', cls._lookup,
+                         host='identitytoolkit.googleapis.com')
+        server.add_route('POST', '/v1/token', cls._refresh,
+                         host='securetoken.googleapis.com')
+        # The SDK reconnects with backoff for as long as the popup is open
+        for path in cls.FIRESTORE_CHANNELS:
+            for method in ('GET', 'POST'):
+                server.add_route(method, path, cls._firestore_unavailable,
+                                 host='firestore.googleapis.com', record=False)
+
+    @staticmethod
+    def _claims(token: str) -> Optional[Dict[str, Any]]:
+        """Decode the claims of an (unsigned) ID token."""
+        try:
+            return json.loads(_b64url_decode(token.split('.')[1]))
+        except (IndexError, ValueError):
+            return None
+
+    @classmethod
+    def _lookup(cls, http, request: Dict[str, Any]) -> None:
+        """POST accounts:lookup - return the user named by the ID token."""
+        claims = cls._claims((request['json'] or {}).get('idToken', ''))
+        if not claims:
+            http.send_json({'error': {'code': 400, 'message': 'INVALID_ID_TOKEN'}}, status=400)
+            return
+
+        now_ms = str(int(time.time() * 1000))
+        http.send_json({
+            'kind': 'identitytoolkit#GetAccountInfoResponse',
+            'users': [{
+                'localId': claims['user_id'],
+                'email': claims.get('email', ''),
+                'emailVerified': True,
+                'displayName': cls.TEST_USER_NAME,
+                'providerUserInfo': [{
+                    'providerId': 'google.com',
+                    'rawId': claims['user_id'],
+                    'email': claims.get('email', ''),
+                    'displayName': cls.TEST_USER_NAME,
+                }],
+                'createdAt': now_ms,
+                'lastLoginAt': now_ms,
+            }],
+        })
+
+    @staticmethod
+    def _firestore_unavailable(http, request: Dict[str, Any]) -> None:
+        """Firestore channel - refuse, so the SDK goes offline at once."""
+        http.send_json({'error': {'code': 503, 'message': 'Firestore is not mocked',
+                                  'status': 'UNAVAILABLE'}}, status=503)
+
+    @classmethod
+    def _refresh(cls, http, request: Dict[str, Any]) -> None:
+        """POST /v1/token - exchange the seeded refresh token for a new ID token."""
+        token = parse_qs(request['body']).get('refresh_token', [''])[0]
+        try:
+            user = json.loads(_b64url_decode(token.split('.', 1)[1]))
+        except (IndexError, ValueError):
+            http.send_json({'error': {'code': 400, 'message': 'INVALID_REFRESH_TOKEN'}}, status=400)
+            return
+
+        id_token = cls.id_token(user['uid'], user['email'])
+        http.send_json({
+            'access_token': id_token,
+            'id_token': id_token,
+            'expires_in': str(cls.TOKEN_LIFETIME),
+            'token_type': 'Bearer',
+            'refresh_token': token,
+            'user_id': user['uid'],
+            'project_id': os.getenv('FIREBASE_PROJECT_ID', 'promptblocker-e2e'),
+        })
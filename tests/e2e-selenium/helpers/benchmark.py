@@ -0,0 +1,213 @@
+"""
+In-Browser Benchmarks for PromptBlocker performance tests.
+
+Runs extension code in bulk inside the loaded extension: the benchmark loop
+executes in an extension page (one execute_async_script for all iterations)
+and times each chrome.runtime.sendMessage round-trip to the service worker
+with performance.now(), so WebDriver latency never pollutes the samples.
+
+Results are summarized as ops/sec and p50/p95/p99 latency and appended to
+reports/benchmarks/<worker>.jsonl; the terminal summary prints them as a
+table at the end of a performance run.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .extension_state import ExtensionState
+from .stats import Stats
+from .benchmark_store import BenchmarkStore
+from .worker_context import WorkerContext
+
+
+class InBrowserBenchmark(BenchmarkStore):
+    """
+    Times service-worker messages from an extension page.
+
+    Example:
+        ```python
+        bench = InBrowserBenchmark(driver, extension_id)
+        bench.load_profiles(corpus.profiles(100))
+        stats = bench.run('encode', text)
+        print(stats['ops_per_sec'], stats['p95_ms'])
+        ```
+    """
+
+    RESULTS_DIR = WorkerContext.REPORTS_DIR / 'benchmarks'
+
+    # Stop after MAX_ITERATIONS or TIME_BUDGET seconds (but run MIN_ITERATIONS)
+    MIN_ITERATIONS = 5
+    MAX_ITERATIONS = 200
+    WARMUP_ITERATIONS = 2
+    TIME_BUDGET = 5.0
+
+    # Hard limit for one benchmark loop (1 MB x 1000 profiles is slow)
+    SCRIPT_TIMEOUT = 600
+
+    # direction -> (message type, payload key)
+    MESSAGES = {
+        'encode': ('SUBSTITUTE_REQUEST', 'body'),
+        'decode': ('SUBSTITUTE_RESPONSE', 'text'),
+    }
+
+    SEND_SCRIPT = """
+        const [message] = arguments;
+        const done = arguments[arguments.length - 1];
+        chrome.runtime.sendMessage(message)
+            .then(done)
+            .catch((error) => done({ success: false, error: String(error) }));
+    """
+
+    # Runs warmup + timed iterations; returns latencies (ms) and the last response
+    LOOP_SCRIPT = """
+        const [message, warmup, minIterations, maxIterations, budgetMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        (async () => {
+            for (let i = 0; i < warmup; i++) await chrome.runtime.sendMessage(message);
+
+            const samples = [];
+            let response = null;
+            const started = performance.now();
+            while (samples.length < maxIterations &&
+                   (samples.length < minIterations || performance.now() - started < budgetMs)) {
+                const t0 = performance.now();
+                response = await chrome.runtime.sendMessage(message);
+                samples.push(performance.now() - t0);
+            }
+            return { samples, elapsed: performance.now() - started, response };
+        })().then(done).catch((error) => done({ error: String(error) }));
+    """
+
+    def __init__(self, driver: WebDriver, extension_id: str):
+        """
+        Initialize the benchmark and open an extension page.
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+        """
+        self.driver = driver
+        self.state = ExtensionState(driver, extension_id)
+
+        if not driver.current_url.startswith(f'chrome-extension://{extension_id}/'):
+            driver.get(self.state.popup_url)
+
+    def send(self, message: Dict[str, Any]) -> Any:
+        """
+        Send one message to the service worker.
+
+        Args:
+            message: Message ({type, payload})
+
+        Returns:
+            The service worker's response
+        """
+        return self.driver.execute_async_script(self.SEND_SCRIPT, message)
+
+    def load_profiles(self, profiles: List[Dict[str, Any]]) -> None:
+        """
+        Replace the service worker's profiles (SET_PROFILES).
+
+        Raises:
+            RuntimeError: If the service worker rejects the profiles
+        """
+        result = self.send({'type': 'SET_PROFILES', 'payload': profiles})
+        if not result or not result.get('success'):
+            raise RuntimeError(f"SET_PROFILES failed: {result}")
+
+    def enable_response_decoding(self) -> bool:
+        """
+        Turn on settings.decodeResponses (alias -> real decoding of
+        responses is skipped without it).
+
+        Returns:
+            bool: True if decoding is on (config is only available signed in)
+        """
+        config = self.send({'type': 'GET_CONFIG'})
+        if not config or not config.get('success') or not config.get('data'):
+            print(f"[Benchmark] Config not available (sign-in required): {config}")
+            return False
+
+        settings = config['data'].setdefault('settings', {})
+        if settings.get('decodeResponses'):
+            return True
+
+        settings['decodeResponses'] = True
+        result = self.send({'type': 'UPDATE_CONFIG', 'payload': config['data']})
+        if not result or not result.get('success'):
+            print(f"[Benchmark] Could not enable response decoding: {result}")
+            return False
+        return True
+
+    def run(self, direction: str, text: str, url: str = 'https://chatgpt.com/backend-api/conversation',
+            budget: Optional[float] = None, min_iterations: Optional[int] = None,
+            warmup: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Benchmark substitution of `text` in one direction.
+
+        Args:
+            direction: 'encode' (SUBSTITUTE_REQUEST, real -> alias) or
+                'decode' (SUBSTITUTE_RESPONSE, alias -> real)
+            text: Request body (plain text: substituted directly by
+                AliasEngine) or response text
+            url: Platform URL passed with the message
+            budget: Time budget in seconds (default: TIME_BUDGET)
+            min_iterations: Timed calls even past the budget (default: MIN_ITERATIONS)
+            warmup: Untimed calls first (default: WARMUP_ITERATIONS)
+
+        Returns:
+            dict: Statistics from Stats.summarize() plus 'substitutions'
+
+        Raises:
+            RuntimeError: If the loop fails or the service worker reports an error
+        """
+        message_type, key = self.MESSAGES[direction]
+        message = {'type': message_type, 'payload': {key: text, 'url': url}}
+
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            result = self.driver.execute_async_script(
+                self.LOOP_SCRIPT, message,
+                self.WARMUP_ITERATIONS if warmup is None else warmup,
+                min_iterations or self.MIN_ITERATIONS,
+                self.MAX_ITERATIONS,
+                (budget or self.TIME_BUDGET) * 1000
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if not result or result.get('error'):
+            raise RuntimeError(f"Benchmark loop failed: {result}")
+
+        response = result['response'] or {}
+        if not response.get('success'):
+            raise RuntimeError(f"{message_type} failed: {response}")
+
+        stats = Stats.summarize(result['samples'], result['elapsed'])
+        stats['substitutions'] = response.get('substitutions', 0)
+        return stats
+
+    # ========================================
+    # Results
+    # ========================================
+
+    @staticmethod
+    def report(records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Format benchmark records as a table.
+
+        Args:
+            records: Records with 'name' and Stats.summarize() fields
+
+        Returns:
+            list: Report lines
+        """
+        lines = [f"  {'benchmark':<44} {'n':>5} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"]
+        for record in sorted(records, key=lambda r: r['name']):
+            lines.append(
+                f"  {record['name'][:44]:<44} {record['iterations']:>5} {record['ops_per_sec']:>9.1f} "
+                f"{record['p50_ms']:>9.2f} {record['p95_ms']:>9.2f} {record['p99_ms']:>9.2f}"
+            )
+        return lines
@@ -0,0 +1,57 @@
+"""
+Benchmark Result Store for PromptBlocker performance tests.
+
+Every benchmark appends one JSON record per case to its own directory,
+one file per xdist worker, and the controller reads them all back for the
+terminal summary:
+
+    reports/benchmarks/<kind>/<worker>.jsonl
+
+Benchmark classes inherit BenchmarkStore and set RESULTS_DIR.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .worker_context import WorkerContext
+
+
+class BenchmarkStore:
+    """
+    JSONL result files of one benchmark kind (set RESULTS_DIR in subclasses).
+
+    Example:
+        ```python
+        class FetchOverheadBenchmark(BenchmarkStore):
+            RESULTS_DIR = WorkerContext.REPORTS_DIR / 'benchmarks' / 'fetch'
+
+        FetchOverheadBenchmark.save({'name': 'fetch/1KB/c1', ...})
+        records = FetchOverheadBenchmark.load_all()
+        ```
+    """
+
+    RESULTS_DIR: Path = WorkerContext.REPORTS_DIR / 'benchmarks'
+
+    @classmethod
+    def save(cls, record: Dict[str, Any]) -> None:
+        """Append a benchmark record to this worker's JSONL file."""
+        cls.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        path = cls.RESULTS_DIR / f'{WorkerContext.worker_id()}.jsonl'
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+    @classmethod
+    def clear_saved(cls) -> None:
+        """Remove results of a previous run (called once by the controller)."""
+        for path in cls.RESULTS_DIR.glob('*.jsonl'):
+            path.unlink()
+
+    @classmethod
+    def load_all(cls) -> List[Dict[str, Any]]:
+        """Read the records saved by all workers."""
+        records = []
+        for path in sorted(cls.RESULTS_DIR.glob('*.jsonl')):
+            with open(path, encoding='utf-8') as f:
+                records += [json.loads(line) for line in f if line.strip()]
+        return records
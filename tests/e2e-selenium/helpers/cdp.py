@@ -0,0 +1,268 @@
+"""
+Chrome DevTools Protocol sessions for PromptBlocker E2E tests.
+
+driver.execute_cdp_cmd() only talks to the current tab and never returns
+events, so it can't reach the extension's service worker or collect a heap
+snapshot (which arrives as HeapProfiler.addHeapSnapshotChunk events). This
+module opens Chrome's browser-level DevTools WebSocket (the debugger
+address ChromeDriver reports) and attaches a flat session to one target:
+
+    CDPSession.for_page(driver)                        the tab under test
+    CDPSession.for_service_worker(driver, extension_id)  background.js
+
+Both expose the same commands (heap usage, forced GC, heap snapshots).
+"""
+
+import json
+import time
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional
+
+import websocket
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CDPSession:
+    """
+    A DevTools session attached to one page or worker target.
+
+    Example:
+        ```python
+        worker = CDPSession.for_service_worker(driver, extension_id)
+        worker.collect_garbage()
+        print(worker.heap_usage()['usedSize'])
+        summary = CDPSession.summarize_snapshot(worker.heap_snapshot())
+        worker.close()
+        ```
+    """
+
+    TIMEOUT = 60
+
+    def __init__(self, driver: WebDriver, match: Callable[[Dict[str, Any]], bool],
+                 description: str, timeout: float = TIMEOUT):
+        """
+        Connect to the browser and attach to the first matching target.
+
+        Args:
+            driver: Selenium WebDriver instance (Chrome)
+            match: Predicate on Target.TargetInfo
+            description: Target description for error messages
+            timeout: Seconds to wait for the target and for each command
+
+        Raises:
+            RuntimeError: If no matching target appears within `timeout`
+        """
+        self.description = description
+        self.timeout = timeout
+        self._next_id = 0
+        self._socket = websocket.create_connection(
+            self.browser_url(driver), timeout=timeout,
+            # Chrome rejects DevTools connections with an Origin header
+            # unless started with --remote-allow-origins
+            suppress_origin=True
+        )
+        self.session_id: Optional[str] = None
+
+        deadline = time.monotonic() + timeout
+        while True:
+            targets = self.send('Target.getTargets')['targetInfos']
+            target = next((t for t in targets if match(t)), None)
+            if target:
+                break
+            if time.monotonic() > deadline:
+                self._socket.close()
+                raise RuntimeError(f"No {description} target within {timeout}s")
+            time.sleep(0.25)
+
+        self.target = target
+        self.session_id = self.send('Target.attachToTarget',
+                                    {'targetId': target['targetId'], 'flatten': True})['sessionId']
+        print(f"[CDP] Attached to {description}: {target.get('url', '')[:80]}")
+
+    @classmethod
+    def for_page(cls, driver: WebDriver) -> 'CDPSession':
+        """
+        Attach to the tab the driver is on.
+
+        Args:
+            driver: Selenium WebDriver instance
+
+        Returns:
+            CDPSession for the current page
+        """
+        url = driver.current_url
+        return cls(driver, lambda t: t.get('type') == 'page' and t.get('url') == url, f'page {url}')
+
+    @classmethod
+    def for_service_worker(cls, driver: WebDriver, extension_id: str) -> 'CDPSession':
+        """
+        Attach to the extension's service worker.
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+
+        Returns:
+            CDPSession for the service worker (keeps it alive while attached)
+        """
+        prefix = f'chrome-extension://{extension_id}/'
+        return cls(driver, lambda t: t.get('type') == 'service_worker' and t.get('url', '').startswith(prefix),
+                   'extension service worker')
+
+    @staticmethod
+    def browser_url(driver: WebDriver) -> str:
+        """
+        Browser-level DevTools WebSocket URL of the driver's Chrome.
+
+        Args:
+            driver: Selenium WebDriver instance
+
+        Returns:
+            str: ws://127.0.0.1:<port>/devtools/browser/<id>
+        """
+        address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        with urllib.request.urlopen(f'http://{address}/json/version', timeout=10) as response:
+            return json.loads(response.read())['webSocketDebuggerUrl']
+
+    # ========================================
+    # Protocol
+    # ========================================
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+             on_event: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Send a command and wait for its result.
+
+        Args:
+            method: CDP method (e.g. 'Runtime.getHeapUsage')
+            params: Command parameters
+            on_event: Called with every event of this session received
+                while waiting (other events are dropped)
+
+        Returns:
+            dict: Command result
+
+        Raises:
+            RuntimeError: If the command fails
+        """
+        self._next_id += 1
+        message: Dict[str, Any] = {'id': self._next_id, 'method': method, 'params': params or {}}
+        if self.session_id:
+            message['sessionId'] = self.session_id
+        self._socket.send(json.dumps(message))
+
+        while True:
+            reply = json.loads(self._socket.recv())
+            if reply.get('id') == self._next_id:
+                if 'error' in reply:
+                    raise RuntimeError(f"{method} on {self.description} failed: {reply['error']}")
+                return reply.get('result', {})
+            if on_event and 'method' in reply and reply.get('sessionId') == self.session_id:
+                on_event(reply)
+
+    def close(self) -> None:
+        """Detach and close the connection."""
+        try:
+            if self.session_id:
+                self.session_id, session_id = None, self.session_id
+                self.send('Target.detachFromTarget', {'sessionId': session_id})
+        except Exception as e:
+            print(f"[CDP] Detach from {self.description} failed: {e}")
+        finally:
+            self._socket.close()
+
+    # ========================================
+    # Memory
+    # ========================================
+
+    def collect_garbage(self) -> None:
+        """Force a full garbage collection in the target."""
+        self.send('HeapProfiler.collectGarbage')
+
+    def heap_usage(self) -> Dict[str, int]:
+        """
+        JS heap of the target.
+
+        Returns:
+            dict: usedSize and totalSize in bytes
+        """
+        result = self.send('Runtime.getHeapUsage')
+        return {'usedSize': int(result['usedSize']), 'totalSize': int(result['totalSize'])}
+
+    def heap_snapshot(self) -> Dict[str, Any]:
+        """
+        Take a heap snapshot (after a forced GC).
+
+        Returns:
+            dict: Parsed .heapsnapshot JSON
+        """
+        chunks: List[str] = []
+
+        def collect(event):
+            if event['method'] == 'HeapProfiler.addHeapSnapshotChunk':
+                chunks.append(event['params']['chunk'])
+
+        self.send('HeapProfiler.enable')
+        try:
+            self.send('HeapProfiler.takeHeapSnapshot', {'reportProgress': False}, on_event=collect)
+        finally:
+            self.send('HeapProfiler.disable')
+        return json.loads(''.join(chunks))
+
+    # Node types whose names are contents (strings, code), not class names
+    ANONYMOUS_TYPES = {'string', 'concatenated string', 'sliced string', 'number', 'code', 'hidden', 'bigint'}
+
+    @classmethod
+    def summarize_snapshot(cls, snapshot: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+        """
+        Count nodes and self size per constructor, like DevTools' Summary view.
+
+        Args:
+            snapshot: Parsed heap snapshot
+
+        Returns:
+            dict: '<type>:<constructor>' (or '(<type>)') -> {'count', 'size'}
+        """
+        meta = snapshot['snapshot']['meta']
+        fields = meta['node_fields']
+        types = meta['node_types'][0]
+        width = len(fields)
+        type_at, name_at, size_at = fields.index('type'), fields.index('name'), fields.index('self_size')
+        nodes, strings = snapshot['nodes'], snapshot['strings']
+
+        summary: Dict[str, Dict[str, int]] = {}
+        for offset in range(0, len(nodes), width):
+            node_type = types[nodes[offset + type_at]]
+            key = f'({node_type})' if node_type in cls.ANONYMOUS_TYPES \
+                else f'{node_type}:{strings[nodes[offset + name_at]]}'
+            entry = summary.setdefault(key, {'count': 0, 'size': 0})
+            entry['count'] += 1
+            entry['size'] += nodes[offset + size_at]
+        return summary
+
+    @staticmethod
+    def diff_summaries(before: Dict[str, Dict[str, int]], after: Dict[str, Dict[str, int]],
+                       top: int = 30) -> List[Dict[str, Any]]:
+        """
+        Constructors that grew the most between two snapshot summaries.
+
+        Args:
+            before: summarize_snapshot() of the earlier snapshot
+            after: summarize_snapshot() of the later snapshot
+            top: Rows to return
+
+        Returns:
+            list: {'constructor', 'count_delta', 'size_delta', 'size'} by size_delta, largest first
+        """
+        empty = {'count': 0, 'size': 0}
+        rows = [
+            {
+                'constructor': key,
+                'count_delta': after.get(key, empty)['count'] - before.get(key, empty)['count'],
+                'size_delta': after.get(key, empty)['size'] - before.get(key, empty)['size'],
+                'size': after.get(key, empty)['size'],
+            }
+            for key in set(before) | set(after)
+        ]
+        rows.sort(key=lambda row: row['size_delta'], reverse=True)
+        return rows[:top]
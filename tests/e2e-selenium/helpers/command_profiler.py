@@ -0,0 +1,239 @@
+"""
+WebDriver Command Profiler for PromptBlocker E2E Tests.
+
+Every Selenium call (find, click, send_keys, execute_script, screenshot, ...)
+is one HTTP round-trip to ChromeDriver. With `pytest --profile-webdriver`
+each driver from ChromeDriverManager.get_driver() is wrapped so every
+command is counted and timed, and attributed to the page-object or helper
+method that issued it (e.g. PopupPage.select_profile, AuthHelper.sign_out).
+
+Each worker saves its totals to reports/webdriver_profile/<worker>.json;
+the terminal summary merges them and prints the top commands and call
+sites by total time - the places where batching or caching pays off.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .worker_context import WorkerContext
+
+
+class CommandProfiler:
+    """
+    Per-process WebDriver command statistics.
+
+    Example:
+        ```python
+        driver = ChromeDriverManager.get_driver(extension_path)
+        CommandProfiler.install(driver)   # get_driver() does this when enabled
+        ...
+        print('\n'.join(CommandProfiler.report(CommandProfiler.snapshot())))
+        ```
+    """
+
+    PROFILE_DIR = WorkerContext.REPORTS_DIR / 'webdriver_profile'
+    ENV_FLAG = 'E2E_PROFILE_WEBDRIVER'
+
+    # Generic primitives (waits, resets): attribute their commands to whoever
+    # called them, e.g. a Readiness wait to the page method that waits
+    PASS_THROUGH_FILES = {'base_page.py', 'timing.py', 'wait_policy.py', 'readiness.py',
+                          'extension_state.py', 'command_profiler.py'}
+
+    _lock = threading.Lock()
+    _commands: Dict[str, List[float]] = {}
+    _call_sites: Dict[str, Dict[str, Any]] = {}
+
+    # ========================================
+    # Installation
+    # ========================================
+
+    @classmethod
+    def enabled(cls) -> bool:
+        """Whether profiling was requested (pytest --profile-webdriver)."""
+        return os.getenv(cls.ENV_FLAG) == '1'
+
+    @classmethod
+    def install(cls, driver) -> None:
+        """
+        Wrap a driver so all of its commands (and its elements') are profiled.
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        if getattr(driver, '_command_profiler', False):
+            return
+
+        execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                cls.record(driver_command, time.perf_counter() - start, cls._call_site())
+
+        # WebElement commands go through their parent driver's execute()
+        driver.execute = profiled_execute
+        driver._command_profiler = True
+        print("[Profiler] WebDriver command profiling enabled")
+
+    # ========================================
+    # Recording
+    # ========================================
+
+    @classmethod
+    def record(cls, command: str, seconds: float, call_site: str) -> None:
+        """
+        Record one command round-trip.
+
+        Args:
+            command: WebDriver command name (e.g. 'findElement')
+            seconds: Round-trip latency
+            call_site: 'Class.method' that issued the command
+        """
+        with cls._lock:
+            cls._commands.setdefault(command, []).append(seconds)
+            site = cls._call_sites.setdefault(call_site, {'count': 0, 'total': 0.0, 'commands': {}})
+            site['count'] += 1
+            site['total'] += seconds
+            site['commands'][command] = site['commands'].get(command, 0) + 1
+
+    @classmethod
+    def _call_site(cls) -> str:
+        """Find the suite method (page object, helper, test) behind a command."""
+        frame = sys._getframe(2)
+        suite_root = str(WorkerContext.SUITE_ROOT)
+        fallback = None
+
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(suite_root):
+                name = cls._frame_name(frame)
+                if Path(filename).name not in cls.PASS_THROUGH_FILES:
+                    return name
+                fallback = fallback or name
+            frame = frame.f_back
+
+        return fallback or '<unknown>'
+
+    @staticmethod
+    def _frame_name(frame) -> str:
+        """'Class.method' for methods, the function name otherwise."""
+        instance = frame.f_locals.get('self')
+        function = frame.f_code.co_name
+        if instance is not None:
+            return f"{type(instance).__name__}.{function}"
+        return function
+
+    # ========================================
+    # Persistence (one file per xdist worker)
+    # ========================================
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Any]:
+        """
+        Aggregate this process's statistics.
+
+        Returns:
+            dict: {'commands': {name: {count, total, max}}, 'call_sites': {...}}
+        """
+        with cls._lock:
+            return {
+                'commands': {
+                    name: {'count': len(times), 'total': sum(times), 'max': max(times)}
+                    for name, times in cls._commands.items()
+                },
+                'call_sites': json.loads(json.dumps(cls._call_sites)),
+            }
+
+    @classmethod
+    def save(cls) -> Optional[Path]:
+        """Write this worker's statistics to PROFILE_DIR (if anything was recorded)."""
+        data = cls.snapshot()
+        if not data['commands']:
+            return None
+
+        cls.PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        path = cls.PROFILE_DIR / f'{WorkerContext.worker_id()}.json'
+        path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        return path
+
+    @classmethod
+    def clear_saved(cls) -> None:
+        """Remove results of a previous run (called once by the controller)."""
+        for path in cls.PROFILE_DIR.glob('*.json'):
+            path.unlink()
+
+    @classmethod
+    def load_all(cls) -> Dict[str, Any]:
+        """
+        Merge the statistics saved by all workers.
+
+        Returns:
+            dict: Same shape as snapshot()
+        """
+        merged: Dict[str, Any] = {'commands': {}, 'call_sites': {}}
+
+        for path in sorted(cls.PROFILE_DIR.glob('*.json')):
+            data = json.loads(path.read_text(encoding='utf-8'))
+
+            for name, stats in data['commands'].items():
+                total = merged['commands'].setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+                total['count'] += stats['count']
+                total['total'] += stats['total']
+                total['max'] = max(total['max'], stats['max'])
+
+            for name, stats in data['call_sites'].items():
+                total = merged['call_sites'].setdefault(name, {'count': 0, 'total': 0.0, 'commands': {}})
+                total['count'] += stats['count']
+                total['total'] += stats['total']
+                for command, count in stats['commands'].items():
+                    total['commands'][command] = total['commands'].get(command, 0) + count
+
+        return merged
+
+    # ========================================
+    # Reporting
+    # ========================================
+
+    @staticmethod
+    def report(data: Dict[str, Any], top: int = 15) -> List[str]:
+        """
+        Format the top commands and call sites by total time.
+
+        Args:
+            data: Statistics from snapshot() or load_all()
+            top: Rows per table
+
+        Returns:
+            list: Report lines
+        """
+        commands = sorted(data['commands'].items(), key=lambda item: -item[1]['total'])
+        sites = sorted(data['call_sites'].items(), key=lambda item: -item[1]['total'])
+        count = sum(stats['count'] for _, stats in commands)
+        seconds = sum(stats['total'] for _, stats in commands)
+
+        lines = [f"{count} WebDriver commands, {seconds:.2f}s total round-trip time", '',
+                 "Top commands by total time:",
+                 f"  {'command':<28} {'count':>7} {'total ms':>10} {'mean ms':>8} {'max ms':>8}"]
+        for name, stats in commands[:top]:
+            lines.append(
+                f"  {name:<28} {stats['count']:>7} {stats['total'] * 1000:>10.0f} "
+                f"{stats['total'] * 1000 / stats['count']:>8.1f} {stats['max'] * 1000:>8.1f}"
+            )
+
+        lines += ['', "Top call sites by total time:",
+                  f"  {'call site':<44} {'count':>7} {'total ms':>10}  commands"]
+        for name, stats in sites[:top]:
+            breakdown = ', '.join(
+                f"{command} x{n}"
+                for command, n in sorted(stats['commands'].items(), key=lambda item: -item[1])[:3]
+            )
+            lines.append(f"  {name[:44]:<44} {stats['count']:>7} {stats['total'] * 1000:>10.0f}  {breakdown}")
+
+        return lines
@@ -0,0 +1,280 @@
+"""
+Browser Console Ring Buffer for PromptBlocker E2E Tests.
+
+Chrome runs with --log-level=3 and nothing reads the DevTools console, so
+an error in content.ts, inject.js or the service worker only shows up as a
+test timing out somewhere later. ConsoleLog keeps a DevTools connection per
+browser open in the background and attaches to every tab and extension page
+as they appear. It keeps their output in memory:
+
+    page      console.* and uncaught exceptions of the page (inject.js runs here)
+    content   the same from the extension's isolated world (content.ts)
+    ext-page  extension pages (popup, auth)
+    worker    the extension service worker (background.js), opt-in
+    .../<src> Log.entryAdded (network errors, CSP violations, interventions)
+
+The service worker is left alone by default: an attached DevTools session
+keeps it alive for the browser's lifetime, and tests must still see it
+suspended and restarted (state loss bugs). Pass worker=True
+(--console-log-worker) to collect it anyway.
+
+Only the last CAPACITY entries are kept, and the buffer is cleared at the
+start of every test. Nothing is written unless the test fails; then the
+buffer is attached to the Allure report.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import allure
+import websocket
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import CDPSession
+
+
+class ConsoleLog:
+    """
+    Collects console output of all pages and the service worker of one Chrome.
+
+    Example:
+        ```python
+        log = ConsoleLog.for_driver(driver)
+        log.clear()                         # start of test
+        ...
+        log.attach()                        # test failed: add the tail to Allure
+        ```
+    """
+
+    CAPACITY = 1000
+    MAX_TEXT = 2000
+
+    _instances: Dict[str, Optional['ConsoleLog']] = {}
+
+    def __init__(self, driver: WebDriver, capacity: int = CAPACITY, worker: bool = False):
+        """
+        Connect to the browser and start collecting on a background thread.
+
+        Args:
+            driver: Selenium WebDriver instance (Chrome)
+            capacity: Entries kept (older ones are dropped)
+            worker: Also attach to the extension service worker (keeps it
+                from being suspended)
+        """
+        self.entries: deque = deque(maxlen=capacity)
+        self.worker = worker
+        self._socket = websocket.create_connection(CDPSession.browser_url(driver), suppress_origin=True)
+        self._send_lock = threading.Lock()
+        self._next_id = 0
+
+        self._attached: set = set()
+        self._targets: Dict[str, str] = {}
+        self._sessions: Dict[str, str] = {}
+        self._isolated: set = set()
+
+        self._thread = threading.Thread(target=self._run, name='console-log', daemon=True)
+        self._thread.start()
+
+        # Reports every existing target, then each new one (targetCreated)
+        self._send('Target.setDiscoverTargets', {'discover': True})
+
+    @classmethod
+    def for_driver(cls, driver: WebDriver, worker: bool = False) -> Optional['ConsoleLog']:
+        """
+        The collector of a driver's browser (started on first use).
+
+        Args:
+            driver: Selenium WebDriver instance
+            worker: Also collect the service worker (see __init__)
+
+        Returns:
+            ConsoleLog, or None if DevTools can't be reached
+        """
+        key = driver.session_id
+        if key not in cls._instances:
+            try:
+                cls._instances[key] = cls(driver, worker=worker)
+            except Exception as e:
+                print(f"[ConsoleLog] Console collection unavailable: {e}")
+                cls._instances[key] = None
+        return cls._instances[key]
+
+    @classmethod
+    def running(cls, driver: WebDriver) -> Optional['ConsoleLog']:
+        """The driver's collector if one was started (never starts one)."""
+        return cls._instances.get(driver.session_id)
+
+    @classmethod
+    def stop(cls, driver: WebDriver) -> None:
+        """
+        Close a driver's collector, if running.
+
+        With the connection gone Chrome stops reporting console calls, so
+        timing-sensitive tests don't pay for the collection.
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        log = cls._instances.pop(driver.session_id, None)
+        if log is not None:
+            log.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every collector (end of session)."""
+        for log in cls._instances.values():
+            if log is not None:
+                log.close()
+        cls._instances = {}
+
+    # ========================================
+    # Buffer
+    # ========================================
+
+    def clear(self) -> None:
+        """Forget collected entries (start of a test)."""
+        self.entries.clear()
+
+    def tail(self) -> List[str]:
+        """
+        Collected entries, oldest first.
+
+        Returns:
+            list: 'HH:MM:SS.mmm source level text [location]' lines
+        """
+        lines = []
+        for timestamp, source, level, text, location in list(self.entries):
+            clock = time.strftime('%H:%M:%S', time.localtime(timestamp / 1000))
+            lines.append(f"{clock}.{int(timestamp % 1000):03d} {source:<10} {level:<9} {text}"
+                         + (f"  [{location}]" if location else ''))
+        return lines
+
+    def attach(self, name: str = 'browser_console') -> None:
+        """Attach the buffer to the Allure report (if it has entries)."""
+        lines = self.tail()
+        if lines:
+            allure.attach('\n'.join(lines), name=name, attachment_type=allure.attachment_type.TEXT)
+
+    def close(self) -> None:
+        """Close the connection (the collector thread exits)."""
+        try:
+            self._socket.close()
+        except Exception:
+            pass
+
+    # ========================================
+    # Collector Thread
+    # ========================================
+
+    def _send(self, method: str, params: Optional[Dict[str, Any]] = None,
+              session_id: Optional[str] = None) -> None:
+        """Send a command without waiting for its result."""
+        with self._send_lock:
+            self._next_id += 1
+            message: Dict[str, Any] = {'id': self._next_id, 'method': method, 'params': params or {}}
+            if session_id:
+                message['sessionId'] = session_id
+            self._socket.send(json.dumps(message))
+
+    def _run(self) -> None:
+        """Read events until the browser or close() ends the connection."""
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+            except Exception:
+                return
+            method = message.get('method')
+            if method:
+                try:
+                    self._handle(method, message.get('params', {}), message.get('sessionId'))
+                except Exception as e:
+                    print(f"[ConsoleLog] Could not handle {method}: {e}")
+
+    def _handle(self, method: str, params: Dict[str, Any], session_id: Optional[str]) -> None:
+        """Dispatch one event."""
+        if method in ('Target.targetCreated', 'Target.targetInfoChanged'):
+            info = params['targetInfo']
+            session = self._targets.get(info['targetId'])
+            if session in self._sessions and self._label(info):
+                # Navigated, e.g. from a chat page to an extension page
+                self._sessions[session] = self._label(info)
+            if self._collects(info) and info['targetId'] not in self._attached:
+                self._attached.add(info['targetId'])
+                self._send('Target.attachToTarget', {'targetId': info['targetId'], 'flatten': True})
+
+        elif method == 'Target.attachedToTarget':
+            session = params['sessionId']
+            self._targets[params['targetInfo']['targetId']] = session
+            self._sessions[session] = self._label(params['targetInfo']) or 'other'
+            self._send('Runtime.enable', session_id=session)
+            self._send('Log.enable', session_id=session)
+
+        elif method in ('Target.detachedFromTarget', 'Target.targetDestroyed'):
+            self._sessions.pop(params.get('sessionId') or self._targets.get(params.get('targetId')), None)
+            self._targets.pop(params.get('targetId'), None)
+            self._attached.discard(params.get('targetId'))
+
+        elif method == 'Runtime.executionContextCreated':
+            context = params['context']
+            if context.get('auxData', {}).get('type') == 'isolated':
+                self._isolated.add((session_id, context['id']))
+
+        elif method == 'Runtime.consoleAPICalled':
+            source = 'content' if (session_id, params.get('executionContextId')) in self._isolated \
+                else self._sessions.get(session_id, 'other')
+            text = ' '.join(self._format_arg(arg) for arg in params.get('args', []))
+            self._add(params.get('timestamp'), source, params.get('type', 'log'), text,
+                      self._location(params.get('stackTrace')))
+
+        elif method == 'Runtime.exceptionThrown':
+            details = params['exceptionDetails']
+            source = 'content' if (session_id, details.get('executionContextId')) in self._isolated \
+                else self._sessions.get(session_id, 'other')
+            text = details.get('exception', {}).get('description') or details.get('text', '')
+            self._add(params.get('timestamp'), source, 'exception', text,
+                      self._location(details.get('stackTrace')) or details.get('url', ''))
+
+        elif method == 'Log.entryAdded':
+            entry = params['entry']
+            source = f"{self._sessions.get(session_id, 'other')}/{entry.get('source', '')}"
+            self._add(entry.get('timestamp'), source, entry.get('level', 'info'), entry.get('text', ''),
+                      entry.get('url', ''))
+
+    def _add(self, timestamp: Optional[float], source: str, level: str, text: str, location: str) -> None:
+        """Append an entry (the deque drops the oldest when full)."""
+        self.entries.append((timestamp or time.time() * 1000, source, level, text[:self.MAX_TEXT], location))
+
+    def _collects(self, info: Dict[str, Any]) -> bool:
+        """Whether to attach to a target."""
+        label = self._label(info)
+        return bool(label) and (label != 'worker' or self.worker)
+
+    @staticmethod
+    def _label(info: Dict[str, Any]) -> Optional[str]:
+        """Source label of a target, or None if it isn't collected."""
+        url = info.get('url', '')
+        if info.get('type') == 'service_worker' and url.startswith('chrome-extension://'):
+            return 'worker'
+        if info.get('type') == 'page' and not url.startswith('devtools://'):
+            return 'ext-page' if url.startswith('chrome-extension://') else 'page'
+        return None
+
+    @staticmethod
+    def _format_arg(arg: Dict[str, Any]) -> str:
+        """Render a console argument (Runtime.RemoteObject) like DevTools' one-line view."""
+        if 'value' in arg:
+            value = arg['value']
+            return value if isinstance(value, str) else json.dumps(value)
+        return arg.get('unserializableValue') or arg.get('description') or arg.get('type', '')
+
+    @staticmethod
+    def _location(stack: Optional[Dict[str, Any]]) -> str:
+        """'file.js:line' of the top stack frame."""
+        frames: List[Dict[str, Any]] = (stack or {}).get('callFrames', [])
+        if not frames:
+            return ''
+        frame = frames[0]
+        return f"{frame.get('url', '').rsplit('/', 1)[-1]}:{frame.get('lineNumber', 0) + 1}"
@@ -0,0 +1,227 @@
+"""
+Service-Worker CPU Profiling for PromptBlocker E2E tests.
+
+Every SUBSTITUTE_REQUEST / SUBSTITUTE_RESPONSE is handled in the service
+worker (MessageRouter -> RequestProcessor -> AliasEngine). With
+--cpu-profile, the V8 sampling profiler runs in the worker for the whole of
+each performance test (CDP Profiler domain over a CDPSession):
+
+    reports/cpuprofiles/<test>.cpuprofile   open in DevTools > Performance
+    reports/cpuprofiles/<test>.top.json     functions by self time
+
+Both are attached to the Allure report, and the end of the run prints the
+hottest functions over all profiled tests. Function names are only
+readable with an unminified build (`npm run dev`).
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import CDPSession
+from .worker_context import WorkerContext
+
+
+class ServiceWorkerProfiler:
+    """
+    Samples the extension service worker's CPU while a test runs.
+
+    Example:
+        ```python
+        profiler = ServiceWorkerProfiler(driver, extension_id)
+        profiler.start()
+        ...                                   # substitution corpus
+        profile = profiler.stop()
+        path = ServiceWorkerProfiler.save('throughput', profile)
+        print(ServiceWorkerProfiler.format_top(ServiceWorkerProfiler.top_functions(profile)))
+        ```
+    """
+
+    RESULTS_DIR = WorkerContext.REPORTS_DIR / 'cpuprofiles'
+
+    # Microseconds between samples (V8 default is 1000)
+    SAMPLING_INTERVAL_US = 100
+
+    TOP = 25
+
+    # Pseudo-nodes that are not JavaScript functions
+    IDLE = '(idle)'
+
+    def __init__(self, driver: WebDriver, extension_id: str,
+                 interval_us: int = SAMPLING_INTERVAL_US):
+        """
+        Initialize the profiler (call start() to attach and begin sampling).
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+            interval_us: Sampling interval in microseconds
+        """
+        self.driver = driver
+        self.extension_id = extension_id
+        self.interval_us = interval_us
+        self.session: Optional[CDPSession] = None
+
+    def start(self) -> None:
+        """Attach to the service worker and start sampling."""
+        self.session = CDPSession.for_service_worker(self.driver, self.extension_id)
+        self.session.send('Profiler.enable')
+        self.session.send('Profiler.setSamplingInterval', {'interval': self.interval_us})
+        self.session.send('Profiler.start')
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        Stop sampling and detach.
+
+        Returns:
+            dict: The CPU profile (Profiler.Profile, .cpuprofile format)
+        """
+        try:
+            profile = self.session.send('Profiler.stop')['profile']
+            self.session.send('Profiler.disable')
+        finally:
+            self.session.close()
+            self.session = None
+        return profile
+
+    # ========================================
+    # Analysis
+    # ========================================
+
+    @classmethod
+    def top_functions(cls, profile: Dict[str, Any], top: int = TOP) -> List[Dict[str, Any]]:
+        """
+        Aggregate self time per function.
+
+        Each sample is charged the time until the next sample (the last one
+        until endTime), as DevTools does. Idle time is left out, so 'share'
+        is the fraction of busy time.
+
+        Args:
+            profile: CPU profile from stop()
+            top: Rows to return
+
+        Returns:
+            list: {'function', 'location', 'self_ms', 'share', 'samples'}
+                by self time, largest first
+        """
+        nodes = {node['id']: node for node in profile['nodes']}
+        samples = profile.get('samples', [])
+        deltas = profile.get('timeDeltas', [])
+
+        times = []
+        timestamp = profile['startTime']
+        for delta in deltas:
+            timestamp += delta
+            times.append(timestamp)
+        times.append(profile['endTime'])
+
+        totals: Dict[tuple, Dict[str, Any]] = {}
+        for index, node_id in enumerate(samples):
+            frame = nodes[node_id]['callFrame']
+            name = frame.get('functionName') or '(anonymous)'
+            if name == cls.IDLE:
+                continue
+            key = (name, cls.location(frame))
+            entry = totals.setdefault(key, {'self_us': 0.0, 'samples': 0})
+            entry['self_us'] += max(times[index + 1] - times[index], 0)
+            entry['samples'] += 1
+
+        busy = sum(entry['self_us'] for entry in totals.values()) or 1.0
+        rows = [
+            {
+                'function': name,
+                'location': location,
+                'self_ms': round(entry['self_us'] / 1000, 3),
+                'share': round(entry['self_us'] / busy, 4),
+                'samples': entry['samples'],
+            }
+            for (name, location), entry in totals.items()
+        ]
+        rows.sort(key=lambda row: row['self_ms'], reverse=True)
+        return rows[:top]
+
+    @staticmethod
+    def location(frame: Dict[str, Any]) -> str:
+        """File name and 1-based line:column of a call frame ('' for native code)."""
+        url = frame.get('url') or ''
+        if not url:
+            return ''
+        return f"{url.rsplit('/', 1)[-1]}:{frame.get('lineNumber', -1) + 1}:{frame.get('columnNumber', -1) + 1}"
+
+    @staticmethod
+    def format_top(rows: List[Dict[str, Any]]) -> str:
+        """
+        Format top_functions() rows as a table.
+
+        Args:
+            rows: Rows from top_functions() (or merged ones)
+
+        Returns:
+            str: Table text
+        """
+        lines = [f"  {'self ms':>10} {'share':>7}  {'function':<40} location"]
+        for row in rows:
+            lines.append(f"  {row['self_ms']:>10.1f} {row['share'] * 100:>6.1f}%  "
+                         f"{row['function'][:40]:<40} {row['location']}")
+        return '\n'.join(lines)
+
+    # ========================================
+    # Results
+    # ========================================
+
+    @classmethod
+    def save(cls, name: str, profile: Dict[str, Any]) -> Path:
+        """
+        Save a profile and its top functions.
+
+        Args:
+            name: Test name (made file-safe)
+            profile: CPU profile from stop()
+
+        Returns:
+            Path: The .cpuprofile file (the summary is <name>.top.json next to it)
+        """
+        cls.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        stem = re.sub(r'[^\w.-]+', '_', name).strip('_')
+        path = cls.RESULTS_DIR / f'{stem}.cpuprofile'
+        path.write_text(json.dumps(profile), encoding='utf-8')
+        (cls.RESULTS_DIR / f'{stem}.top.json').write_text(
+            json.dumps(cls.top_functions(profile, top=100), indent=2), encoding='utf-8'
+        )
+        print(f"[CPUProfile] Saved {path}")
+        return path
+
+    @classmethod
+    def clear_saved(cls) -> None:
+        """Remove profiles of a previous run (called once by the controller)."""
+        for pattern in ('*.cpuprofile', '*.top.json'):
+            for path in cls.RESULTS_DIR.glob(pattern):
+                path.unlink()
+
+    @classmethod
+    def load_all(cls) -> List[Dict[str, Any]]:
+        """
+        Merge the saved summaries of all tests and workers.
+
+        Returns:
+            list: Rows as in top_functions(), summed per function, by self time
+        """
+        merged: Dict[tuple, Dict[str, Any]] = {}
+        for path in sorted(cls.RESULTS_DIR.glob('*.top.json')):
+            for row in json.loads(path.read_text(encoding='utf-8')):
+                entry = merged.setdefault((row['function'], row['location']),
+                                          {'function': row['function'], 'location': row['location'],
+                                           'self_ms': 0.0, 'samples': 0})
+                entry['self_ms'] += row['self_ms']
+                entry['samples'] += row['samples']
+
+        busy = sum(entry['self_ms'] for entry in merged.values()) or 1.0
+        rows = sorted(merged.values(), key=lambda row: row['self_ms'], reverse=True)
+        for row in rows:
+            row['self_ms'] = round(row['self_ms'], 3)
+            row['share'] = round(row['self_ms'] / busy, 4)
+        return rows
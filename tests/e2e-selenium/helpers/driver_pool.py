@@ -0,0 +1,157 @@
+"""
+WebDriver Pool for PromptBlocker E2E Tests.
+
+Launching Chrome with the extension takes several seconds, so instead of a
+new browser per test the pool keeps one driver alive for the whole pytest
+session (one per xdist worker) and recycles it between tests:
+
+    acquire() -> test runs -> release() resets extension state
+
+If a reset fails or the browser died during a test, the driver is discarded
+and the next acquire() launches a fresh one. When Chrome starts from a
+signed-in profile snapshot (keep_auth), a test that signed out also gets
+its driver discarded so the next test starts signed in again.
+"""
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from typing import Any, Callable, Dict, Optional
+
+from .selenium_driver import ChromeDriverManager
+from .extension_state import ExtensionState
+
+
+class DriverPool:
+    """
+    Session-scoped pool holding a single reusable WebDriver.
+
+    Example:
+        ```python
+        pool = DriverPool(extension_path, extension_id)
+        driver = pool.acquire()
+        # ... run test ...
+        pool.release(driver)
+        pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        extension_path: str,
+        extension_id: Optional[str] = None,
+        driver_factory: Optional[Callable[[], WebDriver]] = None,
+        keep_auth: bool = False
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            extension_path: Absolute path to the unpacked extension
+            extension_id: ID of the loaded extension. Without it the
+                extension storage can't be reset, so the pool falls back
+                to relaunching Chrome for every test.
+            driver_factory: Callable creating a new driver
+                (defaults to ChromeDriverManager.get_driver)
+            keep_auth: Keep the Firebase session between tests (drivers
+                launched from a signed-in profile snapshot)
+        """
+        self.extension_path = extension_path
+        self.extension_id = extension_id
+        self.driver_factory = driver_factory or (
+            lambda: ChromeDriverManager.get_driver(extension_path)
+        )
+
+        self._driver: Optional[WebDriver] = None
+        self._baseline: Optional[Dict[str, Any]] = None
+        self.keep_auth = keep_auth
+        self.launches = 0
+
+        if not extension_id:
+            print("[Pool] WARNING: No extension ID - relaunching Chrome for every test")
+
+    @property
+    def can_reset(self) -> bool:
+        """Whether extension state can be reset without relaunching."""
+        return bool(self.extension_id)
+
+    def acquire(self) -> WebDriver:
+        """
+        Get a ready-to-use driver, launching Chrome if needed.
+
+        Returns:
+            WebDriver: Driver with the extension in its baseline state
+        """
+        if self._driver is not None and not self._is_alive(self._driver):
+            print("[Pool] Pooled driver is unresponsive - relaunching")
+            self.discard()
+
+        if self._driver is None:
+            self._driver = self.driver_factory()
+            self.launches += 1
+            print(f"[Pool] Launched Chrome (launch #{self.launches})")
+
+            if self.can_reset:
+                self._baseline = ExtensionState(self._driver, self.extension_id).capture()
+                self._driver.get('about:blank')
+
+        return self._driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Return a driver to the pool, resetting extension state.
+
+        Args:
+            driver: Driver previously returned by acquire()
+        """
+        if driver is not self._driver:
+            return
+
+        if not self.can_reset:
+            self.discard()
+            return
+
+        try:
+            signed_in = ExtensionState(driver, self.extension_id).reset(
+                self._baseline, keep_auth=self.keep_auth
+            )
+        except Exception as e:
+            print(f"[Pool] Reset failed, discarding driver: {e}")
+            self.discard()
+            return
+
+        if self.keep_auth and not signed_in:
+            print("[Pool] Test signed out - relaunching from snapshot")
+            self.discard()
+
+    def discard(self) -> None:
+        """Quit the pooled driver so the next acquire() launches a new one."""
+        if self._driver is None:
+            return
+
+        try:
+            self._driver.quit()
+        except Exception as e:
+            print(f"Warning: Error quitting driver: {e}")
+
+        self._driver = None
+        self._baseline = None
+
+    def close(self) -> None:
+        """Shut down the pool at the end of the session."""
+        self.discard()
+        print(f"[Pool] Closed (Chrome launched {self.launches} time(s))")
+
+    @staticmethod
+    def _is_alive(driver: WebDriver) -> bool:
+        """
+        Check that the browser still responds and has an open window.
+
+        Args:
+            driver: Driver to check
+
+        Returns:
+            True if the driver can be reused
+        """
+        try:
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
@@ -0,0 +1,230 @@
+"""
+ChromeDriver Resolver for PromptBlocker E2E Tests.
+
+webdriver-manager does a version lookup and cache probe every time
+install() is called, and fails on air-gapped runners. This resolver pins
+the driver to the locally installed Chrome major version and remembers the
+resolved chromedriver path in a small JSON cache keyed by that version:
+
+    CHROMEDRIVER_PATH env  ->  in-process memo  ->  on-disk cache  ->  download
+
+Only the very first resolution for a Chrome major version touches the
+network, and it downloads the driver for exactly that Chrome version. If
+Chrome's version can't be detected, webdriver-manager picks the driver and
+the result is cached for UNKNOWN_VERSION_TTL, so other processes don't
+repeat the lookup. Every resolution is timed and exposed through `metrics`.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class ChromeDriverResolver:
+    """
+    Resolves (and caches) the chromedriver executable for local Chrome.
+
+    Example:
+        ```python
+        path = ChromeDriverResolver.resolve()
+        service = Service(path)
+        print(ChromeDriverResolver.metrics)
+        ```
+    """
+
+    # Default cache location (override with E2E_DRIVER_CACHE)
+    DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'promptblocker-e2e' / 'chromedriver.json'
+
+    # Chrome executables probed on Linux/macOS (Windows uses the registry)
+    CHROME_BINARIES = [
+        'google-chrome',
+        'google-chrome-stable',
+        'chromium',
+        'chromium-browser',
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    ]
+
+    VERSION_PATTERN = re.compile(r'(\d+)\.\d+\.\d+\.\d+')
+
+    # Cache key and lifetime (seconds) of a driver resolved without a known
+    # Chrome version; expires so a later Chrome upgrade is picked up
+    UNKNOWN_VERSION = 'unknown'
+    UNKNOWN_VERSION_TTL = 24 * 3600
+
+    # Resolution metrics (count, total/last time in seconds, last source)
+    metrics: Dict[str, object] = {
+        'resolutions': 0,
+        'total_seconds': 0.0,
+        'last_seconds': None,
+        'last_source': None,
+    }
+
+    _memo: Dict[str, str] = {}
+    _chrome_version: Optional[str] = None
+
+    @classmethod
+    def resolve(cls) -> str:
+        """
+        Resolve the chromedriver path for the installed Chrome.
+
+        Returns:
+            str: Absolute path to the chromedriver executable
+
+        Raises:
+            RuntimeError: If no cached driver exists and download fails
+        """
+        start = time.perf_counter()
+        path, source = cls._resolve()
+        elapsed = time.perf_counter() - start
+
+        cls.metrics['resolutions'] += 1
+        cls.metrics['total_seconds'] += elapsed
+        cls.metrics['last_seconds'] = elapsed
+        cls.metrics['last_source'] = source
+
+        print(f"[Driver] chromedriver resolved in {elapsed * 1000:.1f} ms ({source}): {path}")
+        return path
+
+    @classmethod
+    def _resolve(cls) -> Tuple[str, str]:
+        """
+        Walk the resolution chain.
+
+        Returns:
+            Tuple of (path, source) where source is one of
+            'env', 'memory', 'cache' or 'download'
+        """
+        env_path = os.getenv('CHROMEDRIVER_PATH')
+        if env_path:
+            return env_path, 'env'
+
+        version = cls.get_chrome_version()
+        key = version.split('.')[0] if version else cls.UNKNOWN_VERSION
+
+        if key in cls._memo:
+            return cls._memo[key], 'memory'
+
+        entry = cls._load_cache().get(key)
+        if entry and Path(entry['path']).is_file() and not cls._expired(entry):
+            cls._memo[key] = entry['path']
+            return entry['path'], 'cache'
+
+        path = cls._download(version)
+        cls._memo[key] = path
+
+        cache = cls._load_cache()
+        cache[key] = {
+            'path': path,
+            'chrome_version': version,
+            'resolved_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'resolved_ts': time.time(),
+        }
+        cls._save_cache(cache)
+
+        return path, 'download'
+
+    @classmethod
+    def _expired(cls, entry: dict) -> bool:
+        """Whether a cache entry for an unknown Chrome version is too old."""
+        if entry.get('chrome_version'):
+            return False
+        return time.time() - entry.get('resolved_ts', 0) > cls.UNKNOWN_VERSION_TTL
+
+    @classmethod
+    def get_chrome_version(cls) -> Optional[str]:
+        """
+        Detect the locally installed Chrome version (memoized).
+
+        Returns:
+            str: Full version (e.g. '131.0.6778.85') or None if not found
+        """
+        if cls._chrome_version is None:
+            cls._chrome_version = cls._detect_chrome_version() or ''
+        return cls._chrome_version or None
+
+    @classmethod
+    def _detect_chrome_version(cls) -> Optional[str]:
+        """Read the Chrome version from the registry or `chrome --version`."""
+        if sys.platform == 'win32':
+            try:
+                import winreg
+                for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                    try:
+                        with winreg.OpenKey(hive, r'Software\Google\Chrome\BLBeacon') as key:
+                            return winreg.QueryValueEx(key, 'version')[0]
+                    except OSError:
+                        continue
+            except ImportError:
+                pass
+            return None
+
+        # Only binaries Selenium itself would launch (no binary_location is set)
+        for binary in cls.CHROME_BINARIES:
+            executable = binary if Path(binary).is_file() else shutil.which(binary)
+            if not executable:
+                continue
+            try:
+                output = subprocess.run(
+                    [executable, '--version'],
+                    capture_output=True, text=True, timeout=10
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = cls.VERSION_PATTERN.search(output)
+            if match:
+                return match.group(0)
+
+        return None
+
+    @classmethod
+    def _download(cls, version: Optional[str]) -> str:
+        """
+        Resolve through webdriver-manager (may use the network).
+
+        Args:
+            version: Detected Chrome version to match (None: let
+                webdriver-manager decide)
+
+        Raises:
+            RuntimeError: With an offline hint if resolution fails
+        """
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager as WDM
+            return WDM(driver_version=version).install()
+        except Exception as e:
+            raise RuntimeError(
+                f"Could not resolve chromedriver ({e}).\n"
+                "Offline runners need a warm cache (run once with network access) "
+                "or CHROMEDRIVER_PATH pointing at a chromedriver binary."
+            ) from e
+
+    @classmethod
+    def cache_file(cls) -> Path:
+        """Path of the on-disk resolution cache."""
+        return Path(os.getenv('E2E_DRIVER_CACHE', cls.DEFAULT_CACHE_FILE))
+
+    @classmethod
+    def _load_cache(cls) -> Dict[str, dict]:
+        """Load the cache file (empty dict if missing or corrupt)."""
+        try:
+            return json.loads(cls.cache_file().read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _save_cache(cls, cache: Dict[str, dict]) -> None:
+        """Write the cache file atomically (safe with parallel workers)."""
+        cache_file = cls.cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_file.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"[Driver] WARNING: Could not write driver cache: {e}")
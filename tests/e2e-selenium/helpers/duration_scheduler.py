@@ -0,0 +1,105 @@
+"""
+Longest-First xdist Scheduling for PromptBlocker E2E runs.
+
+The collection arrives ordered by DurationHistory (priority groups first,
+then longest expected first). xdist's LoadScheduling would still hand every
+worker a chunk of consecutive tests up front, so gw0 gets the two longest
+tests and one worker ends the run alone.
+
+A worker only starts a test once it knows the next one (teardown depends
+on it), so each worker always holds two tests: the running one and the
+next. DurationScheduling keeps exactly two and no more:
+- initial pairs are folded: with N workers, worker k gets test k and test
+  2N-1-k of the first 2N, so every pair holds one long and one shorter test
+- afterwards, each finished test is replaced by the longest test left
+- fewer tests than 2N: everything is sent at once (longest one per worker)
+  and the workers are shut down, since a worker left with a single test
+  would wait for a second one forever
+
+Used through the pytest_xdist_make_scheduler hook (conftest.py) under
+--dist load. Imports xdist, so only import it when xdist is running.
+"""
+
+from xdist.scheduler import LoadScheduling
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    LoadScheduling that hands out a pre-ordered collection one test at a time.
+
+    Example:
+        ```python
+        @pytest.hookimpl(tryfirst=True, optionalhook=True)
+        def pytest_xdist_make_scheduler(config, log):
+            return DurationScheduling(config, log)
+        ```
+    """
+
+    # Tests a worker holds: the running one and the next
+    PER_NODE = 2
+
+    def schedule(self) -> None:
+        """Validate the collections and send each worker its first pair."""
+        assert self.collection_is_completed
+
+        # Workers added later are filled like any finished worker
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+
+        nodes = self.nodes
+        if len(self.pending) < self.PER_NODE * len(nodes):
+            # Fewer tests than slots: send everything now, or a worker holding
+            # a single test would wait for a second one forever. The longest
+            # tests go one per worker; the rest go to the workers with the
+            # shortest first test.
+            first, rest = self.pending[:len(nodes)], self.pending[len(nodes):]
+            for node, index in zip(nodes, first):
+                self._send(node, [index])
+            for node, index in zip(reversed(nodes[:len(first)]), rest):
+                self._send(node, [index])
+            self.pending[:] = []
+        else:
+            head = self.pending[:self.PER_NODE * len(nodes)]
+            del self.pending[:len(head)]
+            for index, node in enumerate(nodes):
+                self._send(node, [head[index], head[-1 - index]])
+
+        if not self.pending:
+            for node in nodes:
+                node.shutdown()
+
+    def _send(self, node, indices) -> None:
+        """Send tests (indices into the collection) to a worker."""
+        self.node2pending[node].extend(indices)
+        node.send_runtest_some(indices)
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        """
+        Top a worker up to PER_NODE tests from the head of the order.
+
+        Args:
+            node: Worker that finished a test (or was added)
+            duration: Duration of the finished test (unused: the order
+                already carries the estimates)
+        """
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            missing = self.PER_NODE - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
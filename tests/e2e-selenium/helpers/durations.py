@@ -0,0 +1,158 @@
+"""
+Test Duration History for PromptBlocker E2E scheduling.
+
+Auth-heavy tests take minutes, most others seconds. Under pytest-xdist
+a long test that starts last keeps one worker busy while the others sit
+idle. DurationHistory remembers how long every test took (setup + call +
+teardown), as an exponential moving average over runs:
+
+    reports/durations.json   {"tests/02_auth/...::test_x": 184.2, ...}
+
+and orders the collection longest-processing-time (LPT) first, so the
+long tests start early and the short ones fill the gaps at the end. Smoke
+and critical tests still run first (each group LPT-ordered). Tests
+without history get a conservative estimate (the 75th percentile of
+known durations), skipped tests count as zero.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from .worker_context import WorkerContext
+
+
+class DurationHistory:
+    """
+    Per-test duration estimates from previous runs.
+
+    Example:
+        ```python
+        history = DurationHistory()
+        items[:] = history.order(items)           # pytest_collection_modifyitems
+        history.record(report)                    # pytest_runtest_logreport
+        history.save()                            # pytest_sessionfinish
+        ```
+    """
+
+    DEFAULT_PATH = WorkerContext.REPORTS_DIR / 'durations.json'
+
+    # Weight of the newest run in the moving average
+    ALPHA = 0.3
+
+    # Estimate for unknown tests when there is no history at all (seconds)
+    DEFAULT_ESTIMATE = 60.0
+    UNKNOWN_PERCENTILE = 75
+
+    # Run first, in this order (marker names)
+    PRIORITY_MARKERS = ['smoke', 'critical']
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Load the history.
+
+        Args:
+            path: History file (default: reports/durations.json)
+        """
+        self.path = Path(path or self.DEFAULT_PATH)
+        try:
+            self.durations: Dict[str, float] = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.durations = {}
+
+        # This run: nodeid -> seconds over all phases, and tests that ran
+        self._observed: Dict[str, float] = {}
+        self._ran: set = set()
+
+    # ========================================
+    # Estimates and Ordering
+    # ========================================
+
+    def unknown_estimate(self) -> float:
+        """Estimate for tests without history (seconds)."""
+        known = sorted(self.durations.values())
+        if not known:
+            return self.DEFAULT_ESTIMATE
+        index = min(len(known) - 1, int(len(known) * self.UNKNOWN_PERCENTILE / 100))
+        return known[index]
+
+    def estimate(self, item: pytest.Item) -> float:
+        """
+        Expected duration of a test.
+
+        Args:
+            item: Collected test
+
+        Returns:
+            float: Seconds (0 for tests marked skip)
+        """
+        if item.get_closest_marker('skip'):
+            return 0.0
+        if item.nodeid in self.durations:
+            return self.durations[item.nodeid]
+        return self.unknown_estimate()
+
+    def order(self, items: List[pytest.Item]) -> List[pytest.Item]:
+        """
+        Order tests: priority groups first, then longest estimate first.
+
+        The result only depends on the collection and the history file, so
+        every xdist worker computes the same order (xdist requires it).
+
+        Args:
+            items: Collected tests
+
+        Returns:
+            list: The same items, reordered
+        """
+        def group(item):
+            for index, marker in enumerate(self.PRIORITY_MARKERS):
+                if marker in item.keywords:
+                    return index
+            return len(self.PRIORITY_MARKERS)
+
+        # sorted() is stable: equal estimates keep collection order
+        return sorted(items, key=lambda item: (group(item), -self.estimate(item)))
+
+    def predicted_total(self, items: List[pytest.Item]) -> float:
+        """Sum of estimates over a collection (seconds)."""
+        return sum(self.estimate(item) for item in items)
+
+    # ========================================
+    # Recording
+    # ========================================
+
+    def record(self, report: pytest.TestReport) -> None:
+        """
+        Add one phase report (setup, call or teardown) of this run.
+
+        Args:
+            report: Report from pytest_runtest_logreport
+        """
+        self._observed[report.nodeid] = self._observed.get(report.nodeid, 0.0) + report.duration
+        if report.when == 'call' and not report.skipped:
+            self._ran.add(report.nodeid)
+
+    def save(self) -> int:
+        """
+        Fold this run's durations into the moving averages and write the file.
+
+        Only tests whose body ran are updated; skipped tests keep their
+        previous estimate.
+
+        Returns:
+            int: Number of tests updated
+        """
+        for nodeid in self._ran:
+            observed = self._observed[nodeid]
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                observed if previous is None else self.ALPHA * observed + (1 - self.ALPHA) * previous, 3
+            )
+
+        if self._ran:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.durations, indent=2, sort_keys=True), encoding='utf-8')
+        return len(self._ran)
@@ -5,12 +5,27 @@ This module provides utilities for interacting with Chrome extension UI
 elements that are outside the page DOM (like the extension toolbar icon).
 """
 
-import pyautogui
 import time
 from pathlib import Path
 from typing import Optional, Tuple
 
 
+class _LazyPyAutoGUI:
+    """
+    Imports PyAutoGUI on first use.
+
+    PyAutoGUI connects to the X display at import time; deferring it lets
+    headless runs import this module and lets Xvfb start first.
+    """
+
+    def __getattr__(self, name):
+        import pyautogui as module
+        return getattr(module, name)
+
+
+pyautogui = _LazyPyAutoGUI()
+
+
 class ExtensionHelper:
     """
     Helper class for Chrome extension interactions using PyAutoGUI.
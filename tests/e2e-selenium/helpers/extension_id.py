@@ -0,0 +1,136 @@
+"""
+Extension ID Resolution for PromptBlocker E2E Tests.
+
+Chrome derives an extension's ID deterministically, so tests never need
+to look it up on chrome://extensions or keep it in .env:
+
+- manifest "key" present:  SHA-256 of the DER public key
+- unpacked, no key:        SHA-256 of the absolute load path
+                           (UTF-8 on POSIX, UTF-16-LE on Windows)
+
+The first 16 bytes of the digest are hex-encoded and mapped 0-f -> a-p.
+For a running browser the ID can also be read from the extension's
+service-worker target via CDP.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class ExtensionId:
+    """
+    Computes and caches extension IDs per dist/ path.
+
+    Example:
+        ```python
+        extension_id = ExtensionId.for_path('/path/to/dist')
+        driver.get(f'chrome-extension://{extension_id}/popup-v2.html')
+        ```
+    """
+
+    # Resolved IDs keyed by real dist/ path
+    _cache: Dict[str, str] = {}
+
+    @classmethod
+    def for_path(cls, extension_path: str) -> str:
+        """
+        Get the ID Chrome assigns to an extension loaded from a directory.
+
+        Uses the manifest "key" when present, otherwise the load path.
+
+        Args:
+            extension_path: Unpacked extension directory (as passed to --load-extension)
+
+        Returns:
+            str: 32-character extension ID
+        """
+        path = os.path.realpath(extension_path)
+        if path not in cls._cache:
+            key = cls._manifest_key(Path(path))
+            cls._cache[path] = cls.from_key(key) if key else cls.from_unpacked_path(path)
+        return cls._cache[path]
+
+    @classmethod
+    def from_key(cls, key: str) -> str:
+        """
+        Compute the ID of an extension from its manifest "key".
+
+        Args:
+            key: Base64-encoded DER public key
+
+        Returns:
+            str: 32-character extension ID
+        """
+        return cls._encode(base64.b64decode(key))
+
+    @classmethod
+    def from_unpacked_path(cls, extension_path: str, windows: Optional[bool] = None) -> str:
+        """
+        Compute the ID Chrome assigns to an unpacked extension without a key.
+
+        Args:
+            extension_path: Absolute extension directory
+            windows: Hash the path the way Chrome on Windows does
+                (default: current platform)
+
+        Returns:
+            str: 32-character extension ID
+        """
+        if windows is None:
+            windows = sys.platform == 'win32'
+
+        if windows:
+            # Chrome normalizes the drive letter and hashes the wide string
+            if len(extension_path) >= 2 and extension_path[1] == ':':
+                extension_path = extension_path[0].upper() + extension_path[1:]
+            data = extension_path.encode('utf-16-le')
+        else:
+            data = extension_path.encode('utf-8')
+
+        return cls._encode(data)
+
+    @staticmethod
+    def from_driver(driver: WebDriver) -> Optional[str]:
+        """
+        Read the ID from the running extension's service-worker target.
+
+        Args:
+            driver: Active WebDriver instance
+
+        Returns:
+            str: Extension ID, or None if no extension service worker is running
+        """
+        try:
+            targets = driver.execute_cdp_cmd('Target.getTargets', {})['targetInfos']
+        except Exception as e:
+            print(f"[ExtensionId] CDP target lookup failed: {e}")
+            return None
+
+        for target in targets:
+            url = target.get('url', '')
+            if target.get('type') == 'service_worker' and url.startswith('chrome-extension://'):
+                return url.split('/')[2]
+
+        return None
+
+    @staticmethod
+    def _manifest_key(extension_path: Path) -> Optional[str]:
+        """Read the "key" field of the extension manifest, if any."""
+        try:
+            manifest = json.loads((extension_path / 'manifest.json').read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return manifest.get('key')
+
+    @staticmethod
+    def _encode(data: bytes) -> str:
+        """First 16 bytes of SHA-256, hex digits mapped to a-p."""
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        return ''.join(chr(ord('a') + int(char, 16)) for char in digest)
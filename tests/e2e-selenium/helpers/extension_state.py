@@ -0,0 +1,188 @@
+"""
+Extension State Helper for PromptBlocker E2E Tests.
+
+This module resets the extension back to a known state between tests
+without relaunching Chrome:
+1. Close stray windows/tabs left behind by the previous test
+2. Clear Firebase auth persistence for the extension origin (optional)
+3. Clear chrome.storage (local, session, sync) and restore a baseline
+4. Reset the AliasEngine in the service worker
+5. Leave the browser on about:blank (same as a freshly launched driver)
+"""
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from typing import Any, Dict, Optional
+
+
+class ExtensionState:
+    """
+    Snapshot and reset helper for the extension's storage.
+
+    chrome.storage is only reachable from an extension page, so every
+    operation here runs inside the popup page via execute_async_script.
+    """
+
+    POPUP_PAGE = 'popup-v2.html'
+
+    # Dumps chrome.storage.local so it can be restored after each test
+    CAPTURE_SCRIPT = """
+        const done = arguments[arguments.length - 1];
+        chrome.storage.local.get(null)
+            .then((items) => done({ ok: true, items }))
+            .catch((error) => done({ ok: false, error: String(error) }));
+    """
+
+    # Clears every storage area, restores the baseline and empties the
+    # in-memory AliasEngine (it keeps the last SET_PROFILES payload otherwise)
+    RESET_SCRIPT = """
+        const baseline = arguments[0];
+        const done = arguments[arguments.length - 1];
+        (async () => {
+            await chrome.storage.local.clear();
+            if (chrome.storage.session) {
+                await chrome.storage.session.clear();
+            }
+            await chrome.storage.sync.clear();
+            if (baseline && Object.keys(baseline).length > 0) {
+                await chrome.storage.local.set(baseline);
+            }
+            try {
+                await chrome.runtime.sendMessage({ type: 'SET_PROFILES', payload: [] });
+            } catch (error) {
+                // Service worker may be asleep - it starts with no profiles anyway
+            }
+            done({ ok: true });
+        })().catch((error) => done({ ok: false, error: String(error) }));
+    """
+
+    # Is a Firebase user persisted for the extension origin?
+    # (checks without creating the database if it doesn't exist)
+    HAS_AUTH_SCRIPT = """
+        const done = arguments[arguments.length - 1];
+        (async () => {
+            const databases = await indexedDB.databases();
+            if (!databases.some((db) => db.name === 'firebaseLocalStorageDb')) return false;
+            return await new Promise((resolve) => {
+                const request = indexedDB.open('firebaseLocalStorageDb');
+                request.onerror = () => resolve(false);
+                request.onsuccess = () => {
+                    const db = request.result;
+                    if (!db.objectStoreNames.contains('firebaseLocalStorage')) {
+                        db.close();
+                        return resolve(false);
+                    }
+                    const keys = db.transaction('firebaseLocalStorage')
+                        .objectStore('firebaseLocalStorage').getAllKeys();
+                    keys.onsuccess = () => {
+                        db.close();
+                        resolve(keys.result.some((key) => String(key).startsWith('firebase:authUser:')));
+                    };
+                    keys.onerror = () => { db.close(); resolve(false); };
+                };
+            });
+        })().then(done, () => done(false));
+    """
+
+    def __init__(self, driver: WebDriver, extension_id: str):
+        """
+        Initialize the extension state helper.
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+        """
+        self.driver = driver
+        self.extension_id = extension_id
+
+    @property
+    def origin(self) -> str:
+        """Origin of the extension's pages (chrome-extension://<id>)."""
+        return f"chrome-extension://{self.extension_id}"
+
+    @property
+    def popup_url(self) -> str:
+        """Full URL of the extension popup page."""
+        return f"{self.origin}/{self.POPUP_PAGE}"
+
+    def close_stray_windows(self) -> str:
+        """
+        Close every window except the first one and switch to it.
+
+        Returns:
+            Window handle of the remaining window
+        """
+        handles = self.driver.window_handles
+        keep = handles[0]
+
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+
+        self.driver.switch_to.window(keep)
+        return keep
+
+    def capture(self) -> Dict[str, Any]:
+        """
+        Capture the current contents of chrome.storage.local.
+
+        Returns:
+            Dictionary of all stored items
+        """
+        self.driver.get(self.popup_url)
+        result = self.driver.execute_async_script(self.CAPTURE_SCRIPT)
+
+        if not result or not result.get('ok'):
+            raise RuntimeError(f"Could not read chrome.storage: {result}")
+
+        return result['items'] or {}
+
+    def clear_auth(self) -> None:
+        """
+        Clear Firebase auth persistence (IndexedDB + localStorage) for the
+        extension origin, signing the test user out.
+        """
+        self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+            'origin': self.origin,
+            'storageTypes': 'indexeddb,local_storage'
+        })
+
+    def has_auth(self) -> bool:
+        """
+        Check whether a Firebase user is persisted for the extension.
+
+        Must be called while an extension page is loaded.
+
+        Returns:
+            True if a signed-in session will be restored on popup load
+        """
+        return bool(self.driver.execute_async_script(self.HAS_AUTH_SCRIPT))
+
+    def reset(self, baseline: Optional[Dict[str, Any]] = None, keep_auth: bool = False) -> bool:
+        """
+        Reset the extension to the baseline state.
+
+        Args:
+            baseline: chrome.storage.local contents to restore (None = empty)
+            keep_auth: Keep the signed-in Firebase session instead of clearing it
+
+        Returns:
+            True if a signed-in session survived the reset (keep_auth only)
+
+        Raises:
+            RuntimeError: If the storage reset script fails
+        """
+        self.close_stray_windows()
+
+        if not keep_auth:
+            self.clear_auth()
+
+        self.driver.get(self.popup_url)
+        result = self.driver.execute_async_script(self.RESET_SCRIPT, baseline or {})
+
+        if not result or not result.get('ok'):
+            raise RuntimeError(f"Extension state reset failed: {result}")
+
+        signed_in = keep_auth and self.has_auth()
+
+        self.driver.get('about:blank')
+        return signed_in
@@ -0,0 +1,223 @@
+"""
+Fetch Interception Benchmarks for PromptBlocker performance tests.
+
+inject.js replaces window.fetch on protected platforms; every AI request
+then makes a round-trip through the content script to the service worker
+for the request body (SUBSTITUTE_REQUEST) and another for the response
+(SUBSTITUTE_RESPONSE) before the page sees it. This module measures what
+that costs: the same requests to MockPlatformServer.ECHO_PATH are timed
+through the wrapped window.fetch and through window.__nativeFetch, on the
+platform page itself, in alternating rounds so both see the same machine
+state.
+
+The added overhead is reported as the difference of the two latency
+distributions at each percentile (wrapped p50 - native p50, ...).
+Results are appended to reports/benchmarks/fetch/<worker>.jsonl and
+printed as a table at the end of a performance run.
+"""
+
+from typing import Any, Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .benchmark_store import BenchmarkStore
+from .stats import Stats
+from .worker_context import WorkerContext
+
+
+class FetchOverheadBenchmark(BenchmarkStore):
+    """
+    Times page requests through the extension's fetch wrapper and natively.
+
+    Example:
+        ```python
+        driver.get('https://chatgpt.com')         # mock platform page
+        bench = FetchOverheadBenchmark(driver)
+        result = bench.run(body, requests=50, concurrency=4)
+        print(result['overhead']['p95_ms'])
+        ```
+    """
+
+    RESULTS_DIR = WorkerContext.REPORTS_DIR / 'benchmarks' / 'fetch'
+
+    MODES = ['native', 'wrapped']
+
+    REQUESTS = 50
+    ROUNDS = 5
+    WARMUP_REQUESTS = 2
+
+    SCRIPT_TIMEOUT = 600
+
+    # Runs `rounds` alternating native/wrapped rounds of requests/rounds
+    # requests each, `concurrency` in flight; every sample includes reading
+    # the full response body (where the wrapper decodes it)
+    LOOP_SCRIPT = """
+        const [url, body, requests, concurrency, rounds, warmup] = arguments;
+        const done = arguments[arguments.length - 1];
+        const clients = { native: window.__nativeFetch, wrapped: window.fetch };
+        const options = { method: 'POST', headers: { 'Content-Type': 'application/json' }, body };
+
+        const once = async (client) => {
+            const t0 = performance.now();
+            const response = await client(url, options);
+            await response.text();
+            return performance.now() - t0;
+        };
+
+        const round = async (client, count) => {
+            const samples = [];
+            let started = 0;
+            const worker = async () => {
+                while (started < count) {
+                    started++;
+                    samples.push(await once(client));
+                }
+            };
+            const t0 = performance.now();
+            await Promise.all(Array.from({ length: Math.min(concurrency, count) }, worker));
+            return { samples, elapsed: performance.now() - t0 };
+        };
+
+        (async () => {
+            if (clients.native === clients.wrapped) throw new Error('window.fetch is not wrapped (inject.js missing)');
+
+            const results = { native: { samples: [], elapsed: 0 }, wrapped: { samples: [], elapsed: 0 } };
+            for (const mode of Object.keys(clients)) {
+                for (let i = 0; i < warmup; i++) await once(clients[mode]);
+            }
+
+            for (let r = 0; r < rounds; r++) {
+                const count = Math.ceil(requests / rounds);
+                // Alternate which mode goes first so neither always runs on a warmer connection
+                const order = r % 2 ? ['wrapped', 'native'] : ['native', 'wrapped'];
+                for (const mode of order) {
+                    const { samples, elapsed } = await round(clients[mode], count);
+                    results[mode].samples.push(...samples);
+                    results[mode].elapsed += elapsed;
+                }
+            }
+            return results;
+        })().then(done).catch((error) => done({ error: String(error) }));
+    """
+
+    # One request through the wrapper, returning what reached the page
+    PROBE_SCRIPT = """
+        const [url, body] = arguments;
+        const done = arguments[arguments.length - 1];
+        fetch(url, { method: 'POST', headers: { 'Content-Type': 'application/json' }, body })
+            .then((response) => response.text())
+            .then((text) => done({ text }))
+            .catch((error) => done({ error: String(error) }));
+    """
+
+    def __init__(self, driver: WebDriver, url: str = 'https://chatgpt.com/backend-api/conversation/echo'):
+        """
+        Initialize the benchmark on the current (protected platform) page.
+
+        Args:
+            driver: Selenium WebDriver instance, on a page inject.js wraps
+            url: Echo endpoint matched by inject.js
+        """
+        self.driver = driver
+        self.url = url
+
+    def probe(self, body: str) -> str:
+        """
+        Send one request through the wrapped fetch.
+
+        Args:
+            body: Request body
+
+        Returns:
+            str: Response text as the page sees it (echo of the substituted body)
+
+        Raises:
+            RuntimeError: If the request fails (e.g. blocked by the extension)
+        """
+        result = self.driver.execute_async_script(self.PROBE_SCRIPT, self.url, body)
+        if not result or 'error' in result:
+            raise RuntimeError(f"Wrapped fetch failed: {result}")
+        return result['text']
+
+    def run(self, body: str, requests: int = REQUESTS, concurrency: int = 1,
+            rounds: int = ROUNDS, warmup: int = WARMUP_REQUESTS) -> Dict[str, Any]:
+        """
+        Benchmark one payload through both fetch implementations.
+
+        Args:
+            body: Request body (echoed back as the response)
+            requests: Timed requests per mode
+            concurrency: Requests in flight at once
+            rounds: Alternating native/wrapped rounds
+            warmup: Untimed requests per mode first
+
+        Returns:
+            dict: 'native' and 'wrapped' statistics (Stats.summarize)
+                and 'overhead' (per-percentile differences in ms)
+
+        Raises:
+            RuntimeError: If the loop fails
+        """
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            result = self.driver.execute_async_script(
+                self.LOOP_SCRIPT, self.url, body, requests, concurrency, max(1, rounds), warmup
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if not result or result.get('error'):
+            raise RuntimeError(f"Fetch benchmark loop failed: {result}")
+
+        stats = {mode: Stats.summarize(result[mode]['samples'], result[mode]['elapsed'])
+                 for mode in self.MODES}
+        stats['overhead'] = self.overhead(result['native']['samples'], result['wrapped']['samples'])
+        return stats
+
+    @staticmethod
+    def overhead(native: List[float], wrapped: List[float]) -> Dict[str, float]:
+        """
+        Latency added by the wrapper at each percentile.
+
+        Args:
+            native: Native fetch latencies in ms
+            wrapped: Wrapped fetch latencies in ms
+
+        Returns:
+            dict: mean/p50/p95/p99 differences in ms, and the p50 ratio
+        """
+        percentile = Stats.percentile
+        native_p50 = percentile(native, 50)
+        return {
+            'mean_ms': round(sum(wrapped) / len(wrapped) - sum(native) / len(native), 3),
+            **{f'p{p}_ms': round(percentile(wrapped, p) - percentile(native, p), 3) for p in (50, 95, 99)},
+            'p50_ratio': round(percentile(wrapped, 50) / native_p50, 2) if native_p50 else 0.0,
+        }
+
+    # ========================================
+    # Results
+    # ========================================
+
+    @staticmethod
+    def report(records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Format fetch benchmark records as a table.
+
+        Args:
+            records: Records with 'name' and run() fields
+
+        Returns:
+            list: Report lines
+        """
+        lines = [f"  {'case':<24} {'n':>5} {'native p50':>11} {'wrapped p50':>12} "
+                 f"{'+p50 ms':>9} {'+p95 ms':>9} {'+p99 ms':>9} {'x p50':>6}"]
+        for record in sorted(records, key=lambda r: (r['size'], r['concurrency'])):
+            overhead = record['overhead']
+            lines.append(
+                f"  {record['name'][:24]:<24} {record['wrapped']['iterations']:>5} "
+                f"{record['native']['p50_ms']:>11.2f} {record['wrapped']['p50_ms']:>12.2f} "
+                f"{overhead['p50_ms']:>9.2f} {overhead['p95_ms']:>9.2f} {overhead['p99_ms']:>9.2f} "
+                f"{overhead['p50_ratio']:>6.1f}"
+            )
+        return lines
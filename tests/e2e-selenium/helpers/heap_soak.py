@@ -0,0 +1,192 @@
+"""
+Long-session memory soak for PromptBlocker E2E tests.
+
+Users keep chat tabs open for days, so a few retained objects per prompt
+add up. HeapSoak sends prompts through the mock ChatGPT page
+(window.__mockChat.send, i.e. content script + inject.js + service worker)
+for a fixed duration and, at a fixed interval, forces a GC and samples
+the JS heap of two targets over CDP:
+
+    page     the chat tab (content.ts bundle and inject.js live here)
+    worker   the extension service worker (background.js)
+
+The retained growth per 1000 prompts is the least-squares slope of those
+samples. Heap snapshots taken after warm-up and at the end are summarized
+per constructor, so a failing run can show what grew.
+
+The mock page appends every message to its thread; the soak empties the
+thread after each prompt so the page's own DOM doesn't count as growth.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .cdp import CDPSession
+from .mock_platform import MockPlatformServer
+from .readiness import Readiness
+from .stats import Stats
+
+
+class HeapSoak:
+    """
+    Drives the mock chat page for a while and tracks heap growth.
+
+    Example:
+        ```python
+        soak = HeapSoak(driver, extension_id, duration=600, interval=15)
+        result = soak.run(['My name is ...', ...])
+        print(result['growth_per_1k_bytes'])   # {'page': ..., 'worker': ...}
+        ```
+    """
+
+    TARGETS = ['page', 'worker']
+
+    WARMUP_PROMPTS = 20
+
+    # Sends one prompt and waits for the reply, then empties the thread
+    SEND_SCRIPT = """
+        const [text] = arguments;
+        const done = arguments[arguments.length - 1];
+        window.__mockChat.send(text)
+            .then((reply) => {
+                document.getElementById('thread').replaceChildren();
+                done({ reply });
+            })
+            .catch((error) => done({ error: String(error) }));
+    """
+
+    def __init__(self, driver: WebDriver, extension_id: str, duration: float = 600,
+                 interval: float = 15, url: str = 'https://chatgpt.com',
+                 server: Optional[MockPlatformServer] = None):
+        """
+        Initialize the soak.
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+            duration: Seconds to send prompts for (after warm-up)
+            interval: Seconds between heap samples
+            url: Mock chat page
+            server: Mock server; its recorded requests are dropped at every
+                sample so the recording doesn't grow for the whole soak
+        """
+        self.driver = driver
+        self.extension_id = extension_id
+        self.duration = duration
+        self.interval = interval
+        self.url = url
+        self.server = server
+        self.sessions: Dict[str, CDPSession] = {}
+
+    def open(self) -> None:
+        """Load the chat page and attach to the page and the service worker."""
+        ready = Readiness(self.driver)
+        self.driver.get(self.url)
+        ready.platform_page()
+
+        self.sessions = {
+            'page': CDPSession.for_page(self.driver),
+            'worker': CDPSession.for_service_worker(self.driver, self.extension_id),
+        }
+
+    def close(self) -> None:
+        """Detach the CDP sessions."""
+        for session in self.sessions.values():
+            session.close()
+        self.sessions = {}
+
+    def send(self, text: str) -> str:
+        """
+        Send one prompt through the chat page.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            str: Assistant reply as the page rendered it
+
+        Raises:
+            RuntimeError: If the prompt fails
+        """
+        result = self.driver.execute_async_script(self.SEND_SCRIPT, text)
+        if not result or 'error' in result:
+            raise RuntimeError(f"Soak prompt failed: {result}")
+        return result['reply']
+
+    def sample(self) -> Dict[str, int]:
+        """
+        Heap in use per target after a forced GC (retained memory).
+
+        Returns:
+            dict: target -> usedSize in bytes
+        """
+        used = {}
+        for target, session in self.sessions.items():
+            session.collect_garbage()
+            used[target] = session.heap_usage()['usedSize']
+        return used
+
+    def summaries(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Per-constructor heap snapshot summary of every target."""
+        return {target: CDPSession.summarize_snapshot(session.heap_snapshot())
+                for target, session in self.sessions.items()}
+
+    def run(self, prompts: List[str], warmup: int = WARMUP_PROMPTS) -> Dict[str, Any]:
+        """
+        Send prompts (cycled) for `duration` seconds, sampling every `interval`.
+
+        Args:
+            prompts: Prompt texts
+            warmup: Prompts sent before the baseline (caches, JIT, lazy init)
+
+        Returns:
+            dict: 'prompts' (sent after warm-up), 'duration_s', 'samples'
+                (per target, {'messages': prompts, 'bytes'} points),
+                'growth_per_1k_bytes' (per target) and 'diff' (per target,
+                constructors that grew most between the snapshots)
+        """
+        if not self.sessions:
+            self.open()
+
+        for index in range(warmup):
+            self.send(prompts[index % len(prompts)])
+
+        before = self.summaries()
+        samples: Dict[str, List[Dict[str, int]]] = {target: [] for target in self.sessions}
+
+        def record(count: int) -> None:
+            if self.server:
+                self.server.clear()
+            used = self.sample()
+            for target, size in used.items():
+                samples[target].append({'messages': count, 'bytes': size})
+            print(f"[Soak] {count} prompts: " + ', '.join(f"{t} {b / 1024:.0f} KB" for t, b in used.items()))
+
+        sent = 0
+        started = time.monotonic()
+        next_sample = started
+        while True:
+            now = time.monotonic()
+            if now >= next_sample:
+                record(sent)
+                next_sample = now + self.interval
+            if now - started >= self.duration:
+                break
+            self.send(prompts[sent % len(prompts)])
+            sent += 1
+
+        if samples[self.TARGETS[0]][-1]['messages'] != sent:
+            record(sent)
+        after = self.summaries()
+
+        return {
+            'prompts': sent,
+            'duration_s': round(time.monotonic() - started, 1),
+            'samples': samples,
+            'growth_per_1k_bytes': {target: Stats.growth_per_1k(points)
+                                    for target, points in samples.items()},
+            'diff': {target: CDPSession.diff_summaries(before[target], after[target])
+                     for target in self.sessions},
+        }
@@ -0,0 +1,772 @@
+"""
+Mock AI Platform Server for PromptBlocker E2E Tests.
+
+Substitution tests don't need the real chatgpt.com - they need a page on a
+host the extension protects, and an endpoint that receives the request
+body after inject.js has substituted it. This module serves both locally:
+
+    Chrome --host-resolver-rules   MAP chatgpt.com -> 127.0.0.1:<port>
+           |
+           v
+    MockPlatformServer (HTTPS, self-signed)
+      GET  /                               minimal chat UI
+      POST /backend-api/conversation       ChatGPT-shaped SSE reply
+      POST /backend-api/conversation/echo  request body echoed back (benchmarks)
+      POST /backend-api/conversation/stream  tokens streamed at a set rate (benchmarks)
+      GET  /c/api/chat (WebSocket)         Copilot chat socket, echoes messages
+      GET  /c/api/echo (WebSocket)         same, on a path inject.js doesn't intercept
+      POST /_/BardChatUi/data/.../StreamGenerate  Gemini f.req form post (XHR), Gemini-shaped reply
+      POST /_/GeminiEcho/data/StreamGenerate       same, on a path inject.js doesn't intercept
+
+The browser still sees https://chatgpt.com, so the manifest content script
+matches, ServiceDetector reports 'chatgpt' and textProcessor.detectFormat
+sees the real `messages[].content.parts` shape. Every request body is
+recorded so tests can assert on what actually left the browser.
+"""
+
+import base64
+import hashlib
+import json
+import ssl
+import struct
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+# Minimal ChatGPT-like UI. window.__mockChat.send() goes through
+# window.fetch, so it is intercepted by inject.js like the real app.
+CHAT_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>ChatGPT (mock)</title>
+  <style>
+    body { font-family: sans-serif; margin: 0 auto; max-width: 760px; }
+    [data-message-author-role] { padding: 8px 0; white-space: pre-wrap; }
+    #prompt-textarea { width: 100%; min-height: 60px; }
+  </style>
+</head>
+<body>
+  <main id="thread"></main>
+  <form id="composer">
+    <textarea id="prompt-textarea" placeholder="Message ChatGPT"></textarea>
+    <button id="send-button" data-testid="send-button" type="submit">Send</button>
+  </form>
+  <script>
+    (function() {
+      const thread = document.getElementById('thread');
+      const input = document.getElementById('prompt-textarea');
+      let parentMessageId = crypto.randomUUID();
+
+      function append(role, text) {
+        const div = document.createElement('div');
+        div.setAttribute('data-message-author-role', role);
+        div.textContent = text;
+        thread.appendChild(div);
+      }
+
+      function lastMessageText(sse) {
+        let text = '';
+        for (const line of sse.split('\\n')) {
+          if (!line.startsWith('data: ') || line === 'data: [DONE]') continue;
+          try {
+            text = JSON.parse(line.slice(6)).message.content.parts.join('');
+          } catch (e) {
+            // Ignore partial/non-message events
+          }
+        }
+        return text;
+      }
+
+      window.__mockChat = {
+        async send(text) {
+          append('user', text);
+          const messageId = crypto.randomUUID();
+          const response = await fetch('/backend-api/conversation', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
+            body: JSON.stringify({
+              action: 'next',
+              messages: [{
+                id: messageId,
+                author: { role: 'user' },
+                content: { content_type: 'text', parts: [text] },
+                metadata: {}
+              }],
+              parent_message_id: parentMessageId,
+              model: 'auto'
+            })
+          });
+          parentMessageId = messageId;
+          const reply = lastMessageText(await response.text());
+          append('assistant', reply);
+          return reply;
+        }
+      };
+
+      document.getElementById('composer').addEventListener('submit', (event) => {
+        event.preventDefault();
+        const text = input.value;
+        input.value = '';
+        window.__mockChat.send(text);
+      });
+    })();
+  </script>
+</body>
+</html>
+"""
+
+
+class WebSocketConnection:
+    """
+    Server side of an accepted WebSocket (RFC 6455).
+
+    Supports text and binary messages (including fragmented ones),
+    ping/pong and the closing handshake - enough to stand in for chat
+    sockets. Iterating yields messages until the client closes.
+    """
+
+    GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+    OP_CONTINUATION, OP_TEXT, OP_BINARY = 0x0, 0x1, 0x2
+    OP_CLOSE, OP_PING, OP_PONG = 0x8, 0x9, 0xA
+
+    def __init__(self, rfile, wfile):
+        """
+        Initialize the connection on an upgraded HTTP stream.
+
+        Args:
+            rfile: Readable stream of the HTTP handler
+            wfile: Writable stream of the HTTP handler
+        """
+        self.rfile = rfile
+        self.wfile = wfile
+        self.closed = False
+        self._send_lock = threading.Lock()
+
+    @classmethod
+    def accept_key(cls, key: str) -> str:
+        """Sec-WebSocket-Accept value for a client's Sec-WebSocket-Key."""
+        return base64.b64encode(hashlib.sha1((key + cls.GUID).encode('ascii')).digest()).decode('ascii')
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        while True:
+            message = self.receive()
+            if message is None:
+                return
+            yield message
+
+    def receive(self) -> Optional[Union[str, bytes]]:
+        """
+        Wait for the next message.
+
+        Returns:
+            str (text) or bytes (binary), or None once the connection is closed
+        """
+        fragments: List[bytes] = []
+        message_opcode = None
+
+        while not self.closed:
+            frame = self._read_frame()
+            if frame is None:
+                self.closed = True
+                return None
+            fin, opcode, payload = frame
+
+            if opcode == self.OP_PING:
+                self._write_frame(self.OP_PONG, payload)
+            elif opcode == self.OP_PONG:
+                continue
+            elif opcode == self.OP_CLOSE:
+                self.close(payload[:2] if len(payload) >= 2 else b'')
+                return None
+            else:
+                if opcode != self.OP_CONTINUATION:
+                    message_opcode = opcode
+                fragments.append(payload)
+                if fin:
+                    data = b''.join(fragments)
+                    return data.decode('utf-8') if message_opcode == self.OP_TEXT else data
+
+        return None
+
+    def send(self, message: Union[str, bytes]) -> None:
+        """Send a text (str) or binary (bytes) message."""
+        if isinstance(message, str):
+            self._write_frame(self.OP_TEXT, message.encode('utf-8'))
+        else:
+            self._write_frame(self.OP_BINARY, message)
+
+    def close(self, code: bytes = b'') -> None:
+        """Send a close frame (echoing the client's status code) and stop."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._write_frame(self.OP_CLOSE, code or struct.pack('!H', 1000))
+        except OSError:
+            pass
+
+    def _read_exact(self, size: int) -> Optional[bytes]:
+        """Read exactly `size` bytes (None if the stream ends first)."""
+        data = self.rfile.read(size) if size else b''
+        return data if len(data) == size else None
+
+    def _read_frame(self):
+        """Read one frame: (fin, opcode, unmasked payload), None on EOF."""
+        try:
+            header = self._read_exact(2)
+            if header is None:
+                return None
+            fin, opcode = header[0] & 0x80, header[0] & 0x0F
+            masked, length = header[1] & 0x80, header[1] & 0x7F
+
+            if length == 126:
+                extended = self._read_exact(2)
+                length = struct.unpack('!H', extended)[0] if extended else None
+            elif length == 127:
+                extended = self._read_exact(8)
+                length = struct.unpack('!Q', extended)[0] if extended else None
+            if length is None:
+                return None
+
+            mask = self._read_exact(4) if masked else b''
+            payload = self._read_exact(length)
+            if payload is None or mask is None:
+                return None
+        except (OSError, ValueError):
+            return None
+
+        if masked and length:
+            # XOR with the repeated 4-byte key, as one big integer (fast for large frames)
+            key = (mask * (length // 4 + 1))[:length]
+            payload = (int.from_bytes(payload, 'big') ^ int.from_bytes(key, 'big')).to_bytes(length, 'big')
+        return bool(fin), opcode, payload
+
+    def _write_frame(self, opcode: int, payload: bytes) -> None:
+        """Write one unmasked, unfragmented frame (servers never mask)."""
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+
+        with self._send_lock:
+            self.wfile.write(header + payload)
+            self.wfile.flush()
+
+
+class MockPlatformServer:
+    """
+    Local HTTPS server impersonating AI platforms.
+
+    Example:
+        ```python
+        server = MockPlatformServer()
+        server.start()
+        driver = ChromeDriverManager.get_driver(
+            extension_path, extra_arguments=server.chrome_arguments()
+        )
+        driver.get('https://chatgpt.com')  # served by the mock
+        driver.execute_script("window.__mockChat.send('My name is John Smith')")
+        body = server.wait_for_request(MockPlatformServer.CONVERSATION_PATH)['json']
+        server.stop()
+        ```
+    """
+
+    # Hosts mapped to the mock (content script + ServiceDetector match these)
+    DEFAULT_HOSTS = ['chatgpt.com', 'chat.openai.com', 'copilot.microsoft.com', 'gemini.google.com']
+
+    CONVERSATION_PATH = '/backend-api/conversation'
+
+    # Intercepted by inject.js (URL contains 'backend-api/conversation')
+    ECHO_PATH = '/backend-api/conversation/echo'
+    STREAM_PATH = '/backend-api/conversation/stream'
+
+    # Copilot chat socket (intercepted by inject.js: URL contains '/c/api/chat')
+    # and an identical echo socket it passes through
+    COPILOT_CHAT_PATH = '/c/api/chat'
+    WS_ECHO_PATH = '/c/api/echo'
+
+    # Gemini prompt endpoint (XHR, intercepted by inject.js: URL contains
+    # 'BardChatUi') and an identical endpoint it passes through
+    GEMINI_GENERATE_PATH = '/_/BardChatUi/data/assistant.lamda.BardFrontendService/StreamGenerate'
+    GEMINI_ECHO_PATH = '/_/GeminiEcho/data/StreamGenerate'
+
+    def __init__(self, hosts: Optional[Iterable[str]] = None, port: int = 0):
+        """
+        Initialize the mock server (call start() to serve).
+
+        Args:
+            hosts: Host names to impersonate (default: DEFAULT_HOSTS, i.e. ChatGPT, Copilot and Gemini)
+            port: Port to listen on (0 = pick a free port)
+        """
+        self.hosts = list(hosts or self.DEFAULT_HOSTS)
+        self.port = port
+
+        # Recorded requests: method, host, path, query, headers, body, json, time
+        self.requests: List[Dict[str, Any]] = []
+        self._received = threading.Condition()
+
+        # Routes: (host or '*', method, path) -> handler(http_handler, request)
+        self._routes: Dict[tuple, Callable] = {}
+        self._unrecorded: set = set()
+
+        # Assistant reply for a given user prompt (override per test)
+        self.reply: Callable[[str], str] = lambda prompt: f"You said: {prompt}"
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.add_route('GET', '/', self._chat_page)
+        self.add_route('POST', self.CONVERSATION_PATH, self._conversation)
+        self.add_route('POST', self.ECHO_PATH, self._echo, record=False)
+        self.add_route('POST', self.STREAM_PATH, self._stream, record=False)
+        self.add_route('GET', self.COPILOT_CHAT_PATH, self._websocket_echo)
+        self.add_route('GET', self.WS_ECHO_PATH, self._websocket_echo)
+        self.add_route('POST', self.GEMINI_GENERATE_PATH, self._gemini_generate)
+        self.add_route('POST', self.GEMINI_ECHO_PATH, self._gemini_generate, record=False)
+
+    # ========================================
+    # Lifecycle
+    # ========================================
+
+    def start(self) -> 'MockPlatformServer':
+        """
+        Start serving HTTPS on a background thread.
+
+        Returns:
+            self (for chaining)
+        """
+        server = ThreadingHTTPServer(('127.0.0.1', self.port), self._make_handler())
+        server.daemon_threads = True
+
+        # Handshake lazily in the handler thread so a stalled client
+        # can't block accept() for everyone else
+        server.socket = self._ssl_context().wrap_socket(
+            server.socket, server_side=True, do_handshake_on_connect=False
+        )
+
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(target=server.serve_forever, daemon=True)
+        self._thread.start()
+
+        print(f"[Mock] Serving {', '.join(self.hosts)} on 127.0.0.1:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and its thread."""
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+        self._server = None
+        print(f"[Mock] Stopped ({len(self.requests)} request(s) served)")
+
+    def chrome_arguments(self) -> List[str]:
+        """
+        Chrome switches routing the mocked hosts to this server.
+
+        Returns:
+            List of command-line arguments for ChromeDriverManager.get_driver
+        """
+        rules = ', '.join(f'MAP {host} 127.0.0.1:{self.port}' for host in self.hosts)
+        return [
+            f'--host-resolver-rules={rules}, EXCLUDE localhost',
+            # The certificate is self-signed for the mocked hosts
+            '--ignore-certificate-errors',
+        ]
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        """Create a server TLS context with a certificate for all hosts."""
+        import trustme
+
+        ca = trustme.CA()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ca.issue_cert(*self.hosts).configure_cert(context)
+        context.set_alpn_protocols(['http/1.1'])
+        return context
+
+    # ========================================
+    # Routes
+    # ========================================
+
+    def add_route(self, method: str, path: str, handler: Callable,
+                  host: Optional[str] = None, record: bool = True) -> None:
+        """
+        Register a route handler.
+
+        Args:
+            method: HTTP method (e.g. 'POST')
+            path: Exact request path (query string excluded)
+            handler: Callable(http_handler, request) writing the response
+                with http_handler.send_json/send_text/send_sse
+            host: Only match this Host (default: any mocked host)
+            record: Keep requests in self.requests (off for high-volume
+                benchmark routes)
+        """
+        key = (host or '*', method.upper(), path)
+        self._routes[key] = handler
+        if record:
+            self._unrecorded.discard(key)
+        else:
+            self._unrecorded.add(key)
+
+    def _route_key(self, host: str, method: str, path: str) -> Optional[tuple]:
+        """Key of the route for a request (host-specific routes first)."""
+        for key in ((host, method, path), ('*', method, path)):
+            if key in self._routes:
+                return key
+        return None
+
+    def _chat_page(self, http: BaseHTTPRequestHandler, request: Dict[str, Any]) -> None:
+        """GET / - minimal chat UI."""
+        http.send_text(CHAT_PAGE, content_type='text/html; charset=utf-8')
+
+    def _conversation(self, http: BaseHTTPRequestHandler, request: Dict[str, Any]) -> None:
+        """POST /backend-api/conversation - reply as ChatGPT SSE events."""
+        http.send_sse(self.chatgpt_events(self.reply(self.prompt_text(request))))
+
+    def _echo(self, http: BaseHTTPRequestHandler, request: Dict[str, Any]) -> None:
+        """POST /backend-api/conversation/echo - return the body unchanged."""
+        http.send_text(request['body'], content_type='application/json')
+
+    def _stream(self, http: BaseHTTPRequestHandler, request: Dict[str, Any]) -> None:
+        """
+        POST /backend-api/conversation/stream - stream numbered tokens.
+
+        Query parameters: tokens (count), interval_ms (between tokens),
+        first_ms (delay before the first token) and format ('sse' for
+        text/event-stream, 'chunked' for chunked NDJSON). The body may list
+        the words to stream ({"words": [...]}, cycled).
+        """
+        query = {key: values[0] for key, values in parse_qs(request['query']).items()}
+        words = (request['json'] or {}).get('words') or ['token']
+        tokens = [{'i': i, 't': words[i % len(words)] + ' '} for i in range(int(query.get('tokens', 50)))]
+        interval = float(query.get('interval_ms', 20)) / 1000
+
+        time.sleep(float(query.get('first_ms', 0)) / 1000)
+        if query.get('format', 'sse') == 'chunked':
+            http.send_chunked((json.dumps(token) + '\n' for token in tokens), delay=interval)
+        else:
+            http.send_sse(tokens, delay=interval)
+
+    def _websocket_echo(self, http: BaseHTTPRequestHandler, request: Dict[str, Any]) -> None:
+        """GET /c/api/chat, /c/api/echo (WebSocket) - send every message back."""
+        socket = http.accept_websocket()
+        for message in socket:
+            socket.send(message)
+
+    def _gemini_generate(self, http: BaseHTTPRequestHandler, request: Dict[str, Any]) -> None:
+        """POST .../StreamGenerate - reply as Gemini's batchexecute-style response."""
+        http.send_text(self.gemini_response(self.reply(self.gemini_prompt(request))),
+                       content_type='application/json; charset=utf-8')
+
+    @staticmethod
+    def prompt_text(request: Dict[str, Any]) -> str:
+        """
+        Extract the user prompt from a ChatGPT-shaped request body.
+
+        Args:
+            request: Recorded request
+
+        Returns:
+            str: Text of the last message ('' if the body isn't ChatGPT-shaped)
+        """
+        try:
+            parts = request['json']['messages'][-1]['content']['parts']
+            return ''.join(part for part in parts if isinstance(part, str))
+        except (KeyError, IndexError, TypeError):
+            return ''
+
+    @staticmethod
+    def gemini_form(text: str, token: str = 'AJvLN6M_mock:1700000000000') -> str:
+        """
+        Build a Gemini prompt form body (application/x-www-form-urlencoded).
+
+        Gemini posts `f.req=<json>&at=<token>&`, where f.req is
+        [null, "<inner json>"] and the prompt is the first element of the
+        first list of the inner JSON.
+
+        Args:
+            text: Prompt text
+            token: XSRF token sent as `at`
+
+        Returns:
+            str: Form-encoded request body
+        """
+        compact = (',', ':')
+        inner = json.dumps([[text, 0, None, None, None, None, 0], ['en'], ['', '', ''],
+                            None, None, None, [1], 0, []], separators=compact)
+        return urlencode({'f.req': json.dumps([None, inner], separators=compact), 'at': token}) + '&'
+
+    @staticmethod
+    def gemini_prompt(request: Dict[str, Any]) -> str:
+        """
+        Extract the prompt from a Gemini f.req form body.
+
+        Args:
+            request: Recorded request
+
+        Returns:
+            str: Prompt text ('' if the body isn't a Gemini prompt form)
+        """
+        try:
+            outer = json.loads(parse_qs(request['body'])['f.req'][0])
+            return json.loads(outer[1])[0][0]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return ''
+
+    @staticmethod
+    def gemini_response(text: str) -> str:
+        """
+        Build a Gemini StreamGenerate response for a reply.
+
+        The body starts with the )]}' XSSI guard, followed by length-prefixed
+        JSON chunks; the reply is inside a JSON string in a "wrb.fr" entry.
+
+        Args:
+            text: Full assistant reply
+
+        Returns:
+            str: Response body
+        """
+        compact = (',', ':')
+        inner = json.dumps([None, ['c_mock', 'r_mock'], None, None,
+                            [['rc_mock', [text], [], None, None, None, True]]], separators=compact)
+        chunk = json.dumps([['wrb.fr', None, inner]], separators=compact)
+        return f")]}}'\n\n{len(chunk)}\n{chunk}\n"
+
+    @staticmethod
+    def chatgpt_events(text: str, chunks: int = 4) -> List[Any]:
+        """
+        Build ChatGPT conversation SSE events for a reply.
+
+        ChatGPT streams the cumulative message text in each event and ends
+        the stream with [DONE].
+
+        Args:
+            text: Full assistant reply
+            chunks: Number of message events to split the reply into
+
+        Returns:
+            List of event payloads for send_sse()
+        """
+        message_id = str(uuid.uuid4())
+        conversation_id = str(uuid.uuid4())
+        words = text.split(' ')
+        step = max(1, -(-len(words) // chunks))
+
+        events: List[Any] = []
+        for end in range(step, len(words) + step, step):
+            done = end >= len(words)
+            events.append({
+                'message': {
+                    'id': message_id,
+                    'author': {'role': 'assistant'},
+                    'content': {'content_type': 'text', 'parts': [' '.join(words[:end])]},
+                    'status': 'finished_successfully' if done else 'in_progress',
+                    'end_turn': done,
+                },
+                'conversation_id': conversation_id,
+                'error': None,
+            })
+        events.append('[DONE]')
+        return events
+
+    # ========================================
+    # Recorded Requests
+    # ========================================
+
+    def _record(self, request: Dict[str, Any]) -> None:
+        """Store a request and wake up waiters."""
+        with self._received:
+            self.requests.append(request)
+            self._received.notify_all()
+
+    def requests_to(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Get recorded requests for a path.
+
+        Args:
+            path: Exact request path
+
+        Returns:
+            List of recorded requests (oldest first)
+        """
+        with self._received:
+            return [r for r in self.requests if r['path'] == path]
+
+    def wait_for_request(self, path: str, timeout: float = 10) -> Dict[str, Any]:
+        """
+        Wait until a request for a path has been received.
+
+        Args:
+            path: Exact request path
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The most recent matching request
+
+        Raises:
+            TimeoutError: If no matching request arrives in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._received:
+            while True:
+                matching = [r for r in self.requests if r['path'] == path]
+                if matching:
+                    return matching[-1]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No request to {path} within {timeout}s")
+                self._received.wait(remaining)
+
+    def clear(self) -> None:
+        """Forget all recorded requests (call at the start of a test)."""
+        with self._received:
+            self.requests.clear()
+
+    # ========================================
+    # HTTP Handler
+    # ========================================
+
+    def _make_handler(self) -> type:
+        """Build the request handler class bound to this server."""
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            # Small streamed writes must leave immediately (no Nagle batching)
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                self._dispatch()
+
+            def do_POST(self):
+                self._dispatch()
+
+            def do_OPTIONS(self):
+                # CORS preflight (extension pages calling mocked APIs)
+                self.send_response(204)
+                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+                self.send_header('Access-Control-Allow-Headers', '*')
+                self.send_header('Access-Control-Max-Age', '600')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def end_headers(self):
+                self.send_header('Access-Control-Allow-Origin', '*')
+                super().end_headers()
+
+            def _dispatch(self):
+                url = urlsplit(self.path)
+                host = (self.headers.get('Host') or '').split(':')[0]
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode('utf-8', errors='replace') if length else ''
+
+                try:
+                    parsed = json.loads(body) if body else None
+                except ValueError:
+                    parsed = None
+
+                request = {
+                    'method': self.command,
+                    'host': host,
+                    'path': url.path,
+                    'query': url.query,
+                    'headers': dict(self.headers),
+                    'body': body,
+                    'json': parsed,
+                    'time': time.monotonic(),
+                }
+                key = mock._route_key(host, self.command, url.path)
+                if key not in mock._unrecorded:
+                    mock._record(request)
+
+                if key is None:
+                    self.send_text('Not Found', status=404)
+                    return
+
+                try:
+                    mock._routes[key](self, request)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+            def send_text(self, text: str, status: int = 200,
+                          content_type: str = 'text/plain; charset=utf-8',
+                          headers: Optional[Dict[str, str]] = None):
+                data = text.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def send_json(self, payload: Any, status: int = 200,
+                          headers: Optional[Dict[str, str]] = None):
+                self.send_text(json.dumps(payload), status=status,
+                               content_type='application/json', headers=headers)
+
+            def send_sse(self, events: Iterable[Any], delay: float = 0.0):
+                # No Content-Length: the stream ends when the connection closes
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+
+                for event in events:
+                    data = event if isinstance(event, str) else json.dumps(event)
+                    self.wfile.write(f"data: {data}\n\n".encode('utf-8'))
+                    self.wfile.flush()
+                    if delay:
+                        time.sleep(delay)
+
+            def send_chunked(self, chunks: Iterable[str], delay: float = 0.0,
+                             content_type: str = 'application/x-ndjson; charset=utf-8'):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+
+                for chunk in chunks:
+                    data = chunk.encode('utf-8')
+                    self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+                    self.wfile.flush()
+                    if delay:
+                        time.sleep(delay)
+                self.wfile.write(b"0\r\n\r\n")
+
+            def accept_websocket(self) -> WebSocketConnection:
+                key = self.headers.get('Sec-WebSocket-Key')
+                if 'websocket' not in (self.headers.get('Upgrade') or '').lower() or not key:
+                    self.send_text('Expected a WebSocket upgrade', status=426)
+                    raise ConnectionResetError('Not a WebSocket request')
+
+                self.send_response(101, 'Switching Protocols')
+                self.send_header('Upgrade', 'websocket')
+                self.send_header('Connection', 'Upgrade')
+                self.send_header('Sec-WebSocket-Accept', WebSocketConnection.accept_key(key))
+                self.end_headers()
+                self.close_connection = True
+                return WebSocketConnection(self.rfile, self.wfile)
+
+            def log_message(self, format, *args):
+                pass  # Keep pytest output clean
+
+        return Handler
@@ -0,0 +1,268 @@
+"""
+Profile Seeder for PromptBlocker E2E Tests.
+
+Creating profiles through the popup form costs a modal, a dozen inputs and
+a re-render per profile. The seeder writes any number of profiles in one
+call instead, through the same storage path the popup uses:
+
+1. Encrypt the profile list like StorageProfileManager.saveProfiles()
+   (AES-256-GCM, key derived with PBKDF2 from the signed-in Firebase UID
+   and the stored _encryptionSalt) and store it under 'profiles'
+2. Push the decrypted list to the service worker (SET_PROFILES), exactly
+   like the popup does after every profile change
+
+Everything runs inside the popup page in a single execute_async_script, so
+the key is derived once per call and 1000 profiles take about a second.
+The popup only reads storage on load - reload it to see seeded profiles.
+"""
+
+import copy
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .extension_state import ExtensionState
+from .synthetic import SyntheticCorpus
+
+
+class ProfileSeeder:
+    """
+    Bulk create and remove encrypted profiles for the signed-in user.
+
+    Example:
+        ```python
+        seeder = ProfileSeeder(driver, extension_id)
+        profiles = seeder.seed(1000)          # deterministic synthetic profiles
+        driver.refresh()                      # popup re-reads storage
+        ...
+        seeder.teardown()                     # removes only what was seeded
+        ```
+    """
+
+    # Must match StorageEncryptionManager.getEncryptionKey()
+    PBKDF2_ITERATIONS = 600000
+
+    SCRIPT_TIMEOUT = 120
+
+    # Fields createProfile() fills in that synthetic payloads leave out
+    PROFILE_DEFAULTS = {
+        'metadata': {
+            'usageStats': {
+                'totalSubstitutions': 0,
+                'lastUsed': 0,
+                'byService': {'chatgpt': 0, 'claude': 0, 'gemini': 0, 'perplexity': 0, 'copilot': 0},
+                'byPIIType': {'name': 0, 'email': 0, 'phone': 0, 'cellPhone': 0,
+                              'address': 0, 'company': 0, 'custom': 0},
+            },
+            'confidence': 1,
+        },
+        'settings': {
+            'autoReplace': True,
+            'highlightInUI': True,
+            'activeServices': ['chatgpt', 'claude', 'gemini'],
+            'enableVariations': False,
+        },
+    }
+
+    # Decrypts the stored profiles, removes `removeIds`, appends `add`
+    # (replacing profiles with the same ID), re-encrypts and pushes the
+    # result to the service worker
+    WRITE_SCRIPT = """
+        const [add, removeIds, iterations] = arguments;
+        const done = arguments[arguments.length - 1];
+        const encoder = new TextEncoder();
+
+        const toBase64 = (bytes) => {
+            let binary = '';
+            for (let i = 0; i < bytes.length; i += 0x8000) {
+                binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+            }
+            return btoa(binary);
+        };
+        const fromBase64 = (text) => Uint8Array.from(atob(text), (c) => c.charCodeAt(0));
+
+        const firebaseUid = () => new Promise((resolve, reject) => {
+            const request = indexedDB.open('firebaseLocalStorageDb');
+            request.onerror = () => reject(request.error);
+            request.onsuccess = () => {
+                const db = request.result;
+                if (!db.objectStoreNames.contains('firebaseLocalStorage')) {
+                    db.close();
+                    return resolve(null);
+                }
+                const all = db.transaction('firebaseLocalStorage')
+                    .objectStore('firebaseLocalStorage').getAll();
+                all.onsuccess = () => {
+                    db.close();
+                    const user = all.result.find((entry) => String(entry.fbase_key).startsWith('firebase:authUser:'));
+                    resolve(user && user.value ? user.value.uid : null);
+                };
+                all.onerror = () => { db.close(); reject(all.error); };
+            };
+        });
+
+        (async () => {
+            const uid = await firebaseUid();
+            if (!uid) throw new Error('ENCRYPTION_KEY_UNAVAILABLE: no signed-in Firebase user');
+
+            let { _encryptionSalt: salt } = await chrome.storage.local.get('_encryptionSalt');
+            if (!salt) {
+                salt = toBase64(crypto.getRandomValues(new Uint8Array(16)));
+                await chrome.storage.local.set({ _encryptionSalt: salt });
+            }
+
+            const material = await crypto.subtle.importKey('raw', encoder.encode(uid), 'PBKDF2', false, ['deriveKey']);
+            const key = await crypto.subtle.deriveKey(
+                { name: 'PBKDF2', salt: encoder.encode(salt), iterations, hash: 'SHA-256' },
+                material, { name: 'AES-GCM', length: 256 }, false, ['encrypt', 'decrypt']
+            );
+
+            let profiles = [];
+            const { profiles: stored } = await chrome.storage.local.get('profiles');
+            if (stored) {
+                const combined = fromBase64(stored);
+                const plain = await crypto.subtle.decrypt(
+                    { name: 'AES-GCM', iv: combined.slice(0, 12) }, key, combined.slice(12)
+                );
+                profiles = JSON.parse(new TextDecoder().decode(plain));
+            }
+
+            const replaced = new Set([...removeIds, ...add.map((profile) => profile.id)]);
+            profiles = profiles.filter((profile) => !replaced.has(profile.id)).concat(add);
+
+            const iv = crypto.getRandomValues(new Uint8Array(12));
+            const encrypted = new Uint8Array(await crypto.subtle.encrypt(
+                { name: 'AES-GCM', iv }, key, encoder.encode(JSON.stringify(profiles))
+            ));
+            const combined = new Uint8Array(iv.length + encrypted.length);
+            combined.set(iv);
+            combined.set(encrypted, iv.length);
+            await chrome.storage.local.set({ profiles: toBase64(combined) });
+
+            const response = await chrome.runtime.sendMessage({ type: 'SET_PROFILES', payload: profiles });
+            if (!response || !response.success) {
+                throw new Error(`SET_PROFILES failed: ${JSON.stringify(response)}`);
+            }
+            return { ok: true, total: profiles.length };
+        })().then(done).catch((error) => done({ ok: false, error: String(error) }));
+    """
+
+    def __init__(self, driver: WebDriver, extension_id: str):
+        """
+        Initialize the profile seeder.
+
+        Args:
+            driver: Selenium WebDriver instance
+            extension_id: ID of the loaded extension
+        """
+        self.driver = driver
+        self.state = ExtensionState(driver, extension_id)
+        self.seeded_ids: List[str] = []
+
+    # ========================================
+    # Seed / Teardown
+    # ========================================
+
+    def seed(self, count: Optional[int] = None, profiles: Optional[List[Dict[str, Any]]] = None,
+             seed: int = 0) -> List[Dict[str, Any]]:
+        """
+        Add profiles to the signed-in user's encrypted storage.
+
+        Profiles with the ID of an existing profile replace it.
+
+        Args:
+            count: Number of synthetic profiles (SyntheticCorpus(seed))
+            profiles: Explicit AliasProfile payloads instead of synthetic ones
+            seed: Random seed for synthetic profiles
+
+        Returns:
+            list: The profiles as stored (with createProfile() defaults)
+
+        Raises:
+            ValueError: If neither count nor profiles is given
+            RuntimeError: If nobody is signed in or the write fails
+        """
+        if profiles is None:
+            if count is None:
+                raise ValueError("Pass a profile count or explicit profiles")
+            profiles = SyntheticCorpus(seed).profiles(count)
+
+        profiles = [self.complete(profile) for profile in profiles]
+        total = self._write(profiles, [])
+
+        self.seeded_ids += [p['id'] for p in profiles if p['id'] not in self.seeded_ids]
+        print(f"[Seeder] Seeded {len(profiles)} profile(s) ({total} stored)")
+        return profiles
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """
+        Remove profiles by ID.
+
+        Args:
+            ids: Profile IDs to remove (unknown IDs are ignored)
+
+        Returns:
+            int: Number of profiles left in storage
+        """
+        ids = list(ids)
+        total = self._write([], ids)
+        self.seeded_ids = [i for i in self.seeded_ids if i not in ids]
+        print(f"[Seeder] Removed {len(ids)} profile(s) ({total} stored)")
+        return total
+
+    def teardown(self) -> None:
+        """Remove every profile this seeder created, keeping all others."""
+        if self.seeded_ids:
+            self.remove(self.seeded_ids)
+
+    def _write(self, add: List[Dict[str, Any]], remove_ids: List[str]) -> int:
+        """Run WRITE_SCRIPT in an extension page; returns the stored profile count."""
+        if not self.driver.current_url.startswith(self.state.origin + '/'):
+            self.driver.get(self.state.popup_url)
+
+        start = time.perf_counter()
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            result = self.driver.execute_async_script(
+                self.WRITE_SCRIPT, add, remove_ids, self.PBKDF2_ITERATIONS
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if not result or not result.get('ok'):
+            raise RuntimeError(f"Profile seeding failed: {result}")
+
+        print(f"[Seeder] Wrote encrypted profiles in {time.perf_counter() - start:.2f}s")
+        return result['total']
+
+    # ========================================
+    # Profile Shape
+    # ========================================
+
+    @classmethod
+    def complete(cls, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill in the fields StorageProfileManager.createProfile() sets.
+
+        Args:
+            profile: AliasProfile payload (e.g. from SyntheticCorpus)
+
+        Returns:
+            dict: New profile with defaults for missing metadata/settings
+        """
+        completed = copy.deepcopy(profile)
+        now = int(time.time() * 1000)
+
+        metadata = completed.setdefault('metadata', {})
+        for key in ('createdAt', 'updatedAt'):
+            if not metadata.get(key):
+                metadata[key] = now
+
+        for section, defaults in cls.PROFILE_DEFAULTS.items():
+            values = completed.setdefault(section, {})
+            for key, value in defaults.items():
+                values.setdefault(key, copy.deepcopy(value))
+
+        return completed
@@ -0,0 +1,224 @@
+"""
+Chrome Profile Snapshots for PromptBlocker E2E Tests.
+
+Getting the extension to "signed in, profiles decrypted" takes a popup
+load, a sign-in and a decryption round-trip. A golden Chrome user-data-dir
+captures that state once; every browser launch then starts from a clone:
+
+    chrome_snapshots/<key>/            golden profile (read-only after build)
+    chrome_snapshots/clones/<worker>/  per-worker working copy
+
+The key hashes the dist/ build, the Chrome version and the auth identity,
+so rebuilding the extension invalidates the snapshot automatically.
+Clones use copy-on-write where the filesystem supports it (reflink on
+Linux btrfs/xfs, clonefile on macOS APFS) and fall back to a plain copy.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .driver_resolver import ChromeDriverResolver
+from .worker_context import WorkerContext
+
+
+class ProfileSnapshot:
+    """
+    Golden user-data-dir keyed by the extension build.
+
+    Example:
+        ```python
+        snapshot = ProfileSnapshot(extension_path, identity='seeded:<uid>')
+        snapshot.ensure(build=lambda user_data_dir: sign_in_with(user_data_dir))
+        user_data_dir = snapshot.clone()
+        driver = ChromeDriverManager.get_driver(extension_path, user_data_dir=user_data_dir)
+        ```
+    """
+
+    SNAPSHOTS_DIR = WorkerContext.SUITE_ROOT / 'chrome_snapshots'
+
+    # Files Chrome uses to lock a live profile (must not be cloned)
+    LOCK_FILES = ['SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile']
+
+    # Disposable caches (smaller snapshot -> faster plain-copy fallback)
+    CACHE_DIRS = ['Default/Cache', 'Default/Code Cache', 'Default/GPUCache',
+                  'GrShaderCache', 'GraphiteDawnCache', 'ShaderCache']
+
+    # A build holding the lock longer than this is considered dead
+    BUILD_TIMEOUT = 300
+
+    def __init__(self, extension_path: str, identity: str = ''):
+        """
+        Initialize the snapshot for an extension build.
+
+        Args:
+            extension_path: Built extension directory (hashed into the key)
+            identity: Extra key material (e.g. auth mode + test UID)
+        """
+        self.extension_path = Path(extension_path)
+        self.identity = identity
+        self.key = self._compute_key()
+
+    @property
+    def path(self) -> Path:
+        """Golden user-data-dir for this key."""
+        return self.SNAPSHOTS_DIR / self.key
+
+    def exists(self) -> bool:
+        """Whether the golden profile has been built."""
+        return self.path.is_dir()
+
+    # ========================================
+    # Key
+    # ========================================
+
+    def _compute_key(self) -> str:
+        """Hash dist/ contents, Chrome version and identity."""
+        digest = hashlib.sha256()
+
+        for file in sorted(p for p in self.extension_path.rglob('*') if p.is_file()):
+            digest.update(file.relative_to(self.extension_path).as_posix().encode())
+            digest.update(file.read_bytes())
+
+        digest.update((ChromeDriverResolver.get_chrome_version() or 'unknown').encode())
+        digest.update(self.identity.encode())
+        return digest.hexdigest()[:20]
+
+    # ========================================
+    # Build
+    # ========================================
+
+    def ensure(self, build: Callable[[Path], None]) -> Path:
+        """
+        Build the golden profile unless it already exists.
+
+        Safe with parallel workers: one worker builds, the others wait.
+
+        Args:
+            build: Callable(user_data_dir) launching Chrome on the given
+                directory, bringing the extension to the desired state and
+                quitting Chrome
+
+        Returns:
+            Path: Golden user-data-dir
+        """
+        if self.exists():
+            print(f"[Snapshot] Using golden profile {self.key}")
+            return self.path
+
+        self.SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+        lock = self.SNAPSHOTS_DIR / f'{self.key}.lock'
+
+        while not self._try_lock(lock):
+            if self.exists():
+                print(f"[Snapshot] Golden profile {self.key} built by another worker")
+                return self.path
+            time.sleep(0.5)
+
+        try:
+            if self.exists():
+                return self.path
+
+            start = time.perf_counter()
+            tmp = self.SNAPSHOTS_DIR / f'{self.key}.{os.getpid()}.tmp'
+            shutil.rmtree(tmp, ignore_errors=True)
+            tmp.mkdir()
+
+            build(tmp)
+            self._strip(tmp)
+            os.replace(tmp, self.path)
+
+            print(f"[Snapshot] Built golden profile {self.key} in {time.perf_counter() - start:.1f}s")
+            self.prune()
+            return self.path
+        finally:
+            lock.unlink(missing_ok=True)
+
+    def _try_lock(self, lock: Path) -> bool:
+        """Take the build lock (breaking it if its holder died)."""
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime > self.BUILD_TIMEOUT:
+                    print("[Snapshot] Removing stale build lock")
+                    lock.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+            return False
+
+    def _strip(self, user_data_dir: Path) -> None:
+        """Remove lock files and caches from a freshly built profile."""
+        for name in self.LOCK_FILES:
+            target = user_data_dir / name
+            if target.is_symlink() or target.exists():
+                target.unlink()
+
+        for name in self.CACHE_DIRS:
+            shutil.rmtree(user_data_dir / name, ignore_errors=True)
+
+    def prune(self) -> None:
+        """Delete golden profiles of previous builds."""
+        for entry in self.SNAPSHOTS_DIR.iterdir():
+            if entry.is_dir() and entry.name not in (self.key, 'clones') and '.' not in entry.name:
+                shutil.rmtree(entry, ignore_errors=True)
+                print(f"[Snapshot] Pruned outdated snapshot {entry.name}")
+
+    # ========================================
+    # Clone
+    # ========================================
+
+    def clone(self, destination: Optional[Path] = None) -> str:
+        """
+        Create a working copy of the golden profile.
+
+        Args:
+            destination: Target user-data-dir (default: this worker's clone dir)
+
+        Returns:
+            str: Path to pass as Chrome's --user-data-dir
+        """
+        if not self.exists():
+            raise RuntimeError(f"Golden profile {self.key} has not been built")
+
+        destination = Path(destination or self.SNAPSHOTS_DIR / 'clones' / WorkerContext.worker_id())
+        shutil.rmtree(destination, ignore_errors=True)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        start = time.perf_counter()
+        method = self._copy(self.path, destination)
+        print(f"[Snapshot] Cloned profile ({method}) in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return str(destination)
+
+    @staticmethod
+    def _copy(source: Path, destination: Path) -> str:
+        """
+        Copy a directory tree, copy-on-write when possible.
+
+        Hardlinks are deliberately not used: Chrome rewrites profile files
+        in place, which would corrupt the golden copy.
+
+        Returns:
+            str: Copy method used
+        """
+        commands = []
+        if sys.platform.startswith('linux'):
+            commands.append(('reflink=auto', ['cp', '-a', '--reflink=auto', str(source), str(destination)]))
+        elif sys.platform == 'darwin':
+            commands.append(('clonefile', ['cp', '-c', '-R', str(source), str(destination)]))
+
+        for method, command in commands:
+            try:
+                subprocess.run(command, check=True, capture_output=True)
+                return method
+            except (OSError, subprocess.CalledProcessError):
+                shutil.rmtree(destination, ignore_errors=True)
+
+        shutil.copytree(source, destination, symlinks=True)
+        return 'copy'
@@ -0,0 +1,274 @@
+"""
+Readiness Waits for PromptBlocker E2E Tests.
+
+Fixed sleeps pay the worst case on every run. These waits poll a real
+signal from the browser and return as soon as it holds, while keeping a
+hard timeout:
+- Browser: new window opened, window closed, document ready
+- Platform page: content script injected, HEALTH_CHECK round-trip answered
+- Popup: Firebase auth state shown, profiles decrypted and rendered
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from typing import Any, Callable, Iterable, Optional
+
+from .wait_policy import WaitPolicy
+
+
+class Readiness:
+    """
+    Event-driven waits with a hard timeout.
+
+    Example:
+        ```python
+        ready = Readiness(driver)
+        oauth_window = ready.new_window(known_handles=[popup_handle])
+        ready.auth_state(signed_in=True)
+        count = ready.decrypted_profiles()
+        ```
+    """
+
+    DEFAULT_TIMEOUT = WaitPolicy.TIMEOUT
+
+    PROFILE_CARDS = (By.CSS_SELECTOR, '#profileList .profile-card')
+
+    # Popup: is the signed-in header shown (and sign-in button hidden)?
+    AUTH_STATE_SCRIPT = """
+        const user = document.getElementById('headerUserProfileContainer');
+        const signIn = document.getElementById('headerSignInContainer');
+        if (!user) return null;
+        if (!user.classList.contains('hidden')) return 'signed_in';
+        if (signIn && !signIn.classList.contains('hidden')) return 'signed_out';
+        return null;
+    """
+
+    # Popup: how many profiles are stored, and how many have been decrypted
+    # and rendered? Also reports the decryption-failure banner.
+    PROFILES_STATE_SCRIPT = """
+        const done = arguments[arguments.length - 1];
+        chrome.storage.local.get('profiles').then((data) => {
+            const banner = document.getElementById('authIssueBanner');
+            done({
+                stored: !!data.profiles,
+                rendered: document.querySelectorAll('#profileList .profile-card').length,
+                decryptionFailed: !!banner && !banner.classList.contains('hidden')
+            });
+        }).catch((error) => done({ error: String(error) }));
+    """
+
+    # Platform page: inject -> content -> background -> content -> inject
+    HEALTH_CHECK_SCRIPT = """
+        const done = arguments[arguments.length - 1];
+        const messageId = 'e2e-' + Math.random().toString(36).slice(2);
+        const timer = setTimeout(() => {
+            window.removeEventListener('message', onMessage);
+            done(false);
+        }, 500);
+        function onMessage(event) {
+            if (event.data?.source === 'ai-pii-content-health' &&
+                event.data?.messageId === messageId) {
+                clearTimeout(timer);
+                window.removeEventListener('message', onMessage);
+                done(event.data.isAlive === true);
+            }
+        }
+        window.addEventListener('message', onMessage);
+        window.postMessage({ source: 'ai-pii-inject-health', messageId }, '*');
+    """
+
+    def __init__(self, driver: WebDriver, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize readiness waits.
+
+        Args:
+            driver: Selenium WebDriver instance
+            timeout: Default hard timeout in seconds
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    # ========================================
+    # Generic
+    # ========================================
+
+    def until(self, condition: Callable[[WebDriver], Any], message: str,
+              timeout: Optional[float] = None) -> Any:
+        """
+        Poll a condition until it returns a truthy value.
+
+        Args:
+            condition: Callable taking the driver
+            message: Timeout error message
+            timeout: Override default timeout
+
+        Returns:
+            The condition's truthy return value
+
+        Raises:
+            TimeoutException: If the condition never holds
+        """
+        wait = WaitPolicy.wait(self.driver, self.timeout if timeout is None else timeout, ignore_driver_errors=True)
+        return wait.until(condition, message=message)
+
+    # ========================================
+    # Browser
+    # ========================================
+
+    def new_window(self, known_handles: Iterable[str], timeout: Optional[float] = None) -> str:
+        """
+        Wait for a window that isn't in known_handles to open.
+
+        Args:
+            known_handles: Window handles that already existed
+            timeout: Override default timeout
+
+        Returns:
+            str: Handle of the new window
+        """
+        known = set(known_handles)
+
+        def opened(driver):
+            new = [h for h in driver.window_handles if h not in known]
+            return new[-1] if new else None
+
+        return self.until(opened, "New window did not open", timeout)
+
+    def window_closed(self, handle: str, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a window to close (e.g. the Google OAuth popup).
+
+        Args:
+            handle: Window handle expected to close
+            timeout: Override default timeout
+        """
+        self.until(
+            lambda driver: handle not in driver.window_handles,
+            f"Window {handle} did not close",
+            timeout
+        )
+
+    def document_ready(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for document.readyState == 'complete' in the current window.
+
+        Args:
+            timeout: Override default timeout
+        """
+        self.until(
+            lambda driver: driver.execute_script("return document.readyState") == 'complete',
+            "Document did not finish loading",
+            timeout
+        )
+
+    # ========================================
+    # Platform Page
+    # ========================================
+
+    def content_script_injected(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for inject.js to wrap fetch on the current platform page.
+
+        Args:
+            timeout: Override default timeout
+        """
+        self.until(
+            lambda driver: driver.execute_script("return typeof window.__nativeFetch === 'function'"),
+            "Content script (inject.js) was not injected",
+            timeout
+        )
+
+    def health_check(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until a HEALTH_CHECK round-trip from the page succeeds.
+
+        Only succeeds once the service worker answers and the page's domain
+        is protected, i.e. when a prompt sent now would be substituted.
+
+        Args:
+            timeout: Override default timeout
+        """
+        self.until(
+            lambda driver: driver.execute_async_script(self.HEALTH_CHECK_SCRIPT),
+            "HEALTH_CHECK round-trip did not succeed",
+            timeout
+        )
+
+    def platform_page(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the current platform page is loaded and protected.
+
+        Document ready, inject.js hooked in, then a HEALTH_CHECK round-trip.
+
+        Args:
+            timeout: Override default timeout (per step)
+        """
+        self.document_ready(timeout)
+        self.content_script_injected(timeout)
+        self.health_check(timeout)
+
+    # ========================================
+    # Popup
+    # ========================================
+
+    def auth_state(self, signed_in: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the popup header to show the given auth state.
+
+        Args:
+            signed_in: True to wait for signed in, False for signed out
+            timeout: Override default timeout
+        """
+        expected = 'signed_in' if signed_in else 'signed_out'
+        self.until(
+            lambda driver: driver.execute_script(self.AUTH_STATE_SCRIPT) == expected,
+            f"Popup did not reach auth state '{expected}'",
+            timeout
+        )
+
+    def decrypted_profiles(self, min_count: int = 1, timeout: Optional[float] = None) -> int:
+        """
+        Wait until stored profiles have been decrypted and rendered.
+
+        If no profiles are stored there is nothing to decrypt and this
+        returns immediately with 0.
+
+        Args:
+            min_count: Minimum rendered profiles when profiles are stored
+            timeout: Override default timeout
+
+        Returns:
+            int: Number of decrypted (rendered) profiles
+
+        Raises:
+            TimeoutException: If profiles never decrypt
+            RuntimeError: If the popup shows the decryption-failure banner
+        """
+        def decrypted(driver):
+            state = driver.execute_async_script(self.PROFILES_STATE_SCRIPT)
+            if not state or state.get('error'):
+                return None
+            if state['decryptionFailed']:
+                raise RuntimeError("Popup reported profile decryption failure")
+            if not state['stored']:
+                return {'count': 0}
+            if state['rendered'] >= min_count:
+                return {'count': state['rendered']}
+            return None
+
+        return self.until(decrypted, "Profiles were not decrypted", timeout)['count']
+
+    def profile_cards(self, count: int, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the popup to render exactly `count` profile cards
+        (e.g. after saving or deleting a profile).
+
+        Args:
+            count: Expected number of rendered profiles
+            timeout: Override default timeout
+        """
+        self.until(
+            lambda driver: len(driver.find_elements(*self.PROFILE_CARDS)) == count,
+            f"Popup did not render {count} profile(s)",
+            timeout
+        )
@@ -8,9 +8,15 @@ Chrome WebDriver instances with the PromptBlocker extension loaded.
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager as WDM
 import os
 from pathlib import Path
+from typing import List, Optional
+
+from .command_profiler import CommandProfiler
+from .driver_resolver import ChromeDriverResolver
+from .extension_id import ExtensionId
+from .wait_policy import WaitPolicy
+from .worker_context import WorkerContext
 
 
 class ChromeDriverManager:
@@ -19,15 +25,22 @@ class ChromeDriverManager:
     configured for Chrome extension testing.
     """
 
+    # Viewport for headless / virtual-display runs
+    WINDOW_SIZE = (1920, 1080)
+
     @staticmethod
-    def get_driver(extension_path: str, headless: bool = False, user_data_dir: str = None):
+    def get_driver(extension_path: str, headless: Optional[bool] = None, user_data_dir: str = None,
+                   extra_arguments: Optional[List[str]] = None):
         """
         Create and configure a Chrome WebDriver with extension loaded.
 
         Args:
             extension_path: Absolute path to the unpacked extension directory
-            headless: Whether to run in headless mode (NOT recommended for extensions)
+            headless: Whether to run in headless mode (default: True when
+                E2E_DISPLAY_MODE is 'headless')
             user_data_dir: Custom user data directory for Chrome profile persistence
+            extra_arguments: Additional Chrome switches (e.g. host mapping
+                for MockPlatformServer)
 
         Returns:
             WebDriver: Configured Chrome driver instance
@@ -52,21 +65,34 @@ class ChromeDriverManager:
         # Enable developer mode (required for unpacked extensions)
         options.add_argument('--enable-features=ExtensionsToolbarMenu')
 
+        # Branded Chrome 137+ ignores --load-extension unless this is disabled
+        options.add_argument('--disable-features=DisableLoadExtensionCommandLineSwitch')
+
+        # Allow the CDP Extensions domain (load_extension() fallback)
+        options.add_argument('--enable-unsafe-extension-debugging')
+
         print(f"[Driver] Loading extension from: {extension_path}")
 
         # ========================================
         # Browser Configuration
         # ========================================
 
-        # Headless mode (WARNING: Extensions don't work well in headless)
+        # Display mode (pytest --display-mode sets E2E_DISPLAY_MODE)
+        display_mode = os.getenv('E2E_DISPLAY_MODE', 'headed')
+        if headless is None:
+            headless = display_mode == 'headless'
+
+        # New headless mode runs the full browser, extensions included
         if headless:
-            print("[Driver] WARNING: Extensions may not work properly in headless mode!")
-            options.add_argument('--headless=new')  # Use new headless mode
+            options.add_argument('--headless=new')
+            print("[Driver] Running headless (--headless=new)")
 
-        # Window size
-        options.add_argument('--start-maximized')
-        # OR set specific size:
-        # options.add_argument('--window-size=1920,1080')
+        # Window size (no window manager to maximize in headless/Xvfb)
+        if headless or display_mode == 'xvfb':
+            width, height = ChromeDriverManager.WINDOW_SIZE
+            options.add_argument(f'--window-size={width},{height}')
+        else:
+            options.add_argument('--start-maximized')
 
         # Disable automation flags (helps avoid detection)
         options.add_argument('--disable-blink-features=AutomationControlled')
@@ -88,12 +114,18 @@ class ChromeDriverManager:
             options.add_argument(f'--user-data-dir={user_data_dir}')
             print(f"[Driver] Using user data dir: {user_data_dir}")
         else:
-            # Use default temporary profile
-            temp_profile = Path(__file__).parent.parent / 'chrome_profile'
-            temp_profile.mkdir(exist_ok=True)
+            # Use default temporary profile (one per xdist worker - Chrome locks it)
+            temp_profile = WorkerContext.chrome_profile_dir()
             options.add_argument(f'--user-data-dir={temp_profile}')
             print(f"[Driver] Using temporary profile: {temp_profile}")
 
+        # ========================================
+        # Extra Arguments (mock platforms, etc.)
+        # ========================================
+
+        for argument in extra_arguments or []:
+            options.add_argument(argument)
+
         # ========================================
         # Performance & Stability
         # ========================================
@@ -123,15 +155,19 @@ class ChromeDriverManager:
         # ========================================
 
         try:
-            # Use webdriver-manager to automatically download/manage ChromeDriver
-            service = Service(WDM().install())
+            # Resolve ChromeDriver for the local Chrome version (cached, offline after first run)
+            service = Service(ChromeDriverResolver.resolve())
 
             driver = webdriver.Chrome(service=service, options=options)
 
             print("[Driver] Chrome driver created successfully")
 
-            # Set implicit wait (default timeout for element finding)
-            driver.implicitly_wait(10)
+            # Explicit waits only (implicit wait 0, see WaitPolicy)
+            WaitPolicy.apply(driver)
+
+            # Opt-in command round-trip profiling (pytest --profile-webdriver)
+            if CommandProfiler.enabled():
+                CommandProfiler.install(driver)
 
             # Set page load timeout
             driver.set_page_load_timeout(60)
@@ -143,7 +179,7 @@ class ChromeDriverManager:
             raise
 
     @staticmethod
-    def get_extension_id(driver):
+    def get_extension_id(driver, extension_path: Optional[str] = None) -> Optional[str]:
         """
         Get the extension ID from the loaded extension.
 
@@ -151,27 +187,56 @@ class ChromeDriverManager:
 
         Args:
             driver: Active WebDriver instance
+            extension_path: Directory the extension was loaded from. When
+                given, the ID is computed without touching the browser.
 
         Returns:
-            str: Extension ID (e.g., 'abcd1234...')
+            str: Extension ID (e.g., 'abcd1234...'), or None if it can't be found
 
         Example:
             ```python
-            ext_id = ChromeDriverManager.get_extension_id(driver)
+            ext_id = ChromeDriverManager.get_extension_id(driver, extension_path)
             driver.get(f'chrome-extension://{ext_id}/popup-v2.html')
             ```
         """
-        # Navigate to chrome://extensions
-        driver.get('chrome://extensions')
+        if extension_path:
+            return ExtensionId.for_path(extension_path)
+
+        # Fall back to the running service worker's target URL
+        extension_id = ExtensionId.from_driver(driver)
+        if not extension_id:
+            print("[Driver] No extension service worker found")
+        return extension_id
+
 
-        # Enable developer mode to see extension IDs
-        # Note: This requires using execute_script to interact with shadow DOM
+    @staticmethod
+    def load_extension(driver, extension_path: str) -> str:
+        """
+        Load an unpacked extension into a running browser via CDP.
+
+        Fallback for browsers that ignored --load-extension; no
+        chrome://extensions UI or OS-level input involved.
+
+        Args:
+            driver: Active WebDriver instance
+            extension_path: Unpacked extension directory
+
+        Returns:
+            str: ID of the loaded extension
+
+        Raises:
+            RuntimeError: If the browser refuses to load the extension
+        """
+        try:
+            result = driver.execute_cdp_cmd('Extensions.loadUnpacked', {'path': extension_path})
+        except Exception as e:
+            raise RuntimeError(
+                f"Could not load extension from {extension_path} via CDP ({e}). "
+                "Use Chrome for Testing or Chromium if --load-extension is ignored."
+            ) from e
 
-        # For now, return None - extension ID can be found manually
-        # or via browser console: chrome.runtime.id
-        print("[Driver] Extension ID detection not implemented yet")
-        print("[Driver] You can get it from chrome://extensions or browser console")
-        return None
+        print(f"[Driver] Loaded extension via CDP: {result.get('id')}")
+        return result.get('id') or ExtensionId.for_path(extension_path)
 
 
 # Example usage
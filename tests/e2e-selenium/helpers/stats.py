@@ -0,0 +1,72 @@
+"""
+Statistics for PromptBlocker benchmarks and soaks.
+
+Latency summaries (nearest-rank percentiles) and growth slopes, shared by
+the benchmark helpers, the heap soak and the terminal reports.
+"""
+
+import math
+from typing import Any, Dict, List
+
+
+class Stats:
+    """
+    Static helpers for latency samples and growth series.
+
+    Example:
+        ```python
+        stats = Stats.summarize(samples, elapsed_ms)
+        growth = Stats.growth_per_1k([{'messages': 0, 'bytes': 1_000_000}, ...])
+        ```
+    """
+
+    @staticmethod
+    def percentile(samples: List[float], percent: float) -> float:
+        """Nearest-rank percentile of a non-empty sample list."""
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    @classmethod
+    def summarize(cls, samples: List[float], elapsed_ms: float) -> Dict[str, Any]:
+        """
+        Summarize latency samples.
+
+        Args:
+            samples: Per-call latencies in ms
+            elapsed_ms: Wall time of the timed loop in ms
+
+        Returns:
+            dict: iterations, ops_per_sec, mean/p50/p95/p99/max in ms
+        """
+        return {
+            'iterations': len(samples),
+            'ops_per_sec': round(len(samples) / (elapsed_ms / 1000), 2) if elapsed_ms else 0.0,
+            'mean_ms': round(sum(samples) / len(samples), 3),
+            'p50_ms': round(cls.percentile(samples, 50), 3),
+            'p95_ms': round(cls.percentile(samples, 95), 3),
+            'p99_ms': round(cls.percentile(samples, 99), 3),
+            'max_ms': round(max(samples), 3),
+        }
+
+    @staticmethod
+    def growth_per_1k(samples: List[Dict[str, int]]) -> float:
+        """
+        Least-squares slope of heap size over messages sent.
+
+        Args:
+            samples: {'messages', 'bytes'} points
+
+        Returns:
+            float: Heap growth in bytes per 1000 messages
+        """
+        if len(samples) < 2:
+            return 0.0
+        xs = [s['messages'] for s in samples]
+        ys = [s['bytes'] for s in samples]
+        mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+        variance = sum((x - mean_x) ** 2 for x in xs)
+        if not variance:
+            return 0.0
+        slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+        return round(slope * 1000, 1)
@@ -0,0 +1,224 @@
+"""
+Streaming Latency Benchmarks for PromptBlocker performance tests.
+
+AI platforms stream their answers. When inject.js wraps a streamed
+response, every network chunk goes through SUBSTITUTE_RESPONSE before the
+page can read it; a response that isn't text/event-stream is buffered
+completely first. Either way, extra latency shows up as a later first token
+and a choppier stream.
+
+MockPlatformServer.STREAM_PATH streams numbered tokens ({"i": n, "t": ...})
+at a set rate, as SSE or chunked NDJSON. The page reads the stream with
+the wrapped window.fetch (extension in the path) and with
+window.__nativeFetch (extension bypassed), in alternating runs, and
+records when each token arrives:
+
+    ttft        request start -> first token readable by the page
+    gap         time between consecutive tokens
+    total       request start -> last token
+
+Results are appended to reports/benchmarks/stream/<worker>.jsonl and
+printed as a table at the end of a performance run.
+"""
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .benchmark_store import BenchmarkStore
+from .stats import Stats
+from .worker_context import WorkerContext
+
+
+class StreamLatencyBenchmark(BenchmarkStore):
+    """
+    Times token delivery of streamed responses with and without the extension.
+
+    Example:
+        ```python
+        driver.get('https://chatgpt.com')         # mock platform page
+        bench = StreamLatencyBenchmark(driver)
+        result = bench.run(tokens=100, interval_ms=20, fmt='sse')
+        print(result['added']['ttft_p50_ms'])
+        ```
+    """
+
+    RESULTS_DIR = WorkerContext.REPORTS_DIR / 'benchmarks' / 'stream'
+
+    MODES = ['native', 'wrapped']
+    FORMATS = ['sse', 'chunked']
+
+    RUNS = 3
+
+    SCRIPT_TIMEOUT = 600
+
+    # Alternates native/wrapped runs; per run returns the arrival time (ms
+    # after the request started) of every token index seen in the stream
+    LOOP_SCRIPT = """
+        const [url, words, runs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const clients = { native: window.__nativeFetch, wrapped: window.fetch };
+        const body = JSON.stringify({ words });
+
+        const once = async (client) => {
+            const t0 = performance.now();
+            const response = await client(url, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
+                body
+            });
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            const marker = /"i":\\s*(\\d+),/g;
+            const arrivals = [];
+            let text = '';
+            let position = 0;
+
+            while (true) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                const now = performance.now() - t0;
+                text += decoder.decode(value, { stream: true });
+
+                // Tokens may be split across chunks: resume after the last complete marker
+                marker.lastIndex = position;
+                let match;
+                while ((match = marker.exec(text))) {
+                    arrivals[Number(match[1])] = now;
+                    position = marker.lastIndex;
+                }
+            }
+            return { arrivals, text };
+        };
+
+        (async () => {
+            if (clients.native === clients.wrapped) throw new Error('window.fetch is not wrapped (inject.js missing)');
+
+            const results = { native: [], wrapped: [] };
+            let sample = null;
+            for (let r = 0; r < runs; r++) {
+                const order = r % 2 ? ['wrapped', 'native'] : ['native', 'wrapped'];
+                for (const mode of order) {
+                    const { arrivals, text } = await once(clients[mode]);
+                    results[mode].push(arrivals);
+                    if (mode === 'wrapped') sample = text.slice(0, 2000);
+                }
+            }
+            return { results, sample };
+        })().then(done).catch((error) => done({ error: String(error) }));
+    """
+
+    def __init__(self, driver: WebDriver, url: str = 'https://chatgpt.com/backend-api/conversation/stream'):
+        """
+        Initialize the benchmark on the current (protected platform) page.
+
+        Args:
+            driver: Selenium WebDriver instance, on a page inject.js wraps
+            url: Streaming endpoint matched by inject.js
+        """
+        self.driver = driver
+        self.url = url
+
+    def run(self, tokens: int = 100, interval_ms: float = 20, first_ms: float = 0,
+            fmt: str = 'sse', words: Optional[List[str]] = None,
+            runs: int = RUNS) -> Dict[str, Any]:
+        """
+        Stream a response through both fetch implementations.
+
+        Args:
+            tokens: Tokens per response
+            interval_ms: Server-side delay between tokens (1000 / tokens per second)
+            first_ms: Server-side delay before the first token
+            fmt: 'sse' (text/event-stream) or 'chunked' (chunked NDJSON)
+            words: Token texts, cycled (e.g. alias values, to make decoding work)
+            runs: Responses per mode
+
+        Returns:
+            dict: 'native' and 'wrapped' statistics from summarize(),
+                'added' (wrapped - native per metric) and 'sample' (the
+                start of the last wrapped response, as the page saw it)
+
+        Raises:
+            RuntimeError: If the loop fails or tokens are lost
+        """
+        query = urlencode({'tokens': tokens, 'interval_ms': interval_ms,
+                           'first_ms': first_ms, 'format': fmt})
+
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            result = self.driver.execute_async_script(
+                self.LOOP_SCRIPT, f'{self.url}?{query}', words or ['token'], runs
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if not result or result.get('error'):
+            raise RuntimeError(f"Stream benchmark loop failed: {result}")
+
+        stats = {}
+        for mode in self.MODES:
+            for arrivals in result['results'][mode]:
+                received = sum(1 for t in arrivals if t is not None)
+                if received != tokens:
+                    raise RuntimeError(f"{mode} stream delivered {received}/{tokens} tokens")
+            stats[mode] = self.summarize(result['results'][mode])
+
+        stats['added'] = {key: round(stats['wrapped'][key] - stats['native'][key], 3)
+                          for key in stats['native'] if key.endswith('_ms')}
+        stats['sample'] = result['sample']
+        return stats
+
+    @staticmethod
+    def summarize(runs: List[List[float]]) -> Dict[str, Any]:
+        """
+        Summarize token arrival times of several responses.
+
+        Args:
+            runs: Per response, arrival time (ms) of each token index
+
+        Returns:
+            dict: runs, ttft/total p50 and p95, inter-token gap p50/p95/p99/max (ms)
+        """
+        percentile = Stats.percentile
+        ttft = [arrivals[0] for arrivals in runs]
+        total = [arrivals[-1] for arrivals in runs]
+        gaps = [later - earlier for arrivals in runs for earlier, later in zip(arrivals, arrivals[1:])] or [0.0]
+
+        return {
+            'runs': len(runs),
+            'ttft_p50_ms': round(percentile(ttft, 50), 3),
+            'ttft_p95_ms': round(percentile(ttft, 95), 3),
+            'gap_p50_ms': round(percentile(gaps, 50), 3),
+            'gap_p95_ms': round(percentile(gaps, 95), 3),
+            'gap_p99_ms': round(percentile(gaps, 99), 3),
+            'gap_max_ms': round(max(gaps), 3),
+            'total_p50_ms': round(percentile(total, 50), 3),
+        }
+
+    # ========================================
+    # Results
+    # ========================================
+
+    @staticmethod
+    def report(records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Format stream benchmark records as a table (native -> wrapped).
+
+        Args:
+            records: Records with 'name' and run() fields
+
+        Returns:
+            list: Report lines
+        """
+        def pair(record, key):
+            return f"{record['native'][key]:.1f}->{record['wrapped'][key]:.1f}"
+
+        lines = [f"  {'case':<28} {'TTFT p50 ms':>16} {'gap p95 ms':>14} {'gap max ms':>16} {'total p50 ms':>18}"]
+        for record in sorted(records, key=lambda r: r['name']):
+            lines.append(
+                f"  {record['name'][:28]:<28} {pair(record, 'ttft_p50_ms'):>16} {pair(record, 'gap_p95_ms'):>14} "
+                f"{pair(record, 'gap_max_ms'):>16} {pair(record, 'total_p50_ms'):>18}"
+            )
+        return lines
@@ -0,0 +1,107 @@
+"""
+Synthetic Corpora for PromptBlocker performance tests.
+
+Generates alias profiles and chat messages of a given size and PII density,
+deterministically (seeded), so benchmark runs are comparable:
+
+    corpus = SyntheticCorpus(seed=1)
+    profiles = corpus.profiles(100)                     # SET_PROFILES payload
+    text = corpus.message(10_000, profiles, density=0.05)
+"""
+
+import random
+from typing import Any, Dict, List
+
+
+class SyntheticCorpus:
+    """
+    Deterministic generator for profiles and PII-bearing messages.
+    """
+
+    FIRST_NAMES = ['Avery', 'Jordan', 'Morgan', 'Riley', 'Casey', 'Quinn', 'Harper', 'Rowan']
+    LAST_NAMES = ['Whitfield', 'Okafor', 'Lindqvist', 'Moreau', 'Tanaka', 'Castillo', 'Novak', 'Brennan']
+    STREETS = ['Maple Street', 'Harbor Road', 'Cedar Lane', 'Mill Avenue']
+    FILLER = (
+        'please review the attached draft and summarize the main points before our meeting '
+        'the quarterly numbers look better than expected but we still need to confirm the '
+        'shipping dates with the vendor and update the project plan accordingly thanks again'
+    ).split()
+
+    # Fields substituted by AliasEngine (cellPhone is optional and left out)
+    PII_FIELDS = ['name', 'email', 'phone', 'address', 'company']
+
+    def __init__(self, seed: int = 0):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Random seed (same seed -> same corpus)
+        """
+        self.seed = seed
+
+    def profiles(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Build distinct alias profiles.
+
+        Args:
+            count: Number of profiles
+
+        Returns:
+            list: AliasProfile payloads as accepted by SET_PROFILES
+        """
+        return [self._profile(index) for index in range(count)]
+
+    def _profile(self, index: int) -> Dict[str, Any]:
+        """Profile number `index` (unique values on both sides)."""
+        first = self.FIRST_NAMES[index % len(self.FIRST_NAMES)]
+        last = self.LAST_NAMES[(index // len(self.FIRST_NAMES)) % len(self.LAST_NAMES)]
+
+        def identity(kind: str, offset: int) -> Dict[str, str]:
+            number = index * 2 + offset
+            return {
+                'name': f'{first} {last}{kind.capitalize()}{index}',
+                'email': f'{first.lower()}.{kind}{index}@example.com',
+                'phone': f'555-{number // 10000 % 1000:03d}-{number % 10000:04d}',
+                'address': f'{100 + index} {self.STREETS[index % len(self.STREETS)]} {kind.capitalize()}',
+                'company': f'{last} {kind.capitalize()} Labs {index}',
+            }
+
+        return {
+            'id': f'synthetic-{index}',
+            'profileName': f'Synthetic {index}',
+            'enabled': True,
+            'real': identity('real', 0),
+            'alias': identity('alias', 1),
+            'metadata': {'createdAt': 0, 'updatedAt': 0},
+            'settings': {'enableVariations': False},
+        }
+
+    def message(self, size: int, profiles: List[Dict[str, Any]], density: float,
+                side: str = 'real') -> str:
+        """
+        Build a message of roughly `size` bytes.
+
+        Args:
+            size: Target length in bytes (ASCII, so also characters)
+            profiles: Profiles whose values are embedded
+            density: Share of words that are PII values (0.0 - 1.0)
+            side: 'real' (for encode) or 'alias' (for decode)
+
+        Returns:
+            str: Message text, exactly `size` characters (with density > 0
+                it starts with a PII value, so even short messages have one)
+        """
+        rng = random.Random(f'{self.seed}:{size}:{len(profiles)}:{density}:{side}')
+        words: List[str] = []
+        length = 0
+
+        while length < size:
+            if profiles and density > 0 and (not words or rng.random() < density):
+                profile = profiles[rng.randrange(len(profiles))]
+                word = profile[side][rng.choice(self.PII_FIELDS)]
+            else:
+                word = rng.choice(self.FILLER)
+            words.append(word)
+            length += len(word) + 1
+
+        return ' '.join(words)[:size]
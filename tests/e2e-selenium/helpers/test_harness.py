@@ -3,29 +3,35 @@ Test Harness for PromptBlocker E2E Tests.
 
 This module provides the complete mandatory flow that ALL tests must follow:
 1. Navigate to ChatGPT (supported platform)
-2. Open extension popup via PyAutoGUI
-3. Sign in with Google OAuth
+2. Open extension popup (popup URL in a new tab)
+3. Sign in (seeded Firebase session, or Google OAuth with --auth-mode=oauth)
 4. Wait for Firebase decryption
 5. Verify "You are protected" status
 
 After this flow completes, tests can create profiles and validate functionality.
 """
 
-import time
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from typing import Optional, Dict, Any
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from typing import Optional, Dict, Any, List
 
 from .auth_helper import AuthHelper
-from .extension_helper import ExtensionHelper
+from .auth_seeder import AuthSeeder
+from .profile_seeder import ProfileSeeder
+from .extension_state import ExtensionState
+from .extension_id import ExtensionId
+from .selenium_driver import ChromeDriverManager
+from .readiness import Readiness
+from .timing import timed_step
+from .wait_policy import WaitPolicy
 from pages.popup_page import PopupPage
 
-# Load .env file for EXTENSION_ID
+# Load .env file (Firebase config for seeded sign-in)
 env_path = Path(__file__).parent.parent.parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
@@ -37,24 +43,34 @@ class TestHarness:
     This orchestrates:
     - ChatGPT page setup
     - Extension popup opening
-    - Google OAuth sign-in
+    - Sign-in (seeded or Google OAuth)
     - Firebase decryption wait
-    - Profile creation/deletion
+    - Profile creation/deletion (form or bulk seeding)
     """
 
-    def __init__(self, driver: WebDriver):
+    # Built extension loaded by ChromeDriverManager (extension ID is derived from it)
+    DIST_PATH = Path(__file__).parents[3] / 'dist'
+
+    def __init__(self, driver: WebDriver, auth_mode: Optional[str] = None):
         """
         Initialize test harness.
 
         Args:
             driver: Selenium WebDriver instance
+            auth_mode: 'seeded' or 'oauth' (default: E2E_AUTH_MODE, set
+                from pytest --auth-mode, else 'seeded')
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.auth_mode = auth_mode or os.getenv('E2E_AUTH_MODE', 'seeded')
+        self.extension_id = None
+        self.wait = WaitPolicy.wait(driver)
         self.auth_helper = AuthHelper(driver)
+        self.ready = Readiness(driver)
         self.chatgpt_window = None
         self.popup_window = None
+        self.profile_seeder = None
 
+    @timed_step
     def setup_chatgpt_page(self) -> str:
         """
         Navigate to ChatGPT and setup the page.
@@ -73,118 +89,140 @@ class TestHarness:
         self.chatgpt_window = self.driver.current_window_handle
         print(f"[Harness] Navigated to ChatGPT: {self.driver.current_url}")
 
-        # Wait for page to load
-        time.sleep(3)
-
-        # Optionally wait for ChatGPT interface to be ready
+        # Wait for page load and for the extension to hook the page
+        self.ready.document_ready()
         try:
-            # Wait for textarea (ChatGPT input)
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'textarea'))
-            )
+            self.ready.content_script_injected()
+            print("[Harness] Content script injected")
+            self.ready.health_check()
+            print("[Harness] HEALTH_CHECK round-trip answered")
+        except TimeoutException as e:
+            print(f"[Harness] WARNING: ChatGPT page not protected: {e.msg}")
+
+        # ChatGPT input is optional (may need login) - probe, don't wait
+        if self.driver.find_elements(By.CSS_SELECTOR, 'textarea'):
             print("[Harness] ChatGPT interface loaded")
-        except:
+        else:
             print("[Harness] ChatGPT interface not detected (may need login)")
 
         print("[Harness] ChatGPT page ready")
         return self.chatgpt_window
 
-    def open_extension_popup(self, method: str = 'url') -> str:
+    @timed_step
+    def open_extension_popup(self) -> str:
         """
-        Open the extension popup by navigating to its URL.
+        Open the extension popup in a new tab by navigating to its URL.
 
         This is Step 2 of the mandatory flow: Open the extension popup.
 
-        Args:
-            method: 'url' to navigate directly to popup URL (recommended)
+        The extension is already loaded by --load-extension; its ID is
+        derived from the dist/ path, so no chrome://extensions UI or
+        OS-level input is needed. If the popup URL fails to load or render
+        (the browser ignored --load-extension), the extension is loaded
+        through CDP and the popup reopened. That fallback is best-effort:
+        branded Chrome builds refuse Extensions.loadUnpacked.
 
         Returns:
             Window handle for extension popup
 
         Raises:
-            Exception: If popup doesn't open or extension ID not found
+            RuntimeError: If the extension can't be loaded
         """
         print("\n[Harness] ========================================")
         print("[Harness] Step 2: Opening extension popup")
         print("[Harness] ========================================")
 
-        # First, enable Developer mode on chrome://extensions
-        print("[Harness] Enabling Developer mode...")
-        self.driver.get('chrome://extensions')
-        time.sleep(1.5)
+        # Keep the platform page open next to the popup
+        self.driver.switch_to.new_window('tab')
 
-        # Use PyAutoGUI to click Developer mode toggle (top right of screen)
-        import pyautogui
+        try:
+            return self.open_popup_page(self.extension_id)
+        except WebDriverException as e:
+            # Unknown chrome-extension:// URLs fail to navigate; a popup that
+            # loads but never renders times out
+            print(f"[Harness] Popup did not open ({type(e).__name__}) - loading extension via CDP")
 
-        # Get screen resolution to calculate toggle position
-        screen_width, screen_height = pyautogui.size()
+        extension_id = ChromeDriverManager.load_extension(self.driver, str(self.DIST_PATH))
+        return self.open_popup_page(extension_id)
 
-        # Developer mode toggle coordinates from calibration
-        # Calibrated on 1920x1040: x=1894, y=148
-        # Adjusted to y=118
-        toggle_x = int(screen_width * 0.9864)  # 98.6% from left
-        toggle_y = 118
+    @timed_step
+    def open_popup_page(self, extension_id: Optional[str] = None) -> str:
+        """
+        Navigate the current window to the extension popup page.
 
-        print(f"[Harness] Clicking Developer mode toggle at ({toggle_x}, {toggle_y})")
-        pyautogui.click(toggle_x, toggle_y)
+        Args:
+            extension_id: Extension ID (default: computed for <repo>/dist)
 
-        print("[Harness] Developer mode enabled")
+        Returns:
+            Window handle for extension popup
+        """
+        extension_id = extension_id or ExtensionId.for_path(str(self.DIST_PATH))
+        self.extension_id = extension_id
 
-        # Wait 1 second for animation
-        time.sleep(1)
+        # Navigate directly to the extension popup
+        popup_url = f"chrome-extension://{extension_id}/popup-v2.html"
+        print(f"[Harness] Opening popup at: {popup_url}")
 
-        # Click "Load unpacked" button
-        print("[Harness] Clicking Load unpacked button...")
-        load_unpacked_x = 90
-        load_unpacked_y = 175
-        pyautogui.click(load_unpacked_x, load_unpacked_y)
-        time.sleep(2)
+        self.driver.get(popup_url)
+        self.ready.document_ready()
+        self.ready.until(
+            EC.presence_of_element_located((By.ID, 'headerSignInContainer')),
+            "Extension popup did not render"
+        )
 
-        # File dialog is now open - navigate to dist folder
-        print("[Harness] File dialog opened, navigating to extension folder...")
-        extension_path = r'H:\AI_Interceptor\dist'
+        self.popup_window = self.driver.current_window_handle
 
-        # Type the path into the address bar (Ctrl+L or Alt+D to focus address bar, then type path)
-        pyautogui.hotkey('ctrl', 'l')
-        time.sleep(0.3)
+        print(f"[Harness] Popup opened: {self.driver.current_url}")
+        print("[Harness] Extension popup ready")
 
-        pyautogui.write(extension_path, interval=0.05)
-        time.sleep(0.5)
+        return self.popup_window
 
-        # Press Enter to navigate to the folder
-        pyautogui.press('enter')
-        time.sleep(1)
+    @timed_step
+    def sign_in(self) -> None:
+        """
+        Sign in using the configured auth mode.
 
-        # Press Enter again to select the folder
-        pyautogui.press('enter')
-        time.sleep(2)
+        This is Step 3 of the mandatory flow: Authenticate.
 
-        print("[Harness] Extension folder selected and loaded")
+        Raises:
+            Exception: If sign-in fails
+        """
+        if self.auth_mode == 'oauth':
+            self.sign_in_google_oauth()
+            return
 
-        # Get extension ID from environment
-        extension_id = os.getenv('EXTENSION_ID')
-        if not extension_id:
-            raise Exception(
-                "EXTENSION_ID not found in environment. "
-                "Make sure .env file exists with EXTENSION_ID set."
-            )
+        # Chrome launched from a signed-in profile snapshot: already protected
+        self.driver.switch_to.window(self.popup_window)
+        if self.extension_id and ExtensionState(self.driver, self.extension_id).has_auth():
+            print("\n[Harness] Step 3: Session restored from profile snapshot - skipping sign-in")
+            return
 
-        print(f"[Harness] Using extension ID from env: {extension_id}")
+        self.sign_in_seeded()
 
-        # Navigate directly to the extension popup
-        popup_url = f"chrome-extension://{extension_id}/popup-v2.html"
-        print(f"[Harness] Opening popup at: {popup_url}")
+    @timed_step
+    def sign_in_seeded(self) -> None:
+        """
+        Sign in by seeding the test user's Firebase session.
 
-        self.driver.get(popup_url)
-        time.sleep(2)
+        Skips the Google OAuth popup entirely; the popup restores a stable
+        test UID (AuthSeeder.TEST_USER_UID) used for encryption keys.
 
-        self.popup_window = self.driver.current_window_handle
+        Raises:
+            Exception: If sign-in fails
+        """
+        print("\n[Harness] ========================================")
+        print("[Harness] Step 3: Signing in (seeded Firebase session)")
+        print("[Harness] ========================================")
 
-        print(f"[Harness] Popup opened: {self.driver.current_url}")
-        print("[Harness] Extension popup ready")
+        if not self.popup_window:
+            raise Exception("Popup window not open. Call open_extension_popup() first.")
 
-        return self.popup_window
+        self.driver.switch_to.window(self.popup_window)
+        AuthSeeder(self.driver, self.extension_id).sign_in()
 
+        print("[Harness] Seeded sign-in complete")
+
+    @timed_step
     def sign_in_google_oauth(self) -> None:
         """
         Sign in with Google OAuth.
@@ -206,17 +244,18 @@ class TestHarness:
 
         print("[Harness] Google OAuth sign-in complete")
 
+    @timed_step
     def wait_for_firebase_decryption(self, timeout: int = 10) -> None:
         """
         Wait for Firebase decryption to complete.
 
         This is Step 4 of the mandatory flow: Wait for encryption keys.
 
-        The app needs time to:
+        Returns as soon as the popup shows the signed-in state and any
+        stored profiles have been decrypted and rendered:
         - Get Firebase UID
         - Derive encryption keys
         - Decrypt any existing profiles
-        - Run health check loop (5s)
 
         Args:
             timeout: Maximum time to wait in seconds
@@ -225,11 +264,13 @@ class TestHarness:
         print("[Harness] Step 4: Waiting for Firebase decryption")
         print("[Harness] ========================================")
 
-        print("[Harness] Waiting for health check loop (5s)...")
-        time.sleep(5)
+        self.driver.switch_to.window(self.popup_window)
+        self.ready.auth_state(signed_in=True, timeout=timeout)
+        count = self.ready.decrypted_profiles(timeout=timeout)
 
-        print("[Harness] Firebase decryption complete")
+        print(f"[Harness] Firebase decryption complete ({count} profile(s))")
 
+    @timed_step
     def verify_protected_status(self) -> bool:
         """
         Verify "You are protected" status.
@@ -254,22 +295,20 @@ class TestHarness:
             print("[Harness] WARNING: User not signed in - not protected")
             return False
 
-    def complete_mandatory_flow(self, popup_method: str = 'coordinates') -> Dict[str, str]:
+    @timed_step
+    def complete_mandatory_flow(self) -> Dict[str, str]:
         """
         Execute the complete mandatory flow required for all tests.
 
         This runs all 5 steps:
         1. Setup ChatGPT page
         2. Open extension popup
-        3. Sign in with Google OAuth
+        3. Sign in (seeded or Google OAuth, see auth_mode)
         4. Wait for Firebase decryption
         5. Verify protected status
 
         After this, tests can create profiles and run validations.
 
-        Args:
-            popup_method: 'coordinates' or 'image' for extension icon clicking
-
         Returns:
             Dictionary with window handles:
                 - chatgpt: ChatGPT window handle
@@ -286,10 +325,10 @@ class TestHarness:
         chatgpt_handle = self.setup_chatgpt_page()
 
         # Step 2: Open popup
-        popup_handle = self.open_extension_popup(method=popup_method)
+        popup_handle = self.open_extension_popup()
 
         # Step 3: Sign in
-        self.sign_in_google_oauth()
+        self.sign_in()
 
         # Step 4: Wait for decryption
         self.wait_for_firebase_decryption()
@@ -309,6 +348,7 @@ class TestHarness:
             'popup': popup_handle
         }
 
+    @timed_step
     def create_test_profile(self, profile_data: Dict[str, str]) -> None:
         """
         Create a test profile.
@@ -332,19 +372,22 @@ class TestHarness:
         # Use popup page object
         popup = PopupPage(self.driver)
 
+        profiles_before = len(self.driver.find_elements(*Readiness.PROFILE_CARDS))
+
         # Click create profile button
         popup.click_create_profile()
-        time.sleep(1)
+        self.wait.until(EC.visibility_of_element_located((By.ID, 'profileModal')))
 
         # Fill form
         popup.fill_profile_form(profile_data)
 
         # Save
         popup.click_save_profile()
-        time.sleep(2)
+        self.ready.profile_cards(profiles_before + 1)
 
         print(f"[Harness] Profile created: {profile_data.get('profileName')}")
 
+    @timed_step
     def delete_test_profile(self, profile_name: str) -> None:
         """
         Delete a test profile by name.
@@ -360,16 +403,64 @@ class TestHarness:
         # Use popup page object
         popup = PopupPage(self.driver)
 
+        profiles_before = len(self.driver.find_elements(*Readiness.PROFILE_CARDS))
+
         # Select the profile
         popup.select_profile(profile_name)
-        time.sleep(0.5)
 
         # Delete it
         popup.delete_current_profile()
-        time.sleep(1)
+        self.ready.profile_cards(profiles_before - 1)
 
         print(f"[Harness] Profile deleted: {profile_name}")
 
+    @timed_step
+    def seed_profiles(self, count: Optional[int] = None,
+                      profiles: Optional[List[Dict[str, Any]]] = None,
+                      seed: int = 0) -> List[Dict[str, Any]]:
+        """
+        Create many profiles at once, bypassing the popup form.
+
+        This can only be called AFTER completing the mandatory flow. The
+        popup is reloaded and left showing all stored profiles.
+
+        Args:
+            count: Number of synthetic profiles to create
+            profiles: Explicit AliasProfile payloads instead of synthetic ones
+            seed: Random seed for synthetic profiles
+
+        Returns:
+            list: The seeded profiles
+        """
+        print(f"\n[Harness] Seeding {count if profiles is None else len(profiles)} profile(s)")
+
+        self.driver.switch_to.window(self.popup_window)
+        if self.profile_seeder is None:
+            self.profile_seeder = ProfileSeeder(self.driver, self.extension_id)
+
+        seeded = self.profile_seeder.seed(count=count, profiles=profiles, seed=seed)
+
+        self.driver.refresh()
+        self.ready.auth_state(signed_in=True)
+        count = self.ready.decrypted_profiles(min_count=len(seeded))
+
+        print(f"[Harness] Popup shows {count} profile(s)")
+        return seeded
+
+    @timed_step
+    def remove_seeded_profiles(self) -> None:
+        """Remove every profile created by seed_profiles() and reload the popup."""
+        if not self.profile_seeder or not self.profile_seeder.seeded_ids:
+            return
+
+        self.driver.switch_to.window(self.popup_window)
+        remaining = self.profile_seeder.remove(self.profile_seeder.seeded_ids)
+
+        self.driver.refresh()
+        self.ready.auth_state(signed_in=True)
+        self.ready.profile_cards(remaining)
+
+    @timed_step
     def sign_out(self) -> None:
         """
         Sign out the current user.
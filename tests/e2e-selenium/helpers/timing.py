@@ -0,0 +1,166 @@
+"""
+Step Timing for PromptBlocker E2E Tests.
+
+Every TestHarness step and BasePage action is recorded with monotonic
+start/end times, the test ID, the worker ID and its outcome. Records are
+appended to a per-worker JSONL file:
+
+    reports/timings/<worker>.jsonl
+
+    {"test": "tests/02_auth/...::test_x", "worker": "gw0",
+     "step": "TestHarness.sign_in", "parent": "TestHarness.complete_mandatory_flow",
+     "start": 1234.56, "end": 1235.01, "duration_ms": 450.2, "outcome": "passed"}
+
+The conftest fixture attaches a per-test summary to the Allure report.
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .worker_context import WorkerContext
+
+
+class StepTimer:
+    """
+    Records step timings for the running test.
+
+    Example:
+        ```python
+        with StepTimer.step('open popup'):
+            harness.open_popup_page()
+
+        class TestHarness:
+            @timed_step
+            def sign_in(self): ...
+        ```
+    """
+
+    TIMINGS_DIR = WorkerContext.REPORTS_DIR / 'timings'
+
+    _test: Optional[str] = None
+    _records: List[Dict[str, Any]] = []
+    _stack = threading.local()
+    _file = None
+    _lock = threading.Lock()
+
+    # ========================================
+    # Test Lifecycle
+    # ========================================
+
+    @classmethod
+    def begin(cls, test_id: str) -> None:
+        """Start collecting records for a test."""
+        cls._test = test_id
+        cls._records = []
+
+    @classmethod
+    def end(cls) -> List[Dict[str, Any]]:
+        """
+        Stop collecting records for the current test.
+
+        Returns:
+            list: Records of the test, in completion order
+        """
+        records, cls._records, cls._test = cls._records, [], None
+        return records
+
+    # ========================================
+    # Recording
+    # ========================================
+
+    @classmethod
+    @contextmanager
+    def step(cls, name: str) -> Iterator[None]:
+        """
+        Time a block as a named step.
+
+        Args:
+            name: Step name (e.g. 'TestHarness.sign_in')
+        """
+        stack = cls._parents()
+        parent = stack[-1] if stack else None
+        stack.append(name)
+
+        outcome, error = 'passed', None
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            outcome, error = 'failed', f"{type(e).__name__}: {e}".splitlines()[0][:200]
+            raise
+        finally:
+            end = time.monotonic()
+            stack.pop()
+            cls._record({
+                'test': cls._test,
+                'worker': WorkerContext.worker_id(),
+                'step': name,
+                'parent': parent,
+                'start': round(start, 6),
+                'end': round(end, 6),
+                'duration_ms': round((end - start) * 1000, 1),
+                'outcome': outcome,
+                'error': error,
+            })
+
+    @classmethod
+    def _parents(cls) -> List[str]:
+        """Names of the steps currently running on this thread."""
+        if not hasattr(cls._stack, 'names'):
+            cls._stack.names = []
+        return cls._stack.names
+
+    @classmethod
+    def _record(cls, record: Dict[str, Any]) -> None:
+        """Keep a record for the test summary and append it to the JSONL file."""
+        with cls._lock:
+            cls._records.append(record)
+            if cls._file is None:
+                cls.TIMINGS_DIR.mkdir(parents=True, exist_ok=True)
+                path = cls.TIMINGS_DIR / f'{WorkerContext.worker_id()}.jsonl'
+                cls._file = open(path, 'a', encoding='utf-8', buffering=1)
+            cls._file.write(json.dumps(record) + '\n')
+
+    # ========================================
+    # Reporting
+    # ========================================
+
+    @staticmethod
+    def summarize(records: List[Dict[str, Any]]) -> str:
+        """
+        Format a test's records as a text table (steps indented by nesting).
+
+        Args:
+            records: Records returned by end()
+
+        Returns:
+            str: Table ordered by start time
+        """
+        depth: Dict[Optional[str], int] = {None: -1}
+        lines = [f"{'Step':<60} {'ms':>9}  Outcome", '-' * 80]
+
+        for record in sorted(records, key=lambda r: r['start']):
+            level = depth.get(record['parent'], -1) + 1
+            depth[record['step']] = level
+            name = ('  ' * level + record['step'])[:60]
+            lines.append(f"{name:<60} {record['duration_ms']:>9.1f}  {record['outcome']}")
+
+        top_level = [r for r in records if r['parent'] is None]
+        lines.append('-' * 80)
+        lines.append(f"{'Total (top-level steps)':<60} {sum(r['duration_ms'] for r in top_level):>9.1f}")
+        return '\n'.join(lines)
+
+
+def timed_step(func: Callable) -> Callable:
+    """
+    Decorator recording a method call as a step named '<Class>.<method>'.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with StepTimer.step(f"{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,171 @@
+"""
+Virtual Display for headless Linux runners.
+
+Chrome's new headless mode (--headless=new) runs extensions, but the
+PyAutoGUI paths (ExtensionHelper) need a real X server. VirtualDisplay
+starts one Xvfb per pytest worker and points DISPLAY at it, so parallel
+workers never share a screen, mouse or keyboard focus:
+
+    main -> :99    gw0 -> :99    gw1 -> :100    gw2 -> :101 ...
+
+The base display number can be moved with E2E_DISPLAY_BASE. If another X
+server already holds a worker's number (a developer's session, a stale
+Xvfb), the next free number is used instead.
+"""
+
+import os
+import select
+import shutil
+import subprocess
+from typing import Optional, Tuple
+
+from .worker_context import WorkerContext
+
+
+class VirtualDisplay:
+    """
+    Per-worker Xvfb server.
+
+    Example:
+        ```python
+        with VirtualDisplay() as display:
+            driver = ChromeDriverManager.get_driver(extension_path)  # uses display.name
+        ```
+    """
+
+    DEFAULT_SIZE = (1920, 1080)
+    STARTUP_TIMEOUT = 10  # seconds
+
+    # Display numbers tried after the preferred one is taken
+    MAX_ATTEMPTS = 20
+
+    def __init__(self, number: Optional[int] = None, size: Tuple[int, int] = DEFAULT_SIZE,
+                 depth: int = 24):
+        """
+        Initialize the virtual display.
+
+        Args:
+            number: X display number (default: E2E_DISPLAY_BASE/99 + worker index)
+            size: Screen width and height in pixels
+            depth: Color depth
+        """
+        if number is None:
+            number = int(os.getenv('E2E_DISPLAY_BASE', '99')) + WorkerContext.index()
+
+        self.number = number
+        self.size = size
+        self.depth = depth
+        self._process: Optional[subprocess.Popen] = None
+        self._previous_display: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """DISPLAY value, e.g. ':99'."""
+        return f':{self.number}'
+
+    def start(self) -> 'VirtualDisplay':
+        """
+        Start Xvfb and export DISPLAY for this process (and Chrome).
+
+        Returns:
+            VirtualDisplay: self
+
+        Raises:
+            RuntimeError: If Xvfb is not installed or does not come up
+        """
+        if not shutil.which('Xvfb'):
+            raise RuntimeError("Xvfb not found. Install it (apt-get install xvfb) "
+                               "or use --display-mode=headless")
+
+        preferred = self.number
+        for number in range(preferred, preferred + self.MAX_ATTEMPTS):
+            if self._launch(number):
+                break
+            print(f"[Display] :{number} is taken by another X server")
+        else:
+            raise RuntimeError(f"No free X display in :{preferred}-:{preferred + self.MAX_ATTEMPTS - 1}")
+
+        self._previous_display = os.environ.get('DISPLAY')
+        os.environ['DISPLAY'] = self.name
+        width, height = self.size
+        print(f"[Display] Xvfb running on {self.name} ({width}x{height})")
+        return self
+
+    def _launch(self, number: int) -> bool:
+        """
+        Start Xvfb on one display number and wait until it accepts clients.
+
+        Xvfb writes the display number to -displayfd once it is ready, so
+        only our own server is ever accepted (an existing socket file may
+        belong to another X server).
+
+        Args:
+            number: X display number to claim
+
+        Returns:
+            bool: True if running, False if the number is already in use
+
+        Raises:
+            RuntimeError: If Xvfb fails for another reason or times out
+        """
+        width, height = self.size
+        ready_fd, write_fd = os.pipe()
+        try:
+            self._process = subprocess.Popen(
+                ['Xvfb', f':{number}', '-displayfd', str(write_fd),
+                 '-screen', '0', f'{width}x{height}x{self.depth}', '-nolisten', 'tcp', '-ac'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                pass_fds=(write_fd,)
+            )
+            os.close(write_fd)
+            write_fd = None
+
+            ready, _, _ = select.select([ready_fd], [], [], self.STARTUP_TIMEOUT)
+            # Empty read: Xvfb exited without announcing a display
+            announced = os.read(ready_fd, 32).decode(errors='replace').strip() if ready else None
+        finally:
+            os.close(ready_fd)
+            if write_fd is not None:
+                os.close(write_fd)
+
+        if announced == str(number):
+            self.number = number
+            return True
+
+        if announced is None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+            raise RuntimeError(f"Xvfb :{number} did not start within {self.STARTUP_TIMEOUT}s")
+
+        self._process.wait()
+        error = self._process.stderr.read().decode(errors='replace').strip()
+        self._process = None
+        if 'already active' in error:
+            return False
+        raise RuntimeError(f"Xvfb :{number} exited: {error}")
+
+    def stop(self) -> None:
+        """Stop Xvfb and restore the previous DISPLAY."""
+        if self._process is None:
+            return
+
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._process = None
+
+        if self._previous_display is None:
+            os.environ.pop('DISPLAY', None)
+        else:
+            os.environ['DISPLAY'] = self._previous_display
+        print(f"[Display] Xvfb {self.name} stopped")
+
+    def __enter__(self) -> 'VirtualDisplay':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,114 @@
+"""
+Wait Policy for PromptBlocker E2E Tests.
+
+The suite runs on explicit waits only. An implicit wait turns every
+negative check (find_element on an absent element) into a full-timeout
+stall, so drivers are created with implicit wait 0 and all timeouts and
+polling intervals come from here:
+
+    E2E_WAIT_TIMEOUT   default explicit-wait timeout in seconds (10)
+    E2E_POLL_INTERVAL  seconds between condition checks (0.1)
+
+The implicit wait of each session is tracked here, so change it only with
+WaitPolicy.set_implicit_wait(), never with driver.implicitly_wait().
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class WaitPolicy:
+    """
+    Single source of timeout and polling settings.
+
+    Implicit waits must be set through apply() or set_implicit_wait(): a
+    direct driver.implicitly_wait() leaves _implicit_waits stale, and
+    no_implicit_wait() would then skip disabling it.
+
+    Example:
+        ```python
+        WaitPolicy.wait(driver).until(EC.visibility_of_element_located(locator))
+
+        with WaitPolicy.no_implicit_wait(driver):
+            present = bool(driver.find_elements(*locator))
+        ```
+    """
+
+    TIMEOUT = float(os.getenv('E2E_WAIT_TIMEOUT', '10'))
+    POLL_INTERVAL = float(os.getenv('E2E_POLL_INTERVAL', '0.1'))
+
+    # Never wait implicitly: absent elements must be detected immediately
+    IMPLICIT_WAIT = 0
+
+    # Implicit wait last set per session, so probes never have to ask the driver
+    _implicit_waits: Dict[str, float] = {}
+
+    @classmethod
+    def wait(cls, driver: WebDriver, timeout: Optional[float] = None,
+             ignore_driver_errors: bool = False) -> WebDriverWait:
+        """
+        Create an explicit wait using the policy.
+
+        Args:
+            driver: Selenium WebDriver instance
+            timeout: Override the default timeout (0 checks the condition once)
+            ignore_driver_errors: Keep polling through WebDriverExceptions
+                (e.g. a page navigating while the condition runs)
+
+        Returns:
+            WebDriverWait: Configured wait
+        """
+        return WebDriverWait(
+            driver,
+            cls.TIMEOUT if timeout is None else timeout,
+            poll_frequency=cls.POLL_INTERVAL,
+            ignored_exceptions=(WebDriverException,) if ignore_driver_errors else None
+        )
+
+    @classmethod
+    def apply(cls, driver: WebDriver) -> None:
+        """Apply the policy's driver-level timeouts to a new driver."""
+        cls.set_implicit_wait(driver, cls.IMPLICIT_WAIT)
+
+    @classmethod
+    @contextmanager
+    def no_implicit_wait(cls, driver: WebDriver) -> Iterator[None]:
+        """
+        Temporarily disable the implicit wait for presence probes.
+
+        Free under the policy: the implicit wait apply() set is tracked
+        here, so nothing is sent to the driver. Only drivers configured
+        elsewhere are asked once for their implicit wait.
+        """
+        previous = cls._implicit_waits.get(driver.session_id)
+        if previous is None:
+            previous = cls._implicit_waits[driver.session_id] = driver.timeouts.implicit_wait
+        if not previous:
+            yield
+            return
+
+        cls.set_implicit_wait(driver, 0)
+        try:
+            yield
+        finally:
+            cls.set_implicit_wait(driver, previous)
+
+    @classmethod
+    def set_implicit_wait(cls, driver: WebDriver, seconds: float) -> None:
+        """
+        Set the implicit wait and remember it.
+
+        The only supported way to change a driver's implicit wait (the
+        policy keeps it at 0; see no_implicit_wait()).
+
+        Args:
+            driver: Selenium WebDriver instance
+            seconds: Implicit wait in seconds
+        """
+        driver.implicitly_wait(seconds)
+        cls._implicit_waits[driver.session_id] = seconds
@@ -0,0 +1,263 @@
+"""
+WebSocket Interception Benchmarks for PromptBlocker performance tests.
+
+On copilot.microsoft.com inject.js replaces window.WebSocket and
+WebSocket.prototype.send. Sockets to '/c/api/chat' are tracked in a
+WeakMap, and every send() is held back until the service worker has
+substituted the message (SUBSTITUTE_REQUEST, 5s timeout, after which the
+original is sent). This module measures that path against
+MockPlatformServer's echo sockets, from the mock Copilot page:
+
+    chat         wss://copilot.microsoft.com/c/api/chat   (intercepted)
+    passthrough  wss://copilot.microsoft.com/c/api/echo   (same server, not intercepted)
+
+- throughput: batches of pipelined Copilot-shaped messages, messages/sec
+- latency: one message at a time, send() -> echo received
+- memory: JS heap (after a forced GC) following each chat batch, as a trend
+- leaks: echoed messages that still contain real PII (sent unsubstituted)
+
+Results are appended to reports/benchmarks/websocket/<worker>.jsonl and
+printed as a table at the end of a performance run.
+"""
+
+from typing import Any, Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .benchmark_store import BenchmarkStore
+from .stats import Stats
+from .worker_context import WorkerContext
+
+
+class WebSocketBenchmark(BenchmarkStore):
+    """
+    Times messages through the intercepted Copilot socket and a pass-through one.
+
+    Example:
+        ```python
+        driver.get('https://copilot.microsoft.com')   # mock platform page
+        bench = WebSocketBenchmark(driver)
+        bench.open()
+        result = bench.run('My name is ...', real_values=['...'])
+        bench.close()
+        ```
+    """
+
+    RESULTS_DIR = WorkerContext.REPORTS_DIR / 'benchmarks' / 'websocket'
+
+    MODES = ['passthrough', 'chat']
+
+    BATCHES = 6
+    BATCH_SIZE = 500
+    LATENCY_MESSAGES = 200
+
+    SCRIPT_TIMEOUT = 300
+
+    # Opens both sockets; echoes are matched to pending sends by message id
+    OPEN_SCRIPT = """
+        const [urls] = arguments;
+        const done = arguments[arguments.length - 1];
+        (async () => {
+            if (/\\[native code\\]/.test(WebSocket.prototype.send.toString())) {
+                throw new Error('WebSocket.send is not wrapped (inject.js missing or not on Copilot)');
+            }
+            const bench = { sockets: {}, pending: new Map(), nextId: 0 };
+            for (const [mode, url] of Object.entries(urls)) {
+                const socket = new WebSocket(url);
+                await new Promise((resolve, reject) => {
+                    socket.addEventListener('open', resolve, { once: true });
+                    socket.addEventListener('error', () => reject(new Error(`Could not open ${url}`)), { once: true });
+                });
+                socket.addEventListener('message', (event) => {
+                    const message = JSON.parse(event.data);
+                    const resolve = bench.pending.get(message.id);
+                    if (resolve) {
+                        bench.pending.delete(message.id);
+                        resolve(message.content[0].text);
+                    }
+                });
+                bench.sockets[mode] = socket;
+            }
+            window.__wsBench = bench;
+        })().then(() => done({ ok: true })).catch((error) => done({ error: String(error) }));
+    """
+
+    # Sends `count` messages (all at once when pipelined, else one by one)
+    # and returns per-message latencies, wall time and unsubstituted echoes
+    BATCH_SCRIPT = """
+        const [mode, count, text, realValues, pipelined] = arguments;
+        const done = arguments[arguments.length - 1];
+        const bench = window.__wsBench;
+        const socket = bench.sockets[mode];
+
+        const sendOne = () => new Promise((resolve) => {
+            const id = bench.nextId++;
+            const t0 = performance.now();
+            bench.pending.set(id, (echoed) => resolve({ latency: performance.now() - t0, echoed }));
+            socket.send(JSON.stringify({
+                event: 'send', id, conversationId: 'e2e-benchmark',
+                content: [{ type: 'text', text }], mode: 'chat'
+            }));
+        });
+
+        (async () => {
+            const started = performance.now();
+            let results = [];
+            if (pipelined) {
+                results = await Promise.all(Array.from({ length: count }, sendOne));
+            } else {
+                for (let i = 0; i < count; i++) results.push(await sendOne());
+            }
+            return {
+                elapsed: performance.now() - started,
+                samples: results.map((r) => r.latency),
+                leaked: results.filter((r) => realValues.some((value) => r.echoed.includes(value))).length
+            };
+        })().then(done).catch((error) => done({ error: String(error) }));
+    """
+
+    CLOSE_SCRIPT = """
+        const bench = window.__wsBench;
+        if (bench) Object.values(bench.sockets).forEach((socket) => socket.close());
+        delete window.__wsBench;
+    """
+
+    def __init__(self, driver: WebDriver, origin: str = 'wss://copilot.microsoft.com'):
+        """
+        Initialize the benchmark on the current (Copilot) page.
+
+        Args:
+            driver: Selenium WebDriver instance, on a copilot.microsoft.com page
+            origin: WebSocket origin mapped to MockPlatformServer
+        """
+        self.driver = driver
+        self.urls = {
+            'chat': f'{origin}/c/api/chat?api-version=2',
+            'passthrough': f'{origin}/c/api/echo?api-version=2',
+        }
+
+    def open(self) -> None:
+        """
+        Open the chat and pass-through sockets in the page.
+
+        Raises:
+            RuntimeError: If the sockets can't be opened or aren't wrapped
+        """
+        result = self.driver.execute_async_script(self.OPEN_SCRIPT, self.urls)
+        if not result or result.get('error'):
+            raise RuntimeError(f"WebSocket benchmark setup failed: {result}")
+
+    def close(self) -> None:
+        """Close the sockets."""
+        self.driver.execute_script(self.CLOSE_SCRIPT)
+
+    def batch(self, mode: str, count: int, text: str, real_values: List[str],
+              pipelined: bool = True) -> Dict[str, Any]:
+        """
+        Send one batch of messages and wait for all echoes.
+
+        Args:
+            mode: 'chat' (intercepted) or 'passthrough'
+            count: Messages in the batch
+            text: Message text
+            real_values: Real PII values that must not come back echoed
+            pipelined: Send all at once (throughput) or one by one (latency)
+
+        Returns:
+            dict: elapsed (ms), samples (per-message ms), leaked (count)
+        """
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            result = self.driver.execute_async_script(
+                self.BATCH_SCRIPT, mode, count, text, real_values, pipelined
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if not result or result.get('error'):
+            raise RuntimeError(f"WebSocket batch failed: {result}")
+        return result
+
+    def heap_used(self) -> int:
+        """JS heap in use by the page after a forced garbage collection (bytes)."""
+        self.driver.execute_cdp_cmd('HeapProfiler.collectGarbage', {})
+        return int(self.driver.execute_cdp_cmd('Runtime.getHeapUsage', {})['usedSize'])
+
+    def run(self, text: str, real_values: List[str], batches: int = BATCHES,
+            batch_size: int = BATCH_SIZE, latency_messages: int = LATENCY_MESSAGES) -> Dict[str, Any]:
+        """
+        Measure throughput, latency and heap trend for one message.
+
+        Throughput batches alternate between the two sockets; the heap is
+        sampled before the first and after every chat batch.
+
+        Args:
+            text: Message text (should contain real PII)
+            real_values: Real PII values in `text`
+            batches: Pipelined batches per socket
+            batch_size: Messages per batch
+            latency_messages: Sequential messages per socket for latency
+
+        Returns:
+            dict: 'throughput' (messages/sec per mode), 'latency' (Stats.summarize()
+                per mode), 'added' (chat - passthrough latency per
+                percentile), 'heap' (samples and growth per 1000 messages)
+                and 'leaked' (unsubstituted chat messages)
+        """
+        totals = {mode: {'messages': 0, 'elapsed': 0.0} for mode in self.MODES}
+        heap = [{'messages': 0, 'bytes': self.heap_used()}]
+        leaked = 0
+
+        for index in range(batches):
+            order = self.MODES if index % 2 == 0 else list(reversed(self.MODES))
+            for mode in order:
+                result = self.batch(mode, batch_size, text, real_values)
+                totals[mode]['messages'] += batch_size
+                totals[mode]['elapsed'] += result['elapsed']
+                if mode == 'chat':
+                    leaked += result['leaked']
+                    heap.append({'messages': totals['chat']['messages'], 'bytes': self.heap_used()})
+
+        latency = {}
+        for mode in self.MODES:
+            result = self.batch(mode, latency_messages, text, real_values, pipelined=False)
+            latency[mode] = Stats.summarize(result['samples'], result['elapsed'])
+            if mode == 'chat':
+                leaked += result['leaked']
+
+        return {
+            'throughput': {mode: round(t['messages'] / (t['elapsed'] / 1000), 1) if t['elapsed'] else 0.0
+                           for mode, t in totals.items()},
+            'latency': latency,
+            'added': {key: round(latency['chat'][key] - latency['passthrough'][key], 3)
+                      for key in ('mean_ms', 'p50_ms', 'p95_ms', 'p99_ms')},
+            'heap': {'samples': heap, 'growth_per_1k_bytes': Stats.growth_per_1k(heap)},
+            'leaked': leaked,
+        }
+
+    # ========================================
+    # Results
+    # ========================================
+
+    @staticmethod
+    def report(records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Format WebSocket benchmark records as a table.
+
+        Args:
+            records: Records with 'name' and run() fields
+
+        Returns:
+            list: Report lines
+        """
+        lines = [f"  {'case':<20} {'pass msg/s':>11} {'chat msg/s':>11} {'+p50 ms':>9} "
+                 f"{'+p95 ms':>9} {'+p99 ms':>9} {'heap KB/1k':>11} {'leaked':>7}"]
+        for record in sorted(records, key=lambda r: r['name']):
+            lines.append(
+                f"  {record['name'][:20]:<20} {record['throughput']['passthrough']:>11.0f} "
+                f"{record['throughput']['chat']:>11.0f} {record['added']['p50_ms']:>9.2f} "
+                f"{record['added']['p95_ms']:>9.2f} {record['added']['p99_ms']:>9.2f} "
+                f"{record['heap']['growth_per_1k_bytes'] / 1024:>11.1f} {record['leaked']:>7}"
+            )
+        return lines
@@ -0,0 +1,141 @@
+"""
+Worker Context for parallel (pytest-xdist) E2E runs.
+
+Every xdist worker drives its own Chrome, so anything a browser or a test
+writes to disk must be namespaced by worker:
+- Chrome user-data-dir (Chrome locks the profile directory)
+- Failure/step screenshots
+- Log files
+
+Without xdist the worker ID is 'main' and paths stay un-namespaced, so
+serial runs keep their original layout.
+"""
+
+import os
+from pathlib import Path
+
+
+class WorkerContext:
+    """
+    Static helpers describing the current pytest worker.
+    """
+
+    SUITE_ROOT = Path(__file__).parent.parent
+    REPORTS_DIR = SUITE_ROOT / 'reports'
+    CHROME_PROFILES_DIR = SUITE_ROOT / 'chrome_profile'
+
+    @staticmethod
+    def worker_id() -> str:
+        """
+        Get the xdist worker ID.
+
+        Returns:
+            str: 'gw0', 'gw1', ... under xdist, otherwise 'main'
+        """
+        return os.getenv('PYTEST_XDIST_WORKER', 'main')
+
+    @staticmethod
+    def is_xdist_worker() -> bool:
+        """
+        Whether this process is an xdist worker.
+
+        False in the xdist controller, which runs no tests itself.
+        """
+        return 'PYTEST_XDIST_WORKER' in os.environ
+
+    @staticmethod
+    def is_controller() -> bool:
+        """
+        Whether this process sees the whole run: the xdist controller, or
+        the only process of a serial run.
+        """
+        return not WorkerContext.is_xdist_worker()
+
+    @staticmethod
+    def count() -> int:
+        """
+        Get the number of workers in the run.
+
+        Returns:
+            int: xdist worker count, 1 when not running in parallel
+        """
+        return int(os.getenv('PYTEST_XDIST_WORKER_COUNT', '1'))
+
+    @staticmethod
+    def index() -> int:
+        """
+        Get the numeric worker index.
+
+        Returns:
+            int: 3 for 'gw3', 0 when not running in parallel
+        """
+        worker = WorkerContext.worker_id()
+        return int(worker[2:]) if worker.startswith('gw') else 0
+
+    @staticmethod
+    def path(base: Path) -> Path:
+        """
+        Namespace a directory by worker (only when running in parallel).
+
+        Args:
+            base: Base directory
+
+        Returns:
+            Path: base/<worker_id> under xdist, base otherwise
+        """
+        if WorkerContext.is_xdist_worker():
+            return Path(base) / WorkerContext.worker_id()
+        return Path(base)
+
+    @staticmethod
+    def chrome_profile_dir() -> Path:
+        """
+        Chrome user-data-dir for this worker (created if missing).
+
+        Returns:
+            Path: chrome_profile/ or chrome_profile/<worker_id>/
+        """
+        profile_dir = WorkerContext.path(WorkerContext.CHROME_PROFILES_DIR)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        return profile_dir
+
+    @staticmethod
+    def screenshots_dir() -> Path:
+        """
+        Screenshot directory for this worker (created if missing).
+
+        Returns:
+            Path: reports/screenshots/ or reports/screenshots/<worker_id>/
+        """
+        screenshots = WorkerContext.path(WorkerContext.REPORTS_DIR / 'screenshots')
+        screenshots.mkdir(parents=True, exist_ok=True)
+        return screenshots
+
+    @staticmethod
+    def screenshot_path(filename: str) -> str:
+        """
+        Full path for a screenshot file in this worker's directory.
+
+        Args:
+            filename: Screenshot file name (e.g. 'oauth-email-failed.png')
+
+        Returns:
+            str: Absolute path to write the screenshot to
+        """
+        return str(WorkerContext.screenshots_dir() / filename)
+
+    @staticmethod
+    def log_file(log_file: str) -> str:
+        """
+        Per-worker variant of a log file path.
+
+        Args:
+            log_file: Configured log file (e.g. 'reports/test_execution.log')
+
+        Returns:
+            str: 'reports/test_execution.gw0.log' under xdist, unchanged otherwise
+        """
+        if not WorkerContext.is_xdist_worker():
+            return log_file
+        path = Path(log_file)
+        return str(path.with_name(f"{path.stem}.{WorkerContext.worker_id()}{path.suffix}"))
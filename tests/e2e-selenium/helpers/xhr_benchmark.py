@@ -0,0 +1,197 @@
+"""
+Gemini XHR Interception Benchmarks for PromptBlocker performance tests.
+
+Gemini doesn't use fetch: prompts are XMLHttpRequest form posts
+(`f.req=<json>&at=<token>&`) to BardChatUi endpoints. On
+gemini.google.com inject.js replaces XMLHttpRequest.prototype.open/send;
+a POST whose URL contains 'BardChatUi' or 'batchexecute' is held back until
+the service worker has substituted the f.req value (SUBSTITUTE_REQUEST),
+and its response goes through SUBSTITUTE_RESPONSE before
+onreadystatechange runs. Every other request is sent straight through.
+
+This module fires batches of concurrent XHRs with the same form body from
+the mock Gemini page to two MockPlatformServer endpoints:
+
+    intercepted  https://gemini.google.com/_/BardChatUi/data/.../StreamGenerate
+    passthrough  https://gemini.google.com/_/GeminiEcho/data/StreamGenerate
+
+and reports the added latency per request (intercepted - passthrough at
+each percentile). What reached the server is recorded by the mock for the
+intercepted endpoint, so tests can check the substituted bodies.
+
+Results are appended to reports/benchmarks/xhr/<worker>.jsonl and printed
+as a table at the end of a performance run.
+"""
+
+from typing import Any, Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .mock_platform import MockPlatformServer
+from .benchmark_store import BenchmarkStore
+from .stats import Stats
+from .worker_context import WorkerContext
+
+
+class GeminiXHRBenchmark(BenchmarkStore):
+    """
+    Times Gemini prompt XHRs through inject.js's XHR interception and past it.
+
+    Example:
+        ```python
+        driver.get('https://gemini.google.com')   # mock platform page
+        bench = GeminiXHRBenchmark(driver)
+        result = bench.run('Hi, I am ...', requests=60)
+        print(result['added']['p95_ms'])
+        ```
+    """
+
+    RESULTS_DIR = WorkerContext.REPORTS_DIR / 'benchmarks' / 'xhr'
+
+    MODES = ['passthrough', 'intercepted']
+
+    REQUESTS = 60
+    # Chrome opens at most 6 HTTP/1.1 connections per host
+    BATCH_SIZE = 6
+    WARMUP_REQUESTS = 2
+
+    SCRIPT_TIMEOUT = 600
+
+    # Alternates batches of `batchSize` concurrent XHRs between the two
+    # endpoints; a sample ends when the response is complete (after the
+    # wrapper's response handling) or the request failed
+    LOOP_SCRIPT = """
+        const [urls, body, requests, batchSize, warmup] = arguments;
+        const done = arguments[arguments.length - 1];
+
+        const once = (url) => new Promise((resolve) => {
+            const xhr = new XMLHttpRequest();
+            const t0 = performance.now();
+            let settled = false;
+            const finish = (ok) => {
+                if (settled) return;
+                settled = true;
+                resolve({ latency: performance.now() - t0, ok: ok && xhr.status === 200 });
+            };
+            xhr.open('POST', url, true);
+            xhr.setRequestHeader('Content-Type', 'application/x-www-form-urlencoded;charset=UTF-8');
+            xhr.addEventListener('load', () => finish(true));
+            // inject.js dispatches a bare 'error' when it blocks a request
+            xhr.addEventListener('error', () => finish(false));
+            xhr.addEventListener('abort', () => finish(false));
+            xhr.send(body);
+        });
+
+        (async () => {
+            if (/\\[native code\\]/.test(XMLHttpRequest.prototype.send.toString())) {
+                throw new Error('XMLHttpRequest.send is not wrapped (inject.js missing or not on Gemini)');
+            }
+
+            const results = {};
+            for (const mode of Object.keys(urls)) {
+                results[mode] = { samples: [], elapsed: 0, failed: 0 };
+                for (let i = 0; i < warmup; i++) await once(urls[mode]);
+            }
+
+            const batches = Math.ceil(requests / batchSize);
+            for (let b = 0; b < batches; b++) {
+                // Alternate which endpoint goes first so neither always runs on warmer connections
+                const order = b % 2 ? ['intercepted', 'passthrough'] : ['passthrough', 'intercepted'];
+                for (const mode of order) {
+                    const t0 = performance.now();
+                    const batch = await Promise.all(Array.from({ length: batchSize }, () => once(urls[mode])));
+                    results[mode].elapsed += performance.now() - t0;
+                    results[mode].samples.push(...batch.map((r) => r.latency));
+                    results[mode].failed += batch.filter((r) => !r.ok).length;
+                }
+            }
+            return { results, sent: warmup + batches * batchSize };
+        })().then(done).catch((error) => done({ error: String(error) }));
+    """
+
+    def __init__(self, driver: WebDriver, origin: str = 'https://gemini.google.com'):
+        """
+        Initialize the benchmark on the current (Gemini) page.
+
+        Args:
+            driver: Selenium WebDriver instance, on a gemini.google.com page
+            origin: Origin mapped to MockPlatformServer
+        """
+        self.driver = driver
+        self.urls = {
+            'passthrough': f'{origin}{MockPlatformServer.GEMINI_ECHO_PATH}?rt=c',
+            'intercepted': f'{origin}{MockPlatformServer.GEMINI_GENERATE_PATH}?rt=c',
+        }
+
+    def run(self, text: str, requests: int = REQUESTS, batch_size: int = BATCH_SIZE,
+            warmup: int = WARMUP_REQUESTS) -> Dict[str, Any]:
+        """
+        Send the same Gemini prompt form through both endpoints.
+
+        Args:
+            text: Prompt text (sent as a Gemini f.req form body)
+            requests: Timed requests per endpoint (rounded up to whole batches)
+            batch_size: Concurrent XHRs per batch
+            warmup: Untimed requests per endpoint first
+
+        Returns:
+            dict: 'body_bytes', 'passthrough' and 'intercepted' statistics
+                from Stats.summarize() plus 'failed', 'added'
+                (intercepted - passthrough per percentile) and 'sent'
+                (intercepted requests, warmup included)
+
+        Raises:
+            RuntimeError: If the loop fails
+        """
+        body = MockPlatformServer.gemini_form(text)
+
+        previous_timeout = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.SCRIPT_TIMEOUT)
+        try:
+            result = self.driver.execute_async_script(
+                self.LOOP_SCRIPT, self.urls, body, requests, batch_size, warmup
+            )
+        finally:
+            self.driver.set_script_timeout(previous_timeout)
+
+        if not result or result.get('error'):
+            raise RuntimeError(f"Gemini XHR benchmark loop failed: {result}")
+
+        stats: Dict[str, Any] = {'body_bytes': len(body.encode('utf-8'))}
+        for mode in self.MODES:
+            mode_result = result['results'][mode]
+            stats[mode] = {
+                **Stats.summarize(mode_result['samples'], mode_result['elapsed']),
+                'failed': mode_result['failed'],
+            }
+
+        stats['added'] = {key: round(stats['intercepted'][key] - stats['passthrough'][key], 3)
+                          for key in ('mean_ms', 'p50_ms', 'p95_ms', 'p99_ms')}
+        stats['sent'] = result['sent']
+        return stats
+
+    # ========================================
+    # Results
+    # ========================================
+
+    @staticmethod
+    def report(records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Format Gemini XHR benchmark records as a table.
+
+        Args:
+            records: Records with 'name' and run() fields
+
+        Returns:
+            list: Report lines
+        """
+        lines = [f"  {'case':<20} {'body KB':>8} {'pass p50':>9} {'xhr p50':>9} {'+p50 ms':>9} "
+                 f"{'+p95 ms':>9} {'+p99 ms':>9} {'failed':>7}"]
+        for record in sorted(records, key=lambda r: r['body_bytes']):
+            lines.append(
+                f"  {record['name'][:20]:<20} {record['body_bytes'] / 1024:>8.1f} "
+                f"{record['passthrough']['p50_ms']:>9.2f} {record['intercepted']['p50_ms']:>9.2f} "
+                f"{record['added']['p50_ms']:>9.2f} {record['added']['p95_ms']:>9.2f} "
+                f"{record['added']['p99_ms']:>9.2f} {record['intercepted']['failed']:>7}"
+            )
+        return lines
@@ -9,6 +9,6 @@ This package contains page objects for:
 - etc.
 """
 
-from .base_page import BasePage
+from .base_page import ActionBatch, BasePage
 
-__all__ = ['BasePage']
+__all__ = ['ActionBatch', 'BasePage']
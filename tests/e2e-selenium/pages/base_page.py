@@ -6,16 +6,159 @@ This provides common functionality that all page objects inherit:
 - Clicking, typing, getting text
 - Screenshot capture
 - JavaScript execution
+- Batched actions (many steps, one WebDriver round-trip)
 """
 
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 import time
 
+from helpers.timing import timed_step
+from helpers.wait_policy import WaitPolicy
+
+
+class ActionBatch:
+    """
+    Queue of page actions executed in a single execute_script call.
+
+    Each BasePage.type() is a wait, a clear() and a send_keys() - three or
+    more WebDriver round-trips per field. A batch resolves every locator,
+    sets values through the native setter (so framework-bound inputs see
+    the change), dispatches real input/change events and clicks, all in
+    one round-trip. Steps run in order and stop at the first failure.
+
+    Example:
+        ```python
+        results = (page.batch()
+                   .set_value((By.ID, 'profileName'), 'Work')
+                   .set_value((By.ID, 'realName'), 'John Smith')
+                   .click((By.ID, 'saveProfileBtn'))
+                   .run())
+        ```
+    """
+
+    # Runs the queued steps; returns one result per step
+    SCRIPT = """
+        const steps = arguments[0];
+        const stopOnError = arguments[1];
+
+        const resolve = (by, selector) => {
+            switch (by) {
+                case 'id': return document.getElementById(selector);
+                case 'css selector': return document.querySelector(selector);
+                case 'name': return document.querySelector(`[name="${CSS.escape(selector)}"]`);
+                case 'class name': return document.getElementsByClassName(selector)[0] || null;
+                case 'tag name': return document.getElementsByTagName(selector)[0] || null;
+                case 'xpath':
+                    return document.evaluate(selector, document, null,
+                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                default: throw new Error(`Unsupported locator strategy: ${by}`);
+            }
+        };
+        const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+
+        const results = [];
+        let failed = false;
+
+        for (const [index, step] of steps.entries()) {
+            const result = { index, action: step.action, locator: step.locator, ok: false, value: null, error: null };
+            results.push(result);
+
+            if (failed && stopOnError) {
+                result.error = 'skipped';
+                continue;
+            }
+
+            try {
+                const el = resolve(step.locator[0], step.locator[1]);
+                if (!el) throw new Error('element not found');
+
+                if (step.action === 'find') {
+                    result.value = el.value !== undefined ? el.value : el.textContent;
+                } else if (!visible(el)) {
+                    throw new Error('element not visible');
+                } else if (step.action === 'set_value') {
+                    el.focus();
+                    const proto = Object.getPrototypeOf(el);
+                    const setter = Object.getOwnPropertyDescriptor(proto, 'value');
+                    if (setter && setter.set) setter.set.call(el, step.value);
+                    else el.value = step.value;
+                    el.dispatchEvent(new Event('input', { bubbles: true }));
+                    el.dispatchEvent(new Event('change', { bubbles: true }));
+                    result.value = el.value;
+                } else if (step.action === 'click') {
+                    if (el.disabled) throw new Error('element disabled');
+                    el.click();
+                } else {
+                    throw new Error(`Unknown action: ${step.action}`);
+                }
+                result.ok = true;
+            } catch (e) {
+                result.error = e.message || String(e);
+                failed = true;
+            }
+        }
+        return results;
+    """
+
+    def __init__(self, driver: WebDriver):
+        """
+        Initialize an empty batch.
+
+        Args:
+            driver: Selenium WebDriver instance
+        """
+        self.driver = driver
+        self.steps: List[Dict[str, Any]] = []
+
+    def find(self, locator: Tuple[By, str]) -> 'ActionBatch':
+        """Queue a presence check; the result value is the element's value/text."""
+        self.steps.append({'action': 'find', 'locator': list(locator)})
+        return self
+
+    def set_value(self, locator: Tuple[By, str], text: str) -> 'ActionBatch':
+        """Queue setting an input's value (fires input and change events)."""
+        self.steps.append({'action': 'set_value', 'locator': list(locator), 'value': text})
+        return self
+
+    def click(self, locator: Tuple[By, str]) -> 'ActionBatch':
+        """Queue a click on a visible, enabled element."""
+        self.steps.append({'action': 'click', 'locator': list(locator)})
+        return self
+
+    @timed_step
+    def run(self, raise_on_error: bool = True, stop_on_error: bool = True) -> List[Dict[str, Any]]:
+        """
+        Execute all queued steps in one round-trip.
+
+        Args:
+            raise_on_error: Raise if any step failed
+            stop_on_error: Skip the remaining steps after a failure
+
+        Returns:
+            list: One dict per step (index, action, locator, ok, value, error)
+
+        Raises:
+            RuntimeError: If a step failed and raise_on_error is set
+        """
+        if not self.steps:
+            return []
+
+        results = self.driver.execute_script(self.SCRIPT, self.steps, stop_on_error)
+        self.steps = []
+
+        errors = [r for r in results if not r['ok'] and r['error'] != 'skipped']
+        if errors and raise_on_error:
+            details = '; '.join(
+                f"step {r['index']} {r['action']} {tuple(r['locator'])}: {r['error']}" for r in errors
+            )
+            raise RuntimeError(f"Action batch failed: {details}")
+
+        return results
+
 
 class BasePage:
     """
@@ -33,22 +176,23 @@ class BasePage:
         ```
     """
 
-    def __init__(self, driver: WebDriver, timeout: int = 10):
+    def __init__(self, driver: WebDriver, timeout: Optional[float] = None):
         """
         Initialize the base page.
 
         Args:
             driver: Selenium WebDriver instance
-            timeout: Default timeout for waits in seconds
+            timeout: Default timeout for waits in seconds (default: WaitPolicy.TIMEOUT)
         """
         self.driver = driver
-        self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = WaitPolicy.TIMEOUT if timeout is None else timeout
+        self.wait = WaitPolicy.wait(driver, self.timeout)
 
     # ========================================
     # Element Finding
     # ========================================
 
+    @timed_step
     def find_element(self, locator: Tuple[By, str]) -> WebElement:
         """
         Find a single element with wait.
@@ -79,6 +223,7 @@ class BasePage:
         """
         return self.driver.find_elements(*locator)
 
+    @timed_step
     def find_visible_element(self, locator: Tuple[By, str]) -> WebElement:
         """
         Find an element and wait until it's visible.
@@ -94,6 +239,7 @@ class BasePage:
             message=f"Element not visible: {locator}"
         )
 
+    @timed_step
     def find_clickable_element(self, locator: Tuple[By, str]) -> WebElement:
         """
         Find an element and wait until it's clickable.
@@ -113,19 +259,22 @@ class BasePage:
     # Element Interactions
     # ========================================
 
-    def click(self, locator: Tuple[By, str], wait_after: float = 0.5):
+    @timed_step
+    def click(self, locator: Tuple[By, str], wait_after: float = 0):
         """
         Click an element after waiting for it to be clickable.
 
         Args:
             locator: Tuple of (By, selector)
-            wait_after: Seconds to wait after clicking
+            wait_after: Seconds to sleep after clicking (default none: wait
+                for the click's effect with Readiness/WaitPolicy instead)
         """
         element = self.find_clickable_element(locator)
         element.click()
         if wait_after:
             time.sleep(wait_after)
 
+    @timed_step
     def type(self, locator: Tuple[By, str], text: str, clear_first: bool = True):
         """
         Type text into an input field.
@@ -140,6 +289,7 @@ class BasePage:
             element.clear()
         element.send_keys(text)
 
+    @timed_step
     def get_text(self, locator: Tuple[By, str]) -> str:
         """
         Get text content of an element.
@@ -153,6 +303,7 @@ class BasePage:
         element = self.find_visible_element(locator)
         return element.text
 
+    @timed_step
     def get_attribute(self, locator: Tuple[By, str], attribute: str) -> str:
         """
         Get an attribute value from an element.
@@ -167,26 +318,36 @@ class BasePage:
         element = self.find_element(locator)
         return element.get_attribute(attribute)
 
+    def batch(self) -> ActionBatch:
+        """
+        Start a batch of actions executed in one WebDriver round-trip.
+
+        Returns:
+            ActionBatch: Empty batch bound to this page's driver
+        """
+        return ActionBatch(self.driver)
+
     # ========================================
     # Element State Checks
     # ========================================
 
+    @timed_step
     def is_element_present(self, locator: Tuple[By, str]) -> bool:
         """
         Check if element exists in DOM (may not be visible).
 
+        Returns immediately - never waits for the element to appear.
+
         Args:
             locator: Tuple of (By, selector)
 
         Returns:
             bool: True if element exists
         """
-        try:
-            self.driver.find_element(*locator)
-            return True
-        except:
-            return False
+        with WaitPolicy.no_implicit_wait(self.driver):
+            return len(self.driver.find_elements(*locator)) > 0
 
+    @timed_step
     def is_element_visible(self, locator: Tuple[By, str], timeout: Optional[int] = None) -> bool:
         """
         Check if element is visible.
@@ -199,12 +360,13 @@ class BasePage:
             bool: True if element is visible
         """
         try:
-            wait = WebDriverWait(self.driver, timeout or self.timeout)
+            wait = WaitPolicy.wait(self.driver, self.timeout if timeout is None else timeout)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except:
             return False
 
+    @timed_step
     def is_element_clickable(self, locator: Tuple[By, str]) -> bool:
         """
         Check if element is clickable.
@@ -221,6 +383,7 @@ class BasePage:
         except:
             return False
 
+    @timed_step
     def wait_for_element_to_disappear(self, locator: Tuple[By, str], timeout: Optional[int] = None):
         """
         Wait for an element to disappear (become invisible or removed from DOM).
@@ -229,7 +392,7 @@ class BasePage:
             locator: Tuple of (By, selector)
             timeout: Override default timeout
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
+        wait = WaitPolicy.wait(self.driver, self.timeout if timeout is None else timeout)
         wait.until(
             EC.invisibility_of_element_located(locator),
             message=f"Element did not disappear: {locator}"
@@ -239,6 +402,7 @@ class BasePage:
     # JavaScript Execution
     # ========================================
 
+    @timed_step
     def execute_script(self, script: str, *args):
         """
         Execute JavaScript code.
@@ -255,6 +419,7 @@ class BasePage:
         """
         return self.driver.execute_script(script, *args)
 
+    @timed_step
     def scroll_to_element(self, locator: Tuple[By, str]):
         """
         Scroll element into view.
@@ -270,6 +435,7 @@ class BasePage:
     # Page Navigation
     # ========================================
 
+    @timed_step
     def navigate_to(self, url: str):
         """
         Navigate to a URL.
@@ -341,6 +507,7 @@ class BasePage:
     # Wait Conditions
     # ========================================
 
+    @timed_step
     def wait_for_page_load(self, timeout: Optional[int] = None):
         """
         Wait for page to finish loading.
@@ -348,11 +515,12 @@ class BasePage:
         Args:
             timeout: Override default timeout
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
+        wait = WaitPolicy.wait(self.driver, self.timeout if timeout is None else timeout)
         wait.until(
             lambda driver: driver.execute_script("return document.readyState") == "complete"
         )
 
+    @timed_step
     def wait_for_url_to_contain(self, text: str, timeout: Optional[int] = None):
         """
         Wait for URL to contain specific text.
@@ -361,9 +529,10 @@ class BasePage:
             text: Text to wait for in URL
             timeout: Override default timeout
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
+        wait = WaitPolicy.wait(self.driver, self.timeout if timeout is None else timeout)
         wait.until(EC.url_contains(text))
 
+    @timed_step
     def wait_for_title_to_contain(self, text: str, timeout: Optional[int] = None):
         """
         Wait for page title to contain specific text.
@@ -372,5 +541,5 @@ class BasePage:
             text: Text to wait for in title
             timeout: Override default timeout
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
+        wait = WaitPolicy.wait(self.driver, self.timeout if timeout is None else timeout)
         wait.until(EC.title_contains(text))
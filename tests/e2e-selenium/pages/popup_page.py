@@ -8,8 +8,11 @@ including authentication, profile management, and settings.
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException
 from typing import Optional
 import time
+from helpers.readiness import Readiness
+from helpers.wait_policy import WaitPolicy
 from .base_page import BasePage
 
 
@@ -29,9 +32,13 @@ class PopupPage(BasePage):
 
     # Header elements
     HEADER_SIGN_IN_BTN = (By.ID, 'headerSignInBtn')
-    HEADER_SIGN_OUT_BTN = (By.ID, 'headerSignOutBtn')
     HEADER_USER_EMAIL = (By.CSS_SELECTOR, '[data-testid="user-email"]')
 
+    # User menu (signed in): dropdown with sign-out, then a confirmation modal
+    USER_MENU_BTN = (By.ID, 'userMenuBtn')
+    SIGN_OUT_BTN = (By.ID, 'signOutBtn')
+    SIGN_OUT_CONFIRM_BTN = (By.ID, 'signOutConfirm')
+
     # Profile section
     PROFILE_SELECT = (By.ID, 'profileSelect')
     CREATE_PROFILE_BTN = (By.ID, 'createProfileBtn')
@@ -73,13 +80,13 @@ class PopupPage(BasePage):
         """
         # Wait for the sign-in button or user email to appear
         try:
-            self.wait.until(
+            WaitPolicy.wait(self.driver, timeout).until(
                 lambda d: self.is_element_present(self.HEADER_SIGN_IN_BTN) or
                          self.is_element_present(self.HEADER_USER_EMAIL)
             )
             # Wait for any loading spinners to disappear
-            time.sleep(0.5)
-        except:
+            self.wait_for_element_to_disappear(self.LOADING_SPINNER, timeout)
+        except TimeoutException:
             pass
 
     # ========================================
@@ -91,26 +98,28 @@ class PopupPage(BasePage):
         Check if user is currently signed in.
 
         Returns:
-            True if signed in, False otherwise
+            True if signed in, False otherwise (never waits)
         """
-        return self.is_element_present(self.HEADER_SIGN_OUT_BTN)
+        return self.driver.execute_script(Readiness.AUTH_STATE_SCRIPT) == 'signed_in'
 
     def is_signed_out(self) -> bool:
         """
         Check if user is currently signed out.
 
         Returns:
-            True if signed out, False otherwise
+            True if signed out, False otherwise (never waits)
         """
-        return self.is_element_present(self.HEADER_SIGN_IN_BTN)
+        return self.driver.execute_script(Readiness.AUTH_STATE_SCRIPT) == 'signed_out'
 
     def click_sign_in(self) -> None:
         """Click the sign-in button to initiate Google OAuth."""
         self.click(self.HEADER_SIGN_IN_BTN)
 
     def click_sign_out(self) -> None:
-        """Click the sign-out button."""
-        self.click(self.HEADER_SIGN_OUT_BTN)
+        """Sign out through the user menu (opens it, clicks Sign Out and confirms)."""
+        self.click(self.USER_MENU_BTN)
+        self.click(self.SIGN_OUT_BTN)
+        self.click(self.SIGN_OUT_CONFIRM_BTN)
 
     def get_user_email(self) -> Optional[str]:
         """
@@ -146,44 +155,37 @@ class PopupPage(BasePage):
                 - realAddress, aliasAddress
                 - realCompany, aliasCompany
         """
+        optional_fields = [
+            ('realName', self.REAL_NAME_INPUT),
+            ('aliasName', self.ALIAS_NAME_INPUT),
+            ('realEmail', self.REAL_EMAIL_INPUT),
+            ('aliasEmail', self.ALIAS_EMAIL_INPUT),
+            ('realPhone', self.REAL_PHONE_INPUT),
+            ('aliasPhone', self.ALIAS_PHONE_INPUT),
+            ('realAddress', self.REAL_ADDRESS_INPUT),
+            ('aliasAddress', self.ALIAS_ADDRESS_INPUT),
+            ('realCompany', self.REAL_COMPANY_INPUT),
+            ('aliasCompany', self.ALIAS_COMPANY_INPUT),
+        ]
+
+        # Wait once for the form, then fill every field in one round-trip
+        self.find_visible_element(self.PROFILE_NAME_INPUT)
+
         # Profile name (required)
-        self.type(self.PROFILE_NAME_INPUT, profile_data.get('profileName', ''))
-
-        # Name fields
-        if 'realName' in profile_data:
-            self.type(self.REAL_NAME_INPUT, profile_data['realName'])
-        if 'aliasName' in profile_data:
-            self.type(self.ALIAS_NAME_INPUT, profile_data['aliasName'])
-
-        # Email fields
-        if 'realEmail' in profile_data:
-            self.type(self.REAL_EMAIL_INPUT, profile_data['realEmail'])
-        if 'aliasEmail' in profile_data:
-            self.type(self.ALIAS_EMAIL_INPUT, profile_data['aliasEmail'])
-
-        # Phone fields
-        if 'realPhone' in profile_data:
-            self.type(self.REAL_PHONE_INPUT, profile_data['realPhone'])
-        if 'aliasPhone' in profile_data:
-            self.type(self.ALIAS_PHONE_INPUT, profile_data['aliasPhone'])
-
-        # Address fields
-        if 'realAddress' in profile_data:
-            self.type(self.REAL_ADDRESS_INPUT, profile_data['realAddress'])
-        if 'aliasAddress' in profile_data:
-            self.type(self.ALIAS_ADDRESS_INPUT, profile_data['aliasAddress'])
-
-        # Company fields
-        if 'realCompany' in profile_data:
-            self.type(self.REAL_COMPANY_INPUT, profile_data['realCompany'])
-        if 'aliasCompany' in profile_data:
-            self.type(self.ALIAS_COMPANY_INPUT, profile_data['aliasCompany'])
+        batch = self.batch().set_value(self.PROFILE_NAME_INPUT, profile_data.get('profileName', ''))
+        for key, locator in optional_fields:
+            if key in profile_data:
+                batch.set_value(locator, profile_data[key])
+        batch.run()
 
     def click_save_profile(self) -> None:
-        """Click the save profile button."""
+        """
+        Click the save profile button.
+
+        Doesn't wait for the save; callers wait for the new card
+        (Readiness.profile_cards).
+        """
         self.click(self.SAVE_PROFILE_BTN)
-        # Wait for save to complete
-        time.sleep(1)
 
     def click_cancel_profile(self) -> None:
         """Click the cancel button in profile form."""
@@ -255,9 +257,5 @@ class PopupPage(BasePage):
         Args:
             filename: Name for the screenshot file
         """
-        from pathlib import Path
-        screenshot_dir = Path(__file__).parent.parent / 'reports' / 'screenshots'
-        screenshot_dir.mkdir(parents=True, exist_ok=True)
-
-        filepath = screenshot_dir / f'{filename}.png'
-        self.driver.save_screenshot(str(filepath))
+        from helpers.worker_context import WorkerContext
+        self.driver.save_screenshot(WorkerContext.screenshot_path(f'{filename}.png'))
@@ -0,0 +1,99 @@
+"""
+Helper Test: WebDriver Command Attribution
+
+Drives the readiness waits and extension-state helpers with a fake driver
+wrapped by CommandProfiler (helpers/command_profiler.py) and checks that
+their commands are credited to the page-object method that called them,
+not to the generic helper or its lambdas.
+
+No browser needed.
+
+@group helpers
+@priority P1
+"""
+
+import pytest
+import allure
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from helpers.command_profiler import CommandProfiler
+from helpers.extension_state import ExtensionState
+from helpers.readiness import Readiness
+
+
+class FakeDriver(WebDriver):
+    """
+    Real WebDriver commands, answered without a browser.
+
+    Selenium's own execute_script() etc. still run, so the profiler sees the
+    same frames (outside the suite) as with ChromeDriver.
+    """
+
+    def __init__(self):
+        self.session_id = 'fake-session'
+        self.pinned_scripts = {}
+
+    def execute(self, driver_command, params=None):
+        return {'value': 'complete'}
+
+
+class FakePage:
+    """Stands in for a page object that waits on and inspects the extension."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def open(self):
+        Readiness(self.driver).document_ready()
+
+    def check_auth(self):
+        return ExtensionState(self.driver, 'fake-extension-id').has_auth()
+
+
+@pytest.fixture
+def fake_driver(monkeypatch):
+    """Fake driver with profiling installed and empty statistics."""
+    monkeypatch.setattr(CommandProfiler, '_commands', {})
+    monkeypatch.setattr(CommandProfiler, '_call_sites', {})
+    driver = FakeDriver()
+    CommandProfiler.install(driver)
+    return driver
+
+
+@allure.feature('Helpers')
+@allure.story('Command Profiling')
+@pytest.mark.helpers
+class TestCommandAttribution:
+    """
+    Commands sent by generic helpers are credited to their caller.
+    """
+
+    @allure.title('Readiness wait is credited to its caller')
+    def test_wait_attributed_to_caller(self, fake_driver):
+        """
+        Commands polled inside a Readiness.until() lambda.
+
+        Assertions:
+            - The script command is recorded under FakePage.open
+        """
+        FakePage(fake_driver).open()
+
+        call_sites = CommandProfiler.snapshot()['call_sites']
+        assert list(call_sites) == ['FakePage.open']
+        assert call_sites['FakePage.open']['commands'] == {Command.W3C_EXECUTE_SCRIPT: 1}
+
+    @allure.title('Extension-state command is credited to its caller')
+    def test_state_command_attributed_to_caller(self, fake_driver):
+        """
+        Commands sent by ExtensionState.
+
+        Assertions:
+            - The async script command is recorded under FakePage.check_auth
+        """
+        assert FakePage(fake_driver).check_auth()
+
+        call_sites = CommandProfiler.snapshot()['call_sites']
+        assert list(call_sites) == ['FakePage.check_auth']
+        assert call_sites['FakePage.check_auth']['commands'] == {Command.W3C_EXECUTE_SCRIPT_ASYNC: 1}
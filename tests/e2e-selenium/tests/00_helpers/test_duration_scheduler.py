@@ -0,0 +1,83 @@
+"""
+Helper Test: Longest-First xdist Scheduling
+
+Runs small throwaway suites under pytest-xdist with DurationScheduling
+(helpers/duration_scheduler.py) and checks that every test runs and the
+run finishes. A worker only starts a test once it holds the next one or
+is shut down, so a bad initial distribution hangs the run instead of
+failing it; each run gets a hard timeout.
+
+No browser needed.
+
+@group helpers
+@priority P1
+"""
+
+import pytest
+import allure
+
+from helpers.worker_context import WorkerContext
+
+pytest.importorskip('xdist')
+
+pytest_plugins = ['pytester']
+
+
+WORKERS = 4
+RUN_TIMEOUT = 120
+
+CONFTEST = f"""
+import sys
+import pytest
+
+sys.path.insert(0, {str(WorkerContext.SUITE_ROOT)!r})
+from helpers.duration_scheduler import DurationScheduling
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    return DurationScheduling(config, log)
+"""
+
+
+@allure.feature('Helpers')
+@allure.story('Duration Scheduling')
+@pytest.mark.helpers
+class TestDurationScheduling:
+    """
+    DurationScheduling finishes for any number of tests per worker.
+    """
+
+    @allure.title('All tests run')
+    @pytest.mark.parametrize('tests', [
+        WORKERS - 1,          # fewer tests than workers
+        WORKERS,              # one each
+        WORKERS + 1,          # more than one each, fewer than two each
+        2 * WORKERS - 1,
+        2 * WORKERS,          # a full first pair each
+        5 * WORKERS + 3,      # refilled one at a time
+    ])
+    def test_runs_every_test(self, pytester, tests):
+        """
+        Run `tests` trivial tests on WORKERS workers.
+
+        Args:
+            pytester: pytest's in-process test runner fixture
+            tests: Number of tests in the throwaway suite
+
+        Assertions:
+            - The run finishes within RUN_TIMEOUT
+            - Every test passed exactly once
+        """
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(
+            "import pytest\n\n"
+            f"@pytest.mark.parametrize('index', range({tests}))\n"
+            "def test_case(index):\n"
+            "    pass\n"
+        )
+
+        result = pytester.runpytest_subprocess('-n', str(WORKERS), '-p', 'no:cacheprovider',
+                                               timeout=RUN_TIMEOUT)
+
+        result.assert_outcomes(passed=tests)
@@ -0,0 +1,92 @@
+"""
+Helper Test: Wait Policy
+
+Checks the explicit-wait timeout override and the implicit-wait
+bookkeeping of helpers/wait_policy.py with a stand-in driver.
+
+No browser needed.
+
+@group helpers
+@priority P1
+"""
+
+import time
+
+import pytest
+import allure
+
+from selenium.common.exceptions import TimeoutException
+
+from helpers.wait_policy import WaitPolicy
+
+
+class FakeDriver:
+    """Records implicit-wait changes, without a browser."""
+
+    session_id = 'fake-session'
+
+    def __init__(self):
+        self.implicit_waits = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_waits.append(seconds)
+
+
+@pytest.fixture
+def fake_driver(monkeypatch):
+    """Stand-in driver with an empty implicit-wait record."""
+    monkeypatch.setattr(WaitPolicy, '_implicit_waits', {})
+    return FakeDriver()
+
+
+@allure.feature('Helpers')
+@allure.story('Wait Policy')
+@pytest.mark.helpers
+class TestWaitPolicy:
+    """
+    Explicit-wait timeouts and implicit-wait tracking.
+    """
+
+    @allure.title('timeout=0 checks the condition once')
+    def test_zero_timeout_is_kept(self, fake_driver):
+        """
+        A zero timeout must not fall back to the default.
+
+        Assertions:
+            - The wait times out well before WaitPolicy.TIMEOUT
+        """
+        start = time.monotonic()
+        with pytest.raises(TimeoutException):
+            WaitPolicy.wait(fake_driver, timeout=0).until(lambda driver: False)
+
+        assert time.monotonic() - start < WaitPolicy.TIMEOUT / 2
+
+    @allure.title('Presence probes under the policy send nothing')
+    def test_no_implicit_wait_after_apply(self, fake_driver):
+        """
+        After apply() the implicit wait is known to be 0.
+
+        Assertions:
+            - no_implicit_wait() sends no implicit-wait change
+        """
+        WaitPolicy.apply(fake_driver)
+
+        with WaitPolicy.no_implicit_wait(fake_driver):
+            pass
+
+        assert fake_driver.implicit_waits == [WaitPolicy.IMPLICIT_WAIT]
+
+    @allure.title('Implicit wait set through the policy is restored')
+    def test_no_implicit_wait_restores(self, fake_driver):
+        """
+        A non-zero implicit wait set with set_implicit_wait().
+
+        Assertions:
+            - It is disabled inside no_implicit_wait() and restored after
+        """
+        WaitPolicy.set_implicit_wait(fake_driver, 5)
+
+        with WaitPolicy.no_implicit_wait(fake_driver):
+            assert fake_driver.implicit_waits[-1] == 0
+
+        assert fake_driver.implicit_waits == [5, 0, 5]
@@ -11,6 +11,7 @@ Estimated Time: ~30 seconds
 import pytest
 import allure
 import time
+from helpers.artifact_writer import ArtifactWriter
 from helpers.selenium_driver import ChromeDriverManager
 
 
@@ -76,12 +77,7 @@ class TestExtensionLoads:
                 "Should navigate to ChatGPT successfully"
 
         with allure.step('Take screenshot of loaded page'):
-            screenshot = driver.get_screenshot_as_png()
-            allure.attach(
-                screenshot,
-                name='chatgpt_loaded',
-                attachment_type=allure.attachment_type.PNG
-            )
+            ArtifactWriter.capture(driver, 'chatgpt_loaded')
 
         with allure.step('Check page title'):
             title = driver.title
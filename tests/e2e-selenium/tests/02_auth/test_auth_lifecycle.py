@@ -3,7 +3,7 @@ E2E Test: Complete Authentication Lifecycle
 
 This is the foundational enterprise-grade test that validates the MANDATORY flow:
 1. Platform page setup (ChatGPT)
-2. Popup opening via PyAutoGUI
+2. Popup opening (popup URL in a new tab)
 3. Google OAuth sign-in automation
 4. Firebase decryption wait (5s health check loop)
 5. Profile creation with real Firebase encryption
@@ -17,7 +17,6 @@ Requirements:
 - TEST_USER_EMAIL and TEST_USER_PASSWORD in .env.test.local
 - Test user must be a valid Google account registered in Firebase
 - Extension must be built (dist/ folder exists)
-- Extension icon coordinates calibrated OR screenshot available for PyAutoGUI
 
 @group auth
 @priority P0 (foundational)
@@ -25,7 +24,7 @@ Requirements:
 
 import pytest
 import allure
-import time
+from helpers.artifact_writer import ArtifactWriter
 from helpers.test_harness import TestHarness
 
 
@@ -88,15 +87,10 @@ class TestAuthLifecycle:
             # MANDATORY FLOW (Steps 1-5)
             # ========================================
             with allure.step('Execute mandatory flow (ChatGPT → Popup → OAuth → Decrypt)'):
-                windows = harness.complete_mandatory_flow(popup_method='coordinates')
+                windows = harness.complete_mandatory_flow()
 
-                # Attach screenshot after successful flow
-                screenshot = driver.get_screenshot_as_png()
-                allure.attach(
-                    screenshot,
-                    name='after_mandatory_flow',
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Screenshot (--artifact-level step)
+                ArtifactWriter.capture(driver, 'after_mandatory_flow')
 
             # ========================================
             # CREATE PROFILE (Now that we're authenticated)
@@ -104,13 +98,8 @@ class TestAuthLifecycle:
             with allure.step(f'Create test profile: {TEST_PROFILE["profileName"]}'):
                 harness.create_test_profile(TEST_PROFILE)
 
-                # Screenshot after profile creation
-                screenshot = driver.get_screenshot_as_png()
-                allure.attach(
-                    screenshot,
-                    name='after_profile_creation',
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Screenshot (--artifact-level step)
+                ArtifactWriter.capture(driver, 'after_profile_creation')
 
             # ========================================
             # VERIFY PROFILE EXISTS
@@ -136,13 +125,8 @@ class TestAuthLifecycle:
             with allure.step('Delete test profile'):
                 harness.delete_test_profile(TEST_PROFILE['profileName'])
 
-                # Screenshot after deletion
-                screenshot = driver.get_screenshot_as_png()
-                allure.attach(
-                    screenshot,
-                    name='after_profile_deletion',
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Screenshot (--artifact-level step)
+                ArtifactWriter.capture(driver, 'after_profile_deletion')
 
             # ========================================
             # SIGN OUT
@@ -159,24 +143,14 @@ class TestAuthLifecycle:
 
                 print("[OK] User signed out successfully")
 
-                # Final screenshot
-                screenshot = driver.get_screenshot_as_png()
-                allure.attach(
-                    screenshot,
-                    name='after_sign_out',
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Screenshot (--artifact-level step)
+                ArtifactWriter.capture(driver, 'after_sign_out')
 
             print("\n[OK] Complete auth lifecycle test PASSED")
 
-        except Exception as e:
-            # Capture screenshot on failure
-            screenshot = driver.get_screenshot_as_png()
-            allure.attach(
-                screenshot,
-                name='test_failure',
-                attachment_type=allure.attachment_type.PNG
-            )
+        except Exception:
+            # Screenshot before cleanup changes the page
+            ArtifactWriter.capture(driver, 'test_failure', kind='failure')
             raise
 
         finally:
@@ -222,7 +196,7 @@ class TestProfilePersistence:
             # SETUP: Mandatory flow + create profile
             # ========================================
             with allure.step('Setup: Complete mandatory flow and create profile'):
-                windows = harness.complete_mandatory_flow(popup_method='coordinates')
+                windows = harness.complete_mandatory_flow()
                 harness.create_test_profile(TEST_PROFILE)
 
                 print(f"[OK] Setup complete: Profile '{TEST_PROFILE['profileName']}' created")
@@ -234,31 +208,20 @@ class TestProfilePersistence:
                 driver.switch_to.window(windows['popup'])
                 driver.close()
                 print("[OK] Popup closed")
-                time.sleep(1)
 
             # ========================================
             # REOPEN POPUP
             # ========================================
             with allure.step('Reopen extension popup'):
-                # Switch back to ChatGPT
+                # Switch back to ChatGPT and open the popup in a new tab
                 driver.switch_to.window(windows['chatgpt'])
-
-                # Click extension icon again
-                from helpers.extension_helper import ExtensionHelper
-                ExtensionHelper.click_extension_icon_by_coordinates()
-                time.sleep(2)
-
-                # Find new popup window
-                new_windows = set(driver.window_handles) - {windows['chatgpt']}
-                new_popup = new_windows.pop()
-
-                driver.switch_to.window(new_popup)
-                harness.popup_window = new_popup
+                driver.switch_to.new_window('tab')
+                harness.open_popup_page(harness.extension_id)
 
                 print("[OK] Popup reopened")
 
-                # Wait for load + health check
-                time.sleep(3)
+                # Wait for decryption of the stored profile
+                harness.wait_for_firebase_decryption()
 
             # ========================================
             # VERIFY PROFILE PERSISTS
@@ -275,13 +238,8 @@ class TestProfilePersistence:
 
                 print(f"[OK] Profile persisted: {selected_profile}")
 
-                # Screenshot proof
-                screenshot = driver.get_screenshot_as_png()
-                allure.attach(
-                    screenshot,
-                    name='profile_persisted',
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Screenshot (--artifact-level step)
+                ArtifactWriter.capture(driver, 'profile_persisted')
 
             # ========================================
             # CLEANUP
@@ -294,14 +252,9 @@ class TestProfilePersistence:
 
             print("\n[OK] Profile persistence test PASSED")
 
-        except Exception as e:
-            # Capture screenshot on failure
-            screenshot = driver.get_screenshot_as_png()
-            allure.attach(
-                screenshot,
-                name='test_failure',
-                attachment_type=allure.attachment_type.PNG
-            )
+        except Exception:
+            # Screenshot before cleanup changes the page
+            ArtifactWriter.capture(driver, 'test_failure', kind='failure')
             raise
 
         finally:
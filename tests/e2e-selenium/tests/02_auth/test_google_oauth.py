@@ -0,0 +1,71 @@
+"""
+E2E Test: Interactive Google OAuth Sign-In
+
+The mandatory flow signs in with a seeded Firebase session by default.
+This opt-in test keeps the real Google OAuth path covered:
+1. Platform page setup (ChatGPT)
+2. Popup opening
+3. Google OAuth popup: email -> password -> consent
+4. Firebase decryption wait
+5. Sign out
+
+Run with:
+    pytest -m oauth --auth-mode=oauth
+
+Requirements:
+- TEST_USER_EMAIL and TEST_USER_PASSWORD in .env.test.local
+- Test user must be a valid Google account registered in Firebase
+
+@group auth
+@priority P1
+"""
+
+import pytest
+import allure
+
+from helpers.artifact_writer import ArtifactWriter
+from helpers.test_harness import TestHarness
+
+
+@allure.feature('Authentication')
+@allure.story('Google OAuth')
+@allure.severity(allure.severity_level.CRITICAL)
+@pytest.mark.auth
+@pytest.mark.oauth
+@pytest.mark.fresh_browser
+class TestGoogleOAuth:
+    """
+    Test the interactive Google OAuth sign-in path.
+    """
+
+    @allure.title('Google OAuth sign-in and sign-out')
+    def test_google_oauth_sign_in(self, driver, test_credentials):
+        """
+        Test signing in through the real Google OAuth popup.
+
+        Args:
+            driver: Selenium WebDriver fixture (fresh browser)
+            test_credentials: Google test account credentials
+
+        Assertions:
+            - Mandatory flow completes with OAuth sign-in
+            - User is signed out afterwards
+        """
+        harness = TestHarness(driver, auth_mode='oauth')
+
+        try:
+            with allure.step('Execute mandatory flow with Google OAuth'):
+                windows = harness.complete_mandatory_flow()
+
+            with allure.step('Sign out'):
+                harness.sign_out()
+
+                driver.switch_to.window(windows['popup'])
+                assert harness.auth_helper.is_signed_out(), "User should be signed out"
+
+        except Exception:
+            ArtifactWriter.capture(driver, 'test_failure', kind='failure')
+            raise
+
+        finally:
+            harness.cleanup()
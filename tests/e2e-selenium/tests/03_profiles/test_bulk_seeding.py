@@ -0,0 +1,78 @@
+"""
+E2E Test: Bulk Profile Seeding
+
+Validates that large profile sets can be created without the popup form:
+1. Complete the mandatory flow (signed in, decrypted)
+2. Seed 1000 synthetic profiles through the extension's storage path
+3. Verify the popup decrypts and renders all of them
+4. Remove the seeded profiles in one call
+
+Requirements:
+- Extension must be built (dist/ folder exists)
+
+@group profiles
+@priority P1
+"""
+
+import time
+
+import pytest
+import allure
+
+from helpers.readiness import Readiness
+from helpers.test_harness import TestHarness
+
+
+SEEDED_PROFILES = 1000
+
+# Seeding is one script call; anything near this means a per-profile path crept in
+MAX_SEED_SECONDS = 30
+
+
+@allure.feature('Profiles')
+@allure.story('Bulk Seeding')
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.profiles
+class TestBulkSeeding:
+    """
+    Test seeding and removing many profiles at once.
+    """
+
+    @allure.title(f'{SEEDED_PROFILES} seeded profiles decrypt in the popup')
+    def test_seed_and_teardown(self, driver):
+        """
+        Test that seeded profiles are stored encrypted, rendered and removed.
+
+        Args:
+            driver: Selenium WebDriver fixture
+        """
+        harness = TestHarness(driver)
+
+        try:
+            with allure.step('Execute mandatory flow'):
+                harness.complete_mandatory_flow()
+                before = len(driver.find_elements(*Readiness.PROFILE_CARDS))
+
+            with allure.step(f'Seed {SEEDED_PROFILES} profiles'):
+                start = time.perf_counter()
+                seeded = harness.seed_profiles(SEEDED_PROFILES, seed=16)
+                elapsed = time.perf_counter() - start
+
+                assert len(seeded) == SEEDED_PROFILES
+                assert elapsed < MAX_SEED_SECONDS, \
+                    f"Seeding {SEEDED_PROFILES} profiles took {elapsed:.1f}s"
+                print(f"[OK] Seeded and rendered {SEEDED_PROFILES} profiles in {elapsed:.1f}s")
+
+            with allure.step('Verify the popup shows every profile'):
+                rendered = len(driver.find_elements(*Readiness.PROFILE_CARDS))
+                assert rendered == before + SEEDED_PROFILES, \
+                    f"Expected {before + SEEDED_PROFILES} profiles, popup shows {rendered}"
+
+            with allure.step('Remove seeded profiles'):
+                harness.remove_seeded_profiles()
+
+                rendered = len(driver.find_elements(*Readiness.PROFILE_CARDS))
+                assert rendered == before, f"Expected {before} profiles after teardown, got {rendered}"
+
+        finally:
+            harness.cleanup()
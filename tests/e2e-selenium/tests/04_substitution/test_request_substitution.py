@@ -0,0 +1,127 @@
+"""
+E2E Test: Request Substitution Against the Mock Platform
+
+Validates the core promise of the extension without any live platform:
+1. Load an alias profile into the service worker (SET_PROFILES)
+2. Open https://chatgpt.com (served by MockPlatformServer)
+3. Send a prompt containing real PII through the page's fetch
+4. Assert the body that reached the "platform" contains only aliases
+
+Requirements:
+- Extension must be built (dist/ folder exists)
+
+@group substitution
+@priority P0
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.extension_state import ExtensionState
+from helpers.readiness import Readiness
+
+
+# Sends pre-decrypted profiles to the service worker (like the popup does)
+SET_PROFILES_SCRIPT = """
+    const done = arguments[arguments.length - 1];
+    chrome.runtime.sendMessage({ type: 'SET_PROFILES', payload: arguments[0] })
+        .then(done)
+        .catch((error) => done({ success: false, error: String(error) }));
+"""
+
+
+def alias_profile(profile_data: dict) -> dict:
+    """
+    Build an AliasProfile payload from the test_profile_data fixture.
+
+    Args:
+        profile_data: Flat profile form data (realName, aliasName, ...)
+
+    Returns:
+        dict: AliasProfile as accepted by SET_PROFILES
+    """
+    fields = ['name', 'email', 'phone', 'address', 'company']
+
+    def identity(prefix):
+        return {f: profile_data[f"{prefix}{f.capitalize()}"] for f in fields}
+
+    return {
+        'id': 'e2e-profile',
+        'profileName': profile_data['profileName'],
+        'enabled': True,
+        'real': identity('real'),
+        'alias': identity('alias'),
+        'metadata': {'createdAt': 0, 'updatedAt': 0},
+        'settings': {'enableVariations': False},
+    }
+
+
+@allure.feature('Substitution')
+@allure.story('Request Substitution')
+@allure.severity(allure.severity_level.BLOCKER)
+@pytest.mark.substitution
+@pytest.mark.critical
+class TestRequestSubstitution:
+    """
+    Test that real PII is replaced before a request leaves the browser.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _require_mock(self, mock_platform):
+        """Skip when running against live platforms."""
+        if mock_platform is None:
+            pytest.skip("Request assertions need the mock platform (not --live-platforms)")
+
+    @allure.title('Real PII in a ChatGPT prompt is replaced with aliases')
+    def test_prompt_pii_is_substituted(self, driver, mock_platform, extension_id,
+                                       test_profile_data, test_messages):
+        """
+        Test that a ChatGPT conversation request carries aliases only.
+
+        Args:
+            driver: Selenium WebDriver fixture
+            mock_platform: Mock platform server fixture
+            extension_id: Extension ID fixture
+            test_profile_data: Profile data fixture
+            test_messages: PII message fixture
+
+        Assertions:
+            - Request reached the mock with the ChatGPT body shape
+            - Real name/email are absent, aliases present
+        """
+        ready = Readiness(driver)
+        mock_platform.clear()
+
+        with allure.step('Load alias profile into the service worker'):
+            driver.get(ExtensionState(driver, extension_id).popup_url)
+            result = driver.execute_async_script(
+                SET_PROFILES_SCRIPT, [alias_profile(test_profile_data)]
+            )
+            assert result and result.get('success'), f"SET_PROFILES failed: {result}"
+
+        with allure.step('Open ChatGPT (mock)'):
+            driver.get('https://chatgpt.com')
+            ready.platform_page()
+
+        with allure.step('Send a prompt with real PII'):
+            driver.execute_script(
+                "window.__mockChat.send(arguments[0])", test_messages['multiField']
+            )
+            request = mock_platform.wait_for_request(mock_platform.CONVERSATION_PATH)
+
+            allure.attach(
+                json.dumps(request['json'], indent=2),
+                name='conversation_request',
+                attachment_type=allure.attachment_type.JSON
+            )
+
+        with allure.step('Verify only aliases reached the platform'):
+            prompt = mock_platform.prompt_text(request)
+            assert prompt, "Request body should keep the ChatGPT messages shape"
+
+            for field in ['Name', 'Email']:
+                assert test_profile_data[f'real{field}'] not in request['body'], \
+                    f"Real {field.lower()} leaked to the platform"
+                assert test_profile_data[f'alias{field}'] in prompt, \
+                    f"Alias {field.lower()} missing from the prompt"
@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the performance benchmarks.
+
+- open_platform: load a mock platform page and wait until it is protected
+  (skips the test with --live-platforms)
+
+The `profiles` fixture lives in the top-level conftest (shared with the
+soak tests).
+"""
+
+import pytest
+
+from helpers.readiness import Readiness
+
+
+@pytest.fixture
+def open_platform(driver, mock_platform):
+    """
+    Open a mock platform page, ready for benchmarking.
+
+    Returns:
+        Callable taking the page URL (e.g. 'https://chatgpt.com')
+    """
+    if mock_platform is None:
+        pytest.skip("Page benchmarks need the mock platform (not --live-platforms)")
+
+    def open_page(url: str) -> None:
+        driver.get(url)
+        Readiness(driver).platform_page()
+
+    return open_page
@@ -0,0 +1,106 @@
+"""
+Performance Test: Fetch Interception Overhead
+
+Measures the latency inject.js adds to every AI request. On the mock
+ChatGPT page, ChatGPT-shaped request bodies are POSTed to an echo endpoint
+through the extension's wrapped window.fetch and through
+window.__nativeFetch, sweeping:
+- payload size: 1 KB, 100 KB, 1 MB
+- concurrency: 1, 4, 16 requests in flight
+
+The wrapped path includes SUBSTITUTE_REQUEST and SUBSTITUTE_RESPONSE
+round-trips to the service worker with a few profiles loaded, i.e. what a
+user pays per prompt.
+
+Run with:
+    pytest -m performance --run-performance
+
+Results: native vs wrapped p50 and the added p50/p95/p99 latency per case,
+printed at the end of the run and saved to reports/benchmarks/fetch/.
+
+@group performance
+@priority P2
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.fetch_benchmark import FetchOverheadBenchmark
+from helpers.synthetic import SyntheticCorpus
+
+
+SIZES = {'1KB': 1_000, '100KB': 100_000, '1MB': 1_000_000}
+CONCURRENCY = [1, 4, 16]
+
+DENSITY = 0.05
+
+
+def conversation_body(text: str) -> str:
+    """ChatGPT conversation request body carrying `text` (like __mockChat.send)."""
+    return json.dumps({
+        'action': 'next',
+        'messages': [{
+            'id': 'e2e-benchmark',
+            'author': {'role': 'user'},
+            'content': {'content_type': 'text', 'parts': [text]},
+            'metadata': {},
+        }],
+        'parent_message_id': 'e2e-benchmark-parent',
+        'model': 'auto',
+    })
+
+
+@allure.feature('Performance')
+@allure.story('Fetch Interception Overhead')
+@pytest.mark.performance
+class TestFetchOverhead:
+    """
+    Wrapped vs native fetch latency on a protected platform page.
+    """
+
+    @pytest.fixture
+    def bench(self, driver, open_platform, profiles):
+        """Benchmark runner on the mock ChatGPT page."""
+        open_platform('https://chatgpt.com')
+        return FetchOverheadBenchmark(driver)
+
+    @allure.title('Fetch overhead')
+    @pytest.mark.parametrize('concurrency', CONCURRENCY)
+    @pytest.mark.parametrize('size_id', SIZES)
+    def test_fetch_overhead(self, bench, profiles, size_id, concurrency):
+        """
+        Benchmark one payload size at one concurrency level.
+
+        Args:
+            bench: Fetch benchmark runner
+            profiles: Profiles loaded into the service worker
+            size_id: Payload size case
+            concurrency: Requests in flight
+        """
+        corpus = SyntheticCorpus(seed=1)
+        body = conversation_body(corpus.message(SIZES[size_id], profiles, DENSITY))
+
+        with allure.step('Verify the wrapped fetch substitutes the body'):
+            echoed = bench.probe(body)
+            leaked = [value for profile in profiles for value in profile['real'].values()
+                      if value in body and value in echoed]
+            assert echoed != body and not leaked, \
+                f"Wrapped fetch did not substitute the request body (leaked: {leaked[:3]})"
+
+        # 1 MB payloads: fewer requests keep a case under a minute
+        heavy = SIZES[size_id] >= 1_000_000
+        stats = bench.run(body, requests=10 if heavy else FetchOverheadBenchmark.REQUESTS,
+                          concurrency=concurrency, rounds=2 if heavy else FetchOverheadBenchmark.ROUNDS)
+
+        name = f'fetch/{size_id}/c{concurrency}'
+        record = {'name': name, 'size': SIZES[size_id], 'concurrency': concurrency,
+                  'profiles': len(profiles), **stats}
+        FetchOverheadBenchmark.save(record)
+
+        allure.attach(json.dumps(record, indent=2), name=name,
+                      attachment_type=allure.attachment_type.JSON)
+        overhead = stats['overhead']
+        print(f"[Benchmark] {name}: native p50 {stats['native']['p50_ms']} ms, "
+              f"wrapped p50 {stats['wrapped']['p50_ms']} ms, added p50 {overhead['p50_ms']} ms, "
+              f"p95 {overhead['p95_ms']} ms, p99 {overhead['p99_ms']} ms")
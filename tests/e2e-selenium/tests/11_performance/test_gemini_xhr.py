@@ -0,0 +1,98 @@
+"""
+Performance Test: Gemini XHR Interception
+
+Measures what inject.js's XMLHttpRequest wrapper costs on Gemini and checks
+what it sends. On the mock gemini.google.com page, Gemini prompt forms
+(`f.req=...&at=...&`) containing real PII are posted in batches of
+concurrent XHRs to the intercepted BardChatUi endpoint and to an identical
+endpoint the wrapper passes through:
+- latency: added time per request (intercepted - passthrough)
+- correctness: every prompt the server received was substituted
+- prompt size: ~1 KB, ~16 KB and ~128 KB
+
+Run with:
+    pytest -m performance --run-performance
+
+Results are printed at the end of the run and saved to
+reports/benchmarks/xhr/.
+
+@group performance
+@priority P2
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.mock_platform import MockPlatformServer
+from helpers.synthetic import SyntheticCorpus
+from helpers.xhr_benchmark import GeminiXHRBenchmark
+
+
+SIZES = {'1KB': 1_000, '16KB': 16_000, '128KB': 128_000}
+
+DENSITY = 0.10
+
+
+@allure.feature('Performance')
+@allure.story('Gemini XHR Interception')
+@pytest.mark.performance
+class TestGeminiXHRInterception:
+    """
+    Intercepted vs pass-through Gemini prompt XHRs.
+    """
+
+    @pytest.fixture
+    def bench(self, driver, open_platform, mock_platform, profiles):
+        """Benchmark runner on the mock Gemini page."""
+        open_platform('https://gemini.google.com')
+        mock_platform.clear()
+        return GeminiXHRBenchmark(driver)
+
+    @allure.title('Gemini XHR interception cost')
+    @pytest.mark.parametrize('size_id', SIZES)
+    def test_gemini_xhr(self, bench, mock_platform, profiles, size_id):
+        """
+        Benchmark one prompt size and check the captured request bodies.
+
+        Args:
+            bench: Gemini XHR benchmark runner
+            mock_platform: Mock server capturing intercepted requests
+            profiles: Profiles loaded into the service worker
+            size_id: Prompt size case
+
+        Assertions:
+            - No request failed or was blocked
+            - Every intercepted request reached the server as a Gemini form
+            - No captured prompt contains real PII; the aliases are there instead
+        """
+        text = SyntheticCorpus(seed=1).message(SIZES[size_id], profiles, DENSITY)
+        aliases = {real: profile['alias'][key] for profile in profiles
+                   for key, real in profile['real'].items() if real in text}
+        assert aliases, "Prompt should contain real PII"
+
+        stats = bench.run(text)
+
+        name = f'xhr/{size_id}'
+        record = {'name': name, 'size': SIZES[size_id], 'profiles': len(profiles), **stats}
+        GeminiXHRBenchmark.save(record)
+
+        allure.attach(json.dumps(record, indent=2), name=name,
+                      attachment_type=allure.attachment_type.JSON)
+        print(f"[Benchmark] {name}: p50 {stats['passthrough']['p50_ms']} -> "
+              f"{stats['intercepted']['p50_ms']} ms, added p95 {stats['added']['p95_ms']} ms, "
+              f"p99 {stats['added']['p99_ms']} ms ({stats['body_bytes']} B bodies)")
+
+        for mode in GeminiXHRBenchmark.MODES:
+            assert stats[mode]['failed'] == 0, f"{name}: {stats[mode]['failed']} {mode} request(s) failed"
+
+        captured = mock_platform.requests_to(MockPlatformServer.GEMINI_GENERATE_PATH)
+        assert len(captured) == stats['sent'], \
+            f"{name}: server received {len(captured)}/{stats['sent']} intercepted requests"
+
+        prompts = [MockPlatformServer.gemini_prompt(request) for request in captured]
+        assert all(prompts), f"{name}: a captured body is not a Gemini f.req form"
+        leaked = [real for real in aliases if any(real in prompt for prompt in prompts)]
+        assert not leaked, f"{name}: real PII reached the server: {leaked[:5]}"
+        missing = [alias for alias in aliases.values() if not all(alias in prompt for prompt in prompts)]
+        assert not missing, f"{name}: aliases missing from captured prompts: {missing[:5]}"
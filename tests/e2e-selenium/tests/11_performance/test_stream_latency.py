@@ -0,0 +1,92 @@
+"""
+Performance Test: Streaming Response Latency
+
+Measures what the extension adds to streamed answers. On the mock ChatGPT
+page, responses stream from MockPlatformServer at a fixed token rate and
+are read through the extension's wrapped window.fetch and through
+window.__nativeFetch (extension bypassed):
+- format: SSE (decoded chunk by chunk) and chunked NDJSON (buffered by
+  inject.js until the response is complete)
+- token rate: 50 and 200 tokens/sec
+
+Tokens are alias values and response decoding is switched on where
+possible, so the wrapped path does real alias -> real work per chunk.
+
+Run with:
+    pytest -m performance --run-performance
+
+Results: time-to-first-token, inter-token gap and total time, native ->
+wrapped, printed at the end of the run and saved to reports/benchmarks/stream/.
+
+@group performance
+@priority P2
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.benchmark import InBrowserBenchmark
+from helpers.stream_benchmark import StreamLatencyBenchmark
+
+
+RATES = {'50tps': 20, '200tps': 5}  # interval between tokens in ms
+TOKENS = 100
+
+
+@allure.feature('Performance')
+@allure.story('Streaming Latency')
+@pytest.mark.performance
+class TestStreamLatency:
+    """
+    Time-to-first-token and inter-token latency with and without the extension.
+    """
+
+    @pytest.fixture
+    def decoding(self, driver, extension_id, profiles):
+        """Whether response decoding could be switched on."""
+        return InBrowserBenchmark(driver, extension_id).enable_response_decoding()
+
+    @pytest.fixture
+    def bench(self, driver, open_platform, decoding):
+        """Benchmark runner on the mock ChatGPT page."""
+        open_platform('https://chatgpt.com')
+        return StreamLatencyBenchmark(driver)
+
+    @allure.title('Streaming latency')
+    @pytest.mark.parametrize('rate_id', RATES)
+    @pytest.mark.parametrize('fmt', StreamLatencyBenchmark.FORMATS)
+    def test_stream_latency(self, bench, profiles, decoding, fmt, rate_id):
+        """
+        Benchmark one stream format at one token rate.
+
+        Args:
+            bench: Stream benchmark runner
+            profiles: Profiles loaded into the service worker
+            decoding: Whether response decoding is on
+            fmt: 'sse' or 'chunked'
+            rate_id: Token rate case
+
+        Assertions:
+            - Every token arrives through both paths
+            - SSE is not buffered: the first wrapped token arrives well
+              before a native stream would have finished
+        """
+        words = [profile['alias']['name'] for profile in profiles]
+        stats = bench.run(tokens=TOKENS, interval_ms=RATES[rate_id], fmt=fmt, words=words)
+
+        name = f'stream/{fmt}/{rate_id}'
+        record = {'name': name, 'format': fmt, 'tokens': TOKENS, 'interval_ms': RATES[rate_id],
+                  'decoding': decoding, **stats}
+        StreamLatencyBenchmark.save(record)
+
+        allure.attach(json.dumps(record, indent=2), name=name,
+                      attachment_type=allure.attachment_type.JSON)
+        added = stats['added']
+        print(f"[Benchmark] {name}: TTFT {stats['native']['ttft_p50_ms']} -> "
+              f"{stats['wrapped']['ttft_p50_ms']} ms, added gap p95 {added['gap_p95_ms']} ms, "
+              f"added total {added['total_p50_ms']} ms (decoding {'on' if decoding else 'off'})")
+
+        if fmt == 'sse':
+            assert stats['wrapped']['ttft_p50_ms'] < stats['native']['total_p50_ms'] / 2, \
+                f"{name}: wrapped SSE stream looks buffered (TTFT {stats['wrapped']['ttft_p50_ms']} ms)"
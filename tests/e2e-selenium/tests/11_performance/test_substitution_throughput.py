@@ -0,0 +1,114 @@
+"""
+Performance Test: AliasEngine Substitution Throughput
+
+Benchmarks the substitution path inside the loaded extension. An extension
+page sends SUBSTITUTE_REQUEST (encode, real -> alias) and
+SUBSTITUTE_RESPONSE (decode, alias -> real) to the service worker in a
+tight loop over generated corpora:
+- message size: 100 B, 10 KB, 1 MB
+- profiles loaded: 1, 100, 1000
+- PII density: 1% and 10% of words
+
+AliasEngine.substitute() compiles one regex per map key per call, so cost
+grows with profiles x message size; these numbers show how fast.
+
+Run with:
+    pytest -m performance --run-performance
+
+Results: ops/sec and p50/p95/p99 latency per case, printed at the end of
+the run and saved to reports/benchmarks/<worker>.jsonl.
+
+@group performance
+@priority P2
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.benchmark import InBrowserBenchmark
+from helpers.synthetic import SyntheticCorpus
+
+
+SIZES = {'100B': 100, '10KB': 10_000, '1MB': 1_000_000}
+PROFILE_COUNTS = [1, 100, 1000]
+DENSITIES = {'1pct': 0.01, '10pct': 0.10}
+
+
+@allure.feature('Performance')
+@allure.story('Substitution Throughput')
+@pytest.mark.performance
+class TestSubstitutionThroughput:
+    """
+    Bulk in-browser benchmarks of AliasEngine encode/decode.
+    """
+
+    @pytest.fixture
+    def bench(self, driver, extension_id):
+        """Benchmark runner on an extension page of the pooled browser."""
+        return InBrowserBenchmark(driver, extension_id)
+
+    def _run(self, bench, direction, size_id, profile_count, density_id):
+        """Load profiles, benchmark one corpus and record the result."""
+        corpus = SyntheticCorpus(seed=1)
+        profiles = corpus.profiles(profile_count)
+        side = 'real' if direction == 'encode' else 'alias'
+        text = corpus.message(SIZES[size_id], profiles, DENSITIES[density_id], side=side)
+
+        bench.load_profiles(profiles)
+
+        # 1 MB inputs: a handful of timed calls is enough (and all we can afford)
+        heavy = SIZES[size_id] >= 1_000_000
+        stats = bench.run(direction, text, min_iterations=2 if heavy else None,
+                          warmup=0 if heavy else None)
+
+        name = f'{direction}/{size_id}/{profile_count}p/{density_id}'
+        record = {'name': name, 'direction': direction, 'size': SIZES[size_id],
+                  'profiles': profile_count, 'density': DENSITIES[density_id], **stats}
+        InBrowserBenchmark.save(record)
+
+        allure.attach(json.dumps(record, indent=2), name=name,
+                      attachment_type=allure.attachment_type.JSON)
+        print(f"[Benchmark] {name}: {stats['ops_per_sec']} ops/s, "
+              f"p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms, p99 {stats['p99_ms']} ms")
+
+        assert stats['substitutions'] > 0, f"{name}: no substitutions happened"
+        return stats
+
+    @allure.title('Encode throughput')
+    @pytest.mark.parametrize('density_id', DENSITIES)
+    @pytest.mark.parametrize('profile_count', PROFILE_COUNTS)
+    @pytest.mark.parametrize('size_id', SIZES)
+    def test_encode_throughput(self, bench, size_id, profile_count, density_id):
+        """
+        Benchmark real -> alias substitution of plain-text request bodies.
+
+        Args:
+            bench: In-browser benchmark runner
+            size_id: Message size case
+            profile_count: Number of loaded profiles
+            density_id: PII density case
+        """
+        self._run(bench, 'encode', size_id, profile_count, density_id)
+
+    @allure.title('Decode throughput')
+    @pytest.mark.parametrize('density_id', DENSITIES)
+    @pytest.mark.parametrize('profile_count', PROFILE_COUNTS)
+    @pytest.mark.parametrize('size_id', SIZES)
+    def test_decode_throughput(self, bench, size_id, profile_count, density_id):
+        """
+        Benchmark alias -> real substitution of response text.
+
+        Decoding only runs with settings.decodeResponses enabled, so the
+        stored config is switched on first (includes a config load per call).
+
+        Args:
+            bench: In-browser benchmark runner
+            size_id: Message size case
+            profile_count: Number of loaded profiles
+            density_id: PII density case
+        """
+        if not bench.enable_response_decoding():
+            pytest.skip("Response decoding could not be enabled (sign-in required)")
+
+        self._run(bench, 'decode', size_id, profile_count, density_id)
@@ -0,0 +1,95 @@
+"""
+Performance Test: Copilot WebSocket Interception
+
+Measures what inject.js's WebSocket wrapper costs on Copilot. On the mock
+copilot.microsoft.com page, Copilot-shaped chat messages containing real
+PII go through the intercepted chat socket (/c/api/chat) and through an
+identical echo socket the wrapper passes through (/c/api/echo):
+- throughput: pipelined batches of 500 messages
+- latency: 200 messages one at a time
+- memory: page JS heap after each chat batch
+- message size: ~200 B and ~4 KB
+
+Gates: no message may reach the server unsubstituted, and the heap may not
+grow steadily with the number of messages sent.
+
+Run with:
+    pytest -m performance --run-performance
+
+Results are printed at the end of the run and saved to
+reports/benchmarks/websocket/.
+
+@group performance
+@priority P2
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.synthetic import SyntheticCorpus
+from helpers.websocket_benchmark import WebSocketBenchmark
+
+
+SIZES = {'200B': 200, '4KB': 4_000}
+
+DENSITY = 0.10
+
+# Regression gate: steady heap growth per 1000 chat messages
+MAX_HEAP_GROWTH_PER_1K = 512 * 1024
+
+
+@allure.feature('Performance')
+@allure.story('Copilot WebSocket Interception')
+@pytest.mark.performance
+class TestWebSocketInterception:
+    """
+    Intercepted vs pass-through WebSocket messages on Copilot.
+    """
+
+    @pytest.fixture
+    def bench(self, driver, open_platform, profiles):
+        """Benchmark with both sockets open on the mock Copilot page."""
+        open_platform('https://copilot.microsoft.com')
+
+        bench = WebSocketBenchmark(driver)
+        bench.open()
+        yield bench
+        bench.close()
+
+    @allure.title('WebSocket interception cost')
+    @pytest.mark.parametrize('size_id', SIZES)
+    def test_websocket_interception(self, bench, profiles, size_id):
+        """
+        Benchmark one message size through both sockets.
+
+        Args:
+            bench: WebSocket benchmark with open sockets
+            profiles: Profiles loaded into the service worker
+            size_id: Message size case
+
+        Assertions:
+            - Every chat message was substituted before it was sent
+            - Heap growth stays under MAX_HEAP_GROWTH_PER_1K
+        """
+        text = SyntheticCorpus(seed=1).message(SIZES[size_id], profiles, DENSITY)
+        real_values = sorted({value for profile in profiles for value in profile['real'].values()
+                              if value in text})
+        assert real_values, "Message should contain real PII"
+
+        stats = bench.run(text, real_values)
+
+        name = f'websocket/{size_id}'
+        record = {'name': name, 'size': SIZES[size_id], 'profiles': len(profiles), **stats}
+        WebSocketBenchmark.save(record)
+
+        allure.attach(json.dumps(record, indent=2), name=name,
+                      attachment_type=allure.attachment_type.JSON)
+        print(f"[Benchmark] {name}: {stats['throughput']['passthrough']} -> "
+              f"{stats['throughput']['chat']} msg/s, added p50 {stats['added']['p50_ms']} ms, "
+              f"p95 {stats['added']['p95_ms']} ms, heap {stats['heap']['growth_per_1k_bytes']} B/1k msgs")
+
+        assert stats['leaked'] == 0, \
+            f"{name}: {stats['leaked']} message(s) reached the server with real PII"
+        assert stats['heap']['growth_per_1k_bytes'] < MAX_HEAP_GROWTH_PER_1K, \
+            f"{name}: page heap grows {stats['heap']['growth_per_1k_bytes'] / 1024:.0f} KB per 1000 messages"
@@ -0,0 +1,77 @@
+"""
+Soak Test: Long-Session Memory Growth
+
+Chat tabs stay open for days. This test sends prompts with real PII through
+the mock ChatGPT page for --soak-duration seconds and samples the retained
+JS heap (after a forced GC) of the page (content script + inject.js) and
+of the extension service worker every --soak-interval seconds.
+
+Fails when the heap of either target grows by more than --soak-budget-kb
+per 1000 prompts (least-squares slope over all samples); the per-
+constructor heap snapshot diff is attached to the report.
+
+Run with:
+    pytest -m soak --run-soak --soak-duration=3600
+
+@group soak
+@priority P2
+"""
+
+import json
+import pytest
+import allure
+
+from helpers.heap_soak import HeapSoak
+from helpers.synthetic import SyntheticCorpus
+
+
+PROMPT_COUNT = 20
+PROMPT_SIZE = 500
+DENSITY = 0.10
+
+
+@allure.feature('Soak')
+@allure.story('Memory Growth')
+@pytest.mark.soak
+class TestMemorySoak:
+    """
+    Retained heap growth of the page and the service worker over many prompts.
+    """
+
+    @allure.title('Heap growth per 1000 prompts')
+    def test_heap_growth(self, request, heap_soak, profiles):
+        """
+        Soak the chat page and fit heap growth per target.
+
+        Args:
+            request: pytest request (for the budget option)
+            heap_soak: Soak runner on the mock chat page
+            profiles: Profiles loaded into the service worker
+
+        Assertions:
+            - Retained growth per 1000 prompts stays within --soak-budget-kb
+              for the page and for the service worker
+        """
+        budget = request.config.getoption('soak_budget_kb') * 1024
+        prompts = [SyntheticCorpus(seed=index).message(PROMPT_SIZE, profiles, DENSITY)
+                   for index in range(PROMPT_COUNT)]
+
+        result = heap_soak.run(prompts)
+
+        growth = result['growth_per_1k_bytes']
+        allure.attach(json.dumps({key: result[key] for key in ('prompts', 'duration_s', 'samples',
+                                                                'growth_per_1k_bytes')}, indent=2),
+                      name='heap samples', attachment_type=allure.attachment_type.JSON)
+        print(f"[Soak] {result['prompts']} prompts in {result['duration_s']} s: " +
+              ', '.join(f"{target} {growth[target] / 1024:.1f} KB/1k prompts" for target in HeapSoak.TARGETS))
+
+        over = [target for target in HeapSoak.TARGETS if growth[target] > budget]
+        for target in over:
+            allure.attach(json.dumps(result['diff'][target], indent=2), name=f'{target} heap diff',
+                          attachment_type=allure.attachment_type.JSON)
+
+        assert not over, \
+            f"Retained heap grows past {budget / 1024:.0f} KB per 1000 prompts: " + \
+            ', '.join(f"{target} {growth[target] / 1024:.1f} KB "
+                      f"(top: {result['diff'][target][0]['constructor'] if result['diff'][target] else '-'})"
+                      for target in over)